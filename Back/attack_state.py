@@ -0,0 +1,140 @@
+"""
+Incremental attack map around a fixed King.
+
+AttackState remembers, for each of the 8 rays leaving the King, which pieces
+sit on it and which one is nearest, plus how many Pawns occupy the two Pawn
+attack squares. Adding or removing a piece touches at most one ray, and
+"is the King in check" is a counter test.
+"""
+
+from functools import lru_cache
+
+from attack_tables import BOARD_SIZE, king_rays
+
+
+_PAWN = frozenset('P')
+
+
+@lru_cache(maxsize=None)
+def _king_geometry(king_pos, size):
+    # Rays and Pawn squares of a King, plus square -> (ray, step) for every
+    # square on a ray. Pawn squares are always the first step of a diagonal.
+    rays, pawn_squares = king_rays(king_pos, size)
+    on_ray = {}
+    for ray, (_, squares) in enumerate(rays):
+        for step, square in enumerate(squares):
+            on_ray[square] = (ray, step)
+    return rays, frozenset(pawn_squares), on_ray
+
+
+class AttackState:
+    """
+    Tracks which rays reach the King and which squares block them.
+
+    Args:
+        king_pos: (y, x) position of the King
+        board: Optional 2D list whose pieces are added up front
+        size: Board size (defaults to the board's size, or 8)
+    """
+    __slots__ = ('king_pos', 'size', '_rays', '_pawn_squares', '_on_ray',
+                 '_cells', '_nearest', '_checking_rays', '_pawn_checks')
+
+    def __init__(self, king_pos, board=None, size=None):
+        if size is None:
+            size = len(board) if board is not None else BOARD_SIZE
+        self.king_pos = tuple(king_pos)
+        self.size = size
+        self._rays, self._pawn_squares, self._on_ray = _king_geometry(self.king_pos, size)
+        self._cells = [['.'] * len(squares) for _, squares in self._rays]
+        self._nearest = [None] * len(self._rays)  # step of the nearest piece per ray
+        self._checking_rays = 0
+        self._pawn_checks = 0
+
+        if board is not None:
+            for y, row in enumerate(board):
+                for x, piece in enumerate(row):
+                    if piece != '.':
+                        self.add(piece, y, x)
+
+    @property
+    def in_check(self):
+        """True if any piece attacks the King. O(1)."""
+        return self._checking_rays > 0 or self._pawn_checks > 0
+
+    def _ray_attacks(self, ray):
+        nearest = self._nearest[ray]
+        return nearest is not None and self._cells[ray][nearest] in self._rays[ray][0]
+
+    def add(self, piece, y, x):
+        """Record piece on (y, x). Squares off the King's rays cost nothing."""
+        hit = self._on_ray.get((y, x))
+        if hit is None:
+            return
+        ray, step = hit
+        if piece == 'P' and (y, x) in self._pawn_squares:
+            self._pawn_checks += 1
+
+        was_attacking = self._ray_attacks(ray)
+        self._cells[ray][step] = piece
+        nearest = self._nearest[ray]
+        if nearest is None or step < nearest:
+            self._nearest[ray] = step
+        self._checking_rays += self._ray_attacks(ray) - was_attacking
+
+    def remove(self, y, x):
+        """Forget the piece on (y, x), rescanning its ray if it was the nearest."""
+        hit = self._on_ray.get((y, x))
+        if hit is None:
+            return
+        ray, step = hit
+        cells = self._cells[ray]
+        piece = cells[step]
+        if piece == '.':
+            return
+        if piece == 'P' and (y, x) in self._pawn_squares:
+            self._pawn_checks -= 1
+
+        was_attacking = self._ray_attacks(ray)
+        cells[step] = '.'
+        if self._nearest[ray] == step:
+            self._nearest[ray] = None
+            for next_step in range(step + 1, len(cells)):
+                if cells[next_step] != '.':
+                    self._nearest[ray] = next_step
+                    break
+        self._checking_rays += self._ray_attacks(ray) - was_attacking
+
+    def checking_squares(self):
+        """
+        Empty squares from which a piece would give check, in row-major order.
+
+        Pieces never move once placed, so a placement anywhere else cannot
+        contribute to a check, now or after later placements.
+
+        Returns:
+            List of ((y, x), piece types) pairs
+        """
+        found = {}
+        for ray, (attackers, squares) in enumerate(self._rays):
+            nearest = self._nearest[ray]
+            for square in squares[:nearest]:
+                found[square] = attackers
+        for square in self._pawn_squares:
+            ray, step = self._on_ray[square]
+            if self._cells[ray][step] == '.':
+                found[square] = found[square] | _PAWN
+        return sorted(found.items())
+
+    def copy(self):
+        """Independent copy sharing the precomputed King geometry."""
+        clone = AttackState.__new__(AttackState)
+        clone.king_pos = self.king_pos
+        clone.size = self.size
+        clone._rays = self._rays
+        clone._pawn_squares = self._pawn_squares
+        clone._on_ray = self._on_ray
+        clone._cells = [cells[:] for cells in self._cells]
+        clone._nearest = self._nearest[:]
+        clone._checking_rays = self._checking_rays
+        clone._pawn_checks = self._pawn_checks
+        return clone
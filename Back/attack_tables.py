@@ -0,0 +1,159 @@
+"""
+Precomputed attack tables for the 8x8 board.
+
+For every (piece type, from-square, king-square) triple the table stores the
+squares lying strictly between the piece and the King, or None when that piece
+can never attack the King from there. The tables are built once at import, so
+an attack query becomes a lookup plus a short scan for blockers.
+"""
+
+BOARD_SIZE = 8
+PIECE_TYPES = ('Q', 'R', 'B', 'P')
+
+
+# ============================================================================
+# Table Construction
+# ============================================================================
+
+def compute_between(piece, py, px, ky, kx):
+    """
+    Compute the squares strictly between a piece and the King.
+
+    Args:
+        piece: Piece type ('P', 'R', 'B', 'Q')
+        py, px: Position of the piece
+        ky, kx: Position of the King
+
+    Returns:
+        Tuple of (y, x) squares that must be empty for the attack to land,
+        or None if the piece cannot attack the King from this square
+    """
+    if (py, px) == (ky, kx):
+        return None
+
+    # Pawn: diagonal attack one square forward (moving down the board)
+    if piece == 'P':
+        return () if (py == ky + 1 and abs(px - kx) == 1) else None
+
+    same_line = (py == ky or px == kx)
+    same_diagonal = (abs(py - ky) == abs(px - kx))
+
+    if piece == 'R' and not same_line:
+        return None
+    if piece == 'B' and not same_diagonal:
+        return None
+    if piece == 'Q' and not (same_line or same_diagonal):
+        return None
+    if piece not in PIECE_TYPES:
+        return None
+
+    dy = 0 if py == ky else (1 if ky > py else -1)
+    dx = 0 if px == kx else (1 if kx > px else -1)
+
+    squares = []
+    y, x = py + dy, px + dx
+    while (y, x) != (ky, kx):
+        squares.append((y, x))
+        y, x = y + dy, x + dx
+    return tuple(squares)
+
+
+def _build_between_table():
+    # BETWEEN[piece][py][px][ky][kx] -> tuple of squares or None.
+    # Nested lists index faster than a flat table with square arithmetic
+    # or a dict keyed by position tuples, which matters in the solver loop.
+    return {
+        piece: [[[[compute_between(piece, py, px, ky, kx) for kx in range(BOARD_SIZE)]
+                  for ky in range(BOARD_SIZE)]
+                 for px in range(BOARD_SIZE)]
+                for py in range(BOARD_SIZE)]
+        for piece in PIECE_TYPES
+    }
+
+
+BETWEEN = _build_between_table()
+
+
+# ============================================================================
+# Lookups
+# ============================================================================
+
+def squares_between(piece, piece_pos, king_pos):
+    """
+    Look up the squares between a piece and the King.
+
+    Positions outside the 8x8 table (e.g. larger boards) are computed on the fly.
+
+    Args:
+        piece: Piece type ('P', 'R', 'B', 'Q')
+        piece_pos: (y, x) position of the piece
+        king_pos: (y, x) position of the King
+
+    Returns:
+        Tuple of (y, x) squares between the two positions, or None if the
+        piece cannot attack the King from piece_pos
+    """
+    py, px = piece_pos
+    ky, kx = king_pos
+    try:
+        return BETWEEN[piece][py][px][ky][kx]
+    except (KeyError, IndexError):
+        return compute_between(piece, py, px, ky, kx)
+
+
+# ============================================================================
+# King Rays
+# ============================================================================
+
+# Orthogonal directions first (Rook/Queen lines), then diagonals (Bishop/Queen)
+RAY_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1),
+                  (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# Piece types that attack along an orthogonal / diagonal ray
+ORTHOGONAL_ATTACKERS = frozenset('RQ')
+DIAGONAL_ATTACKERS = frozenset('BQ')
+
+
+def compute_rays(ky, kx, size=BOARD_SIZE):
+    """
+    Compute the 8 rays leading outward from a King square.
+
+    Args:
+        ky, kx: Position of the King
+        size: Board size
+
+    Returns:
+        Tuple of (attackers, squares) pairs, one per direction, where squares
+        are ordered from the King outward and attackers is the set of piece
+        types that attack along that ray. Empty rays are left out.
+    """
+    rays = []
+    for i, (dy, dx) in enumerate(RAY_DIRECTIONS):
+        squares = []
+        y, x = ky + dy, kx + dx
+        while 0 <= y < size and 0 <= x < size:
+            squares.append((y, x))
+            y, x = y + dy, x + dx
+        if squares:
+            attackers = ORTHOGONAL_ATTACKERS if i < 4 else DIAGONAL_ATTACKERS
+            rays.append((attackers, tuple(squares)))
+    return tuple(rays)
+
+
+def compute_pawn_squares(ky, kx, size=BOARD_SIZE):
+    """Return the squares from which a Pawn attacks a King on (ky, kx)."""
+    return tuple((ky + 1, kx + dx) for dx in (-1, 1)
+                 if ky + 1 < size and 0 <= kx + dx < size)
+
+
+# RAYS[ky][kx] / PAWN_SQUARES[ky][kx] for every King square on the 8x8 board
+RAYS = [[compute_rays(ky, kx) for kx in range(BOARD_SIZE)] for ky in range(BOARD_SIZE)]
+PAWN_SQUARES = [[compute_pawn_squares(ky, kx) for kx in range(BOARD_SIZE)] for ky in range(BOARD_SIZE)]
+
+
+def king_rays(king_pos, size=BOARD_SIZE):
+    """Look up (or, off the 8x8 table, compute) the rays and pawn squares of a King."""
+    ky, kx = king_pos
+    if size == BOARD_SIZE:
+        return RAYS[ky][kx], PAWN_SQUARES[ky][kx]
+    return compute_rays(ky, kx, size), compute_pawn_squares(ky, kx, size)
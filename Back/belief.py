@@ -0,0 +1,108 @@
+"""
+Belief state for the hidden-King game.
+
+The player never sees the King, so instead of one king_pos this module keeps
+every square the King could still be on as a 64-bit mask. Pieces never move,
+so a placement that does not win rules out its own square and every square
+the new piece attacks: no earlier piece checks a remaining candidate, and a
+new piece can only block lines, never open them. The best next placement is
+the one whose square plus attack set covers the most candidates.
+"""
+
+from attack_tables import BOARD_SIZE, PIECE_TYPES
+from bitboard import FULL_BOARD, attacks_from, board_to_bitboard, iter_squares, square_bit
+
+
+# ============================================================================
+# King Belief
+# ============================================================================
+
+class KingBelief:
+    """
+    Set of squares the hidden King can still be on.
+
+    Attributes:
+        candidates: mask of the possible King squares
+        occupied: mask of the squares holding a piece
+    """
+    __slots__ = ('candidates', 'occupied')
+
+    def __init__(self, board=None):
+        """
+        Args:
+            board: optional 8x8 board with the pieces placed so far (the game
+                is still running, so none of them gives check)
+        """
+        self.candidates = FULL_BOARD
+        self.occupied = 0
+        if board is not None:
+            bitboard = board_to_bitboard(board)
+            self.occupied = bitboard.occupied
+            attacked = 0
+            for piece, mask in bitboard.masks.items():
+                for y, x in iter_squares(mask):
+                    attacked |= attacks_from(piece, y, x, self.occupied)
+            self.candidates &= ~(self.occupied | attacked)
+
+    def __len__(self):
+        return self.candidates.bit_count()
+
+    def squares(self):
+        """Return the possible King squares in row-major order."""
+        return list(iter_squares(self.candidates))
+
+    def catch_mask(self, piece, y, x):
+        """
+        Candidate squares on which placing piece at (y, x) would win.
+
+        Args:
+            piece: 'Q', 'R', 'B' or 'P'
+            y, x: an empty square
+
+        Returns:
+            Mask of the candidates the placement catches: its own square and
+            every candidate the piece attacks
+        """
+        bit = square_bit(y, x)
+        if self.occupied & bit:
+            raise ValueError(f"Square ({y}, {x}) is already taken")
+        return (bit | attacks_from(piece, y, x, self.occupied)) & self.candidates
+
+    def observe(self, piece, y, x):
+        """Record a placement that did not win."""
+        self.candidates &= ~self.catch_mask(piece, y, x)
+        self.occupied |= square_bit(y, x)
+
+    def recommend(self, remaining_pieces):
+        """
+        Pick the placement that catches the most candidate squares.
+
+        With the King equally likely on every candidate, this is also the
+        placement most likely to win right now.
+
+        Args:
+            remaining_pieces: dict of piece -> count still available
+
+        Returns:
+            ((piece, row, col), caught) with caught the number of candidates
+            covered, or None if no piece is left or the board is full
+        """
+        # Weakest piece first: on a tie, the stronger one is kept for later
+        pieces = [piece for piece in reversed(PIECE_TYPES) if remaining_pieces.get(piece, 0) > 0]
+        candidates = self.candidates
+        occupied = self.occupied
+        best = None
+        best_caught = -1
+        for sq in range(BOARD_SIZE * BOARD_SIZE):
+            bit = 1 << sq
+            if occupied & bit:
+                continue
+            y, x = divmod(sq, BOARD_SIZE)
+            for piece in pieces:
+                caught = ((bit | attacks_from(piece, y, x, occupied)) & candidates).bit_count()
+                if caught > best_caught:
+                    best = (piece, y, x)
+                    best_caught = caught
+        if best is None:
+            return None
+        return best, best_caught
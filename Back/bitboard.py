@@ -0,0 +1,281 @@
+"""
+64-bit integer bitboard backend for the 8x8 board.
+
+Square (y, x) maps to bit y * 8 + x. A Bitboard keeps one occupancy mask per
+piece type; together with the precomputed ray and pawn attack masks below,
+"is the King attacked" becomes a handful of AND and bit-scan operations.
+"""
+
+from attack_tables import BOARD_SIZE, PIECE_TYPES
+
+
+# ============================================================================
+# Precomputed Masks
+# ============================================================================
+
+# Orthogonal rays first (Rook/Queen), then diagonal rays (Bishop/Queen)
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1),
+              (-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+# Directions that move toward higher square indices; the nearest piece on
+# such a ray is its lowest set bit, otherwise its highest set bit
+POSITIVE = tuple(dy > 0 or (dy == 0 and dx > 0) for dy, dx in DIRECTIONS)
+
+
+def square_bit(y, x):
+    """Return the single-bit mask for square (y, x)."""
+    return 1 << (y * BOARD_SIZE + x)
+
+
+def _build_ray_masks():
+    # RAY_MASKS[sq][d] -> every square reached from sq in direction d
+    masks = []
+    for y in range(BOARD_SIZE):
+        for x in range(BOARD_SIZE):
+            rays = []
+            for dy, dx in DIRECTIONS:
+                mask = 0
+                ny, nx = y + dy, x + dx
+                while 0 <= ny < BOARD_SIZE and 0 <= nx < BOARD_SIZE:
+                    mask |= square_bit(ny, nx)
+                    ny, nx = ny + dy, nx + dx
+                rays.append(mask)
+            masks.append(tuple(rays))
+    return masks
+
+
+def _build_pawn_attackers():
+    # PAWN_ATTACKERS[sq] -> squares from which a Pawn attacks a King on sq
+    # (Pawns attack diagonally one square forward, moving down the board)
+    masks = []
+    for y in range(BOARD_SIZE):
+        for x in range(BOARD_SIZE):
+            mask = 0
+            for dx in (-1, 1):
+                if y + 1 < BOARD_SIZE and 0 <= x + dx < BOARD_SIZE:
+                    mask |= square_bit(y + 1, x + dx)
+            masks.append(mask)
+    return masks
+
+
+def _build_pawn_targets():
+    # PAWN_TARGETS[sq] -> squares a Pawn on sq attacks (one row up, diagonally)
+    masks = []
+    for y in range(BOARD_SIZE):
+        for x in range(BOARD_SIZE):
+            mask = 0
+            for dx in (-1, 1):
+                if y - 1 >= 0 and 0 <= x + dx < BOARD_SIZE:
+                    mask |= square_bit(y - 1, x + dx)
+            masks.append(mask)
+    return masks
+
+
+FULL_BOARD = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1
+RAY_MASKS = _build_ray_masks()
+ROOK_MASKS = [rays[0] | rays[1] | rays[2] | rays[3] for rays in RAY_MASKS]
+BISHOP_MASKS = [rays[4] | rays[5] | rays[6] | rays[7] for rays in RAY_MASKS]
+PAWN_ATTACKERS = _build_pawn_attackers()
+PAWN_TARGETS = _build_pawn_targets()
+
+# Ray directions each sliding piece moves along
+PIECE_DIRECTIONS = {'Q': range(8), 'R': range(4), 'B': range(4, 8)}
+
+
+# ============================================================================
+# Bitboard
+# ============================================================================
+
+class Bitboard:
+    """
+    Immutable set of per-piece occupancy masks.
+
+    Placing a piece returns a new Bitboard, so a search can keep parents
+    around without copying any board cells.
+    """
+    __slots__ = ('masks', 'occupied')
+
+    def __init__(self, masks=None):
+        self.masks = dict(masks) if masks else {piece: 0 for piece in PIECE_TYPES}
+        occupied = 0
+        for mask in self.masks.values():
+            occupied |= mask
+        self.occupied = occupied
+
+    def place(self, piece, y, x):
+        """Return a new Bitboard with piece added on (y, x)."""
+        masks = dict(self.masks)
+        masks[piece] |= square_bit(y, x)
+        return Bitboard(masks)
+
+    def piece_at(self, y, x):
+        """Return the piece on (y, x), or '.' if the square is empty."""
+        bit = square_bit(y, x)
+        if not self.occupied & bit:
+            return '.'
+        for piece, mask in self.masks.items():
+            if mask & bit:
+                return piece
+        return '.'
+
+    def key(self):
+        """Hashable identity of the position."""
+        return tuple(self.masks[piece] for piece in PIECE_TYPES)
+
+    def __eq__(self, other):
+        return isinstance(other, Bitboard) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+
+# ============================================================================
+# Converters
+# ============================================================================
+
+def board_to_bitboard(board):
+    """
+    Convert a 2D list board into a Bitboard.
+
+    Args:
+        board: 8x8 list of lists with '.' for empty squares
+
+    Returns:
+        Bitboard with one mask per piece type; unknown symbols (e.g. 'K') are skipped
+    """
+    if len(board) != BOARD_SIZE:
+        raise ValueError(f"Bitboards only support {BOARD_SIZE}x{BOARD_SIZE} boards")
+    masks = {piece: 0 for piece in PIECE_TYPES}
+    for y, row in enumerate(board):
+        for x, piece in enumerate(row):
+            if piece in masks:
+                masks[piece] |= square_bit(y, x)
+    return Bitboard(masks)
+
+
+def bitboard_to_board(bitboard):
+    """Convert a Bitboard back into an 8x8 list of lists."""
+    board = [['.' for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+    for piece, mask in bitboard.masks.items():
+        for y, x in iter_squares(mask):
+            board[y][x] = piece
+    return board
+
+
+def iter_squares(mask):
+    """Yield the (y, x) squares of every set bit, in row-major order."""
+    while mask:
+        low = mask & -mask
+        yield divmod(low.bit_length() - 1, BOARD_SIZE)
+        mask ^= low
+
+
+# ============================================================================
+# Check Detection
+# ============================================================================
+
+def checking_masks(bitboard, king_pos):
+    """
+    Empty squares from which a piece would attack the King.
+
+    Args:
+        bitboard: Bitboard with the pieces already placed
+        king_pos: (y, x) position of the King
+
+    Returns:
+        (orthogonal, diagonal, pawn) masks: squares where a Rook or Queen,
+        a Bishop or Queen, and a Pawn would give check
+    """
+    ky, kx = king_pos
+    sq = ky * BOARD_SIZE + kx
+    occupied = bitboard.occupied
+    rays = RAY_MASKS[sq]
+    lines = [0, 0]
+    for direction in range(8):
+        ray = rays[direction]
+        blockers = ray & occupied
+        if blockers:
+            # Keep only the squares between the King and the nearest piece
+            if POSITIVE[direction]:
+                ray &= (blockers & -blockers) - 1
+            else:
+                ray &= -(1 << blockers.bit_length())
+        lines[direction >= 4] |= ray
+    return lines[0], lines[1], PAWN_ATTACKERS[sq] & ~occupied
+
+
+def is_king_attacked(bitboard, king_pos):
+    """
+    Bitwise check detection.
+
+    Args:
+        bitboard: Bitboard with the attacking pieces (the King itself is not stored)
+        king_pos: (y, x) position of the King
+
+    Returns:
+        True if any piece attacks the King with a clear line
+    """
+    ky, kx = king_pos
+    sq = ky * BOARD_SIZE + kx
+    masks = bitboard.masks
+
+    if PAWN_ATTACKERS[sq] & masks['P']:
+        return True
+
+    queens = masks['Q']
+    rook_like = masks['R'] | queens
+    bishop_like = masks['B'] | queens
+    if not (ROOK_MASKS[sq] & rook_like or BISHOP_MASKS[sq] & bishop_like):
+        return False
+
+    occupied = bitboard.occupied
+    rays = RAY_MASKS[sq]
+    for direction in range(8):
+        blockers = rays[direction] & occupied
+        if not blockers:
+            continue
+        # The nearest piece on the ray is the only one that can attack
+        if POSITIVE[direction]:
+            nearest = blockers & -blockers
+        else:
+            nearest = 1 << (blockers.bit_length() - 1)
+        attackers = rook_like if direction < 4 else bishop_like
+        if nearest & attackers:
+            return True
+    return False
+
+
+# ============================================================================
+# Attack Sets
+# ============================================================================
+
+def attacks_from(piece, y, x, occupied):
+    """
+    Squares a piece standing on (y, x) attacks.
+
+    Args:
+        piece: 'Q', 'R', 'B' or 'P'
+        y, x: square of the piece
+        occupied: mask of the other pieces; a sliding piece stops at the first one
+
+    Returns:
+        Mask of attacked squares, including the squares of the blocking pieces
+    """
+    sq = y * BOARD_SIZE + x
+    if piece == 'P':
+        return PAWN_TARGETS[sq]
+    if piece not in PIECE_DIRECTIONS:
+        raise ValueError(f"Unknown piece: {piece}")
+    rays = RAY_MASKS[sq]
+    attacked = 0
+    for direction in PIECE_DIRECTIONS[piece]:
+        ray = rays[direction]
+        blockers = ray & occupied
+        if blockers:
+            # Keep the squares up to and including the nearest piece
+            if POSITIVE[direction]:
+                ray &= ((blockers & -blockers) << 1) - 1
+            else:
+                ray &= -(1 << (blockers.bit_length() - 1))
+        attacked |= ray
+    return attacked
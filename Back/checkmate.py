@@ -2,6 +2,14 @@ from collections import deque
 import heapq
 import math 
 
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for checkmate_batch
+    np = None
+
+from attack_tables import BETWEEN, BOARD_SIZE, RAY_DIRECTIONS, king_rays, squares_between
+from bitboard import Bitboard, bitboard_to_board, is_king_attacked
+
 
 # ============================================================================
 # Shared Helper Functions
@@ -20,24 +28,15 @@ def has_clear_path(board, from_y, from_x, to_y, to_x):
     Returns:
         True if all cells between start and end are empty, False otherwise
     """
-    # Calculate step direction for each axis (-1, 0, or 1)
-    # This determines how to step from the piece toward the king
-    # Examples:
-    #   Rook (horizontal): dy=0, dx=±1 (move left/right only)
-    #   Rook (vertical):   dy=±1, dx=0 (move up/down only)
-    #   Bishop (diagonal): dy=±1, dx=±1 (move diagonally)
-    #   Queen: any combination of the above
-    dy = 0 if from_y == to_y else (1 if to_y > from_y else -1)
-    dx = 0 if from_x == to_x else (1 if to_x > from_x else -1)
-    
-    # Start from next cell after the piece
-    y, x = from_y + dy, from_x + dx
-    
-    # Walk along the path until we reach the king
-    while (y, x) != (to_y, to_x):
+    # The Queen table covers every horizontal, vertical and diagonal line,
+    # so its in-between squares are exactly the path a slider has to cross
+    between = squares_between('Q', (from_y, from_x), (to_y, to_x))
+    if between is None:
+        return (from_y, from_x) == (to_y, to_x)
+    
+    for y, x in between:
         if board[y][x] != '.':
             return False  # Path is blocked by another piece
-        y, x = y + dy, x + dx
     
     return True  # Path is clear
 
@@ -47,6 +46,9 @@ def is_piece_attacking_king(piece, piece_pos, king_pos, board):
     Unified attack checker with line-of-sight blocking.
     This is the single source of truth for piece attack logic.
     
+    Alignment and the squares to scan come from the precomputed tables in
+    attack_tables, so only the blocker scan happens per call.
+    
     Args:
         piece: Piece type ('P', 'R', 'B', 'Q')
         piece_pos: (y, x) position of the piece
@@ -58,99 +60,112 @@ def is_piece_attacking_king(piece, piece_pos, king_pos, board):
     """
     py, px = piece_pos
     ky, kx = king_pos
-    
-    # Pawn: diagonal attack one square forward (moving down the board)
-    if piece == 'P':
-        return (py == ky + 1 and abs(px - kx) == 1)
-    
-    # Check alignment first
-    same_row = (py == ky)
-    same_col = (px == kx)
-    same_diagonal = (abs(py - ky) == abs(px - kx))
-    
-    # Rook: horizontal or vertical with clear path
-    if piece == 'R':
-        if same_row or same_col:
-            return has_clear_path(board, py, px, ky, kx)
+    try:
+        between = BETWEEN[piece][py][px][ky][kx]
+    except (KeyError, IndexError):
+        between = squares_between(piece, piece_pos, king_pos)
+    if between is None:
         return False
     
-    # Bishop: diagonal with clear path
-    if piece == 'B':
-        if same_diagonal:
-            return has_clear_path(board, py, px, ky, kx)
-        return False
-    
-    # Queen: horizontal, vertical, or diagonal with clear path
-    if piece == 'Q':
-        if same_row or same_col or same_diagonal:
-            return has_clear_path(board, py, px, ky, kx)
-        return False
+    for y, x in between:
+        if board[y][x] != '.':
+            return False
     
-    return False
+    return True
 
 
-# ============================================================================
-# BFS-based Check Detection
-# ============================================================================
-
-def checkmate(board_str):
-    # Parse board
+def parse_board(board_str):
+    """
+    Parse a board string (spaced or compact rows) into a 2D list.
+    
+    Args:
+        board_str: One row per line, e.g. "K . . R" or "K..R"
+    
+    Returns:
+        2D list of single-character cells
+    """
     board = []
     for row in board_str.strip().split("\n"):
         if " " in row:
             board.append(row.strip().split())  # spaced format
         else:
             board.append(list(row.strip()))
-    size = len(board)
+    return board
 
-    # Find King
-    king_pos = None
-    for y in range(size):
-        for x in range(size):
-            if board[y][x] == "K":
-                king_pos = (y, x)
-                break
-        if king_pos:
-            break
+
+def find_king(board):
+    """Return the (y, x) position of 'K' on the board, or None if absent."""
+    for y, row in enumerate(board):
+        for x, piece in enumerate(row):
+            if piece == "K":
+                return (y, x)
+    return None
+
+
+# ============================================================================
+# BFS-based Check Detection
+# ============================================================================
+
+def checkmate(board_str):
+    board = parse_board(board_str)
+    king_pos = find_king(board)
 
     if not king_pos:
         print("Fail!!! No King on the board!!!")
         return False
 
+    return checkmate_board(board, king_pos)
+
+
+def checkmate_board(board, king_pos):
+    """
+    Parse-free BFS check detection.
+    
+    The King does not need to be on the board: its square is given explicitly
+    and whatever occupies it is ignored, so solver boards can be passed as is.
+    
+    Args:
+        board: 2D list, tuple of rows, or Bitboard
+        king_pos: (y, x) position of the King
+    
+    Returns:
+        True if the King is in check
+    """
+    if isinstance(board, Bitboard):
+        return is_king_attacked(board, king_pos)
+
+    size = len(board)
     yk, xk = king_pos
 
     # BFS layer by layer
-    def is_king_in_check():
-        visited = set()
-        queue = deque([(yk, xk, 0)])  # (y, x, distance)
+    visited = set()
+    queue = deque([(yk, xk, 0)])  # (y, x, distance)
+
+    while queue:
+        y, x, d = queue.popleft()
+        if (y, x) in visited:
+            continue
+        visited.add((y, x))
 
-        while queue:
-            y, x, d = queue.popleft()
-            if (y, x) in visited:
+        # skip king's own square
+        if d > 0:
+            piece = board[y][x]
+            if piece != '.':
+                # Use unified attack checker
+                if is_piece_attacking_king(piece, (y, x), (yk, xk), board):
+                    return True
+                
+                # Stop expansion from this piece (optimization: reduces cells visited)
                 continue
-            visited.add((y, x))
-
-            # skip king's own square
-            if d > 0:
-                piece = board[y][x]
-                if piece != '.':
-                    # Use unified attack checker
-                    if is_piece_attacking_king(piece, (y, x), (yk, xk), board):
-                        return True
-                    
-                    # Stop expansion from this piece (optimization: reduces cells visited)
-                    continue
-
-            # expand neighbors layer by layer
-            for dy, dx in [(-1,0),(1,0),(0,-1),(0,1),
-                           (-1,-1),(-1,1),(1,-1),(1,1)]:
-                ny, nx = y + dy, x + dx
-                if 0 <= ny < size and 0 <= nx < size and (ny, nx) not in visited:
-                    queue.append((ny, nx, d + 1))
 
-        return False
+        # expand neighbors layer by layer
+        for dy, dx in [(-1,0),(1,0),(0,-1),(0,1),
+                       (-1,-1),(-1,1),(1,-1),(1,1)]:
+            ny, nx = y + dy, x + dx
+            if 0 <= ny < size and 0 <= nx < size and (ny, nx) not in visited:
+                queue.append((ny, nx, d + 1))
 
-    return is_king_in_check()
+    return False
 
 
 # ============================================================================
@@ -158,33 +173,35 @@ def checkmate(board_str):
 # ============================================================================
 
 def checkmate_astar(board_str):
-    # Parse board
-    board = []
-    for row in board_str.strip().split("\n"):
-        if " " in row:
-            board.append(row.strip().split())
-        else:
-            board.append(list(row.strip()))
-    size = len(board)
-
-    # Find King
-    king_pos = None
-    for y in range(size):
-        for x in range(size):
-            if board[y][x] == "K":
-                king_pos = (y, x)
-                break
-        if king_pos:
-            break
+    board = parse_board(board_str)
+    king_pos = find_king(board)
 
     if not king_pos:
         return False, 0
 
+    return checkmate_astar_board(board, king_pos)
+
+
+def checkmate_astar_board(board, king_pos):
+    """
+    Parse-free A* check detection with threat level.
+    
+    Args:
+        board: 2D list, tuple of rows, or Bitboard
+        king_pos: (y, x) position of the King (its square is ignored)
+    
+    Returns:
+        tuple: (in_check: bool, threat_level: int 0-100)
+    """
+    if isinstance(board, Bitboard):
+        board = bitboard_to_board(board)
+
+    size = len(board)
     yk, xk = king_pos
 
     # Find all enemy pieces
     enemies = [(y, x, board[y][x]) for y in range(size) for x in range(size)
-               if board[y][x] in ('Q', 'R', 'B', 'P')]
+               if board[y][x] in ('Q', 'R', 'B', 'P') and (y, x) != (yk, xk)]
 
     if not enemies:
         return False, 0
@@ -224,25 +241,193 @@ def checkmate_astar(board_str):
         return False, 0
 
 
+# ============================================================================
+# Ray-cast Check Detection
+# ============================================================================
+
+def checkmate_raycast(board_str):
+    board = parse_board(board_str)
+    king_pos = find_king(board)
+
+    if not king_pos:
+        return False
+
+    return checkmate_raycast_board(board, king_pos)
+
+
+def checkmate_raycast_board(board, king_pos):
+    """
+    Ray-cast check detection.
+    
+    Instead of flood-filling the board, walk the 8 rays out of the King and
+    look only at the first piece on each, then at the two Pawn squares.
+    That is at most 27 squares on an 8x8 board, with early exit.
+    
+    Args:
+        board: 2D list, tuple of rows, or Bitboard
+        king_pos: (y, x) position of the King (its square is ignored)
+    
+    Returns:
+        True if the King is in check
+    """
+    if isinstance(board, Bitboard):
+        return is_king_attacked(board, king_pos)
+
+    rays, pawn_squares = king_rays(king_pos, len(board))
+
+    for y, x in pawn_squares:
+        if board[y][x] == 'P':
+            return True
+
+    for attackers, squares in rays:
+        for y, x in squares:
+            piece = board[y][x]
+            if piece != '.':
+                # Only the nearest piece on a ray can attack along it
+                if piece in attackers:
+                    return True
+                break
+
+    return False
+
+
+# ============================================================================
+# Vectorized Batch Check Detection
+# ============================================================================
+
+# Integer piece codes used by the (N, 8, 8) batch arrays
+PIECE_CODES = {'.': 0, 'Q': 1, 'R': 2, 'B': 3, 'P': 4}
+
+_CODE_PIECES = {code: piece for piece, code in PIECE_CODES.items()}
+_ORTHOGONAL_CODES = (PIECE_CODES['Q'], PIECE_CODES['R'])
+_DIAGONAL_CODES = (PIECE_CODES['Q'], PIECE_CODES['B'])
+
+
+def boards_to_array(boards):
+    """
+    Encode a sequence of 8x8 boards as an (N, 8, 8) array of piece codes.
+    
+    Args:
+        boards: Iterable of 2D lists or tuples of rows; 'K' and unknown symbols become empty
+    
+    Returns:
+        numpy int8 array using PIECE_CODES
+    """
+    if np is None:
+        raise ImportError("boards_to_array requires numpy")
+    boards = list(boards)
+    codes = np.zeros((len(boards), BOARD_SIZE, BOARD_SIZE), dtype=np.int8)
+    for n, board in enumerate(boards):
+        for y, row in enumerate(board):
+            for x, piece in enumerate(row):
+                codes[n, y, x] = PIECE_CODES.get(piece, 0)
+    return codes
+
+
+def checkmate_batch(boards, king_positions):
+    """
+    Vectorized check detection and threat level for many boards at once.
+    
+    All 8 rays are cast for every board in lockstep with NumPy masks: at each
+    step one square per ray is gathered, the nearest piece on each ray is
+    recorded, and rays are closed as soon as they hit a piece.
+    
+    The threat level reproduces checkmate_astar(), whose A* reports the first
+    attacker it reaches. That is the nearest attacker unless a farther one is
+    closer by the straight-line heuristic; those few boards are handed to
+    checkmate_astar_board() so the result stays identical.
+    
+    Args:
+        boards: (N, 8, 8) array of PIECE_CODES (the King's square is ignored)
+        king_positions: (N, 2) array-like of (y, x) King positions
+    
+    Returns:
+        tuple: (in_check: bool array (N,), threat_level: int array (N,))
+    """
+    if np is None:
+        raise ImportError("checkmate_batch requires numpy")
+
+    boards = np.asarray(boards)
+    kings = np.asarray(king_positions, dtype=np.int64).reshape(-1, 2)
+    n = boards.shape[0]
+    if boards.shape[1:] != (BOARD_SIZE, BOARD_SIZE) or kings.shape[0] != n:
+        raise ValueError("Expected boards of shape (N, 8, 8) and N King positions")
+
+    index = np.arange(n)
+    ky, kx = kings[:, 0], kings[:, 1]
+    # Up to one attacker per ray plus two Pawn squares: Chebyshev and
+    # Euclidean distance of each, inf where there is no attacker
+    chebyshev = np.full((n, 10), np.inf)
+    euclidean = np.full((n, 10), np.inf)
+
+    for ray, (dy, dx) in enumerate(RAY_DIRECTIONS):
+        attackers = _ORTHOGONAL_CODES if ray < 4 else _DIAGONAL_CODES
+        step_length = 1.0 if ray < 4 else math.sqrt(2)
+        open_ray = np.ones(n, dtype=bool)
+        for step in range(1, BOARD_SIZE):
+            y, x = ky + dy * step, kx + dx * step
+            on_board = (y >= 0) & (y < BOARD_SIZE) & (x >= 0) & (x < BOARD_SIZE)
+            open_ray &= on_board
+            if not open_ray.any():
+                break
+            piece = boards[index, np.clip(y, 0, BOARD_SIZE - 1), np.clip(x, 0, BOARD_SIZE - 1)]
+            hit = open_ray & (piece != 0)
+            attack = hit & np.isin(piece, attackers)
+            chebyshev[attack, ray] = step
+            euclidean[attack, ray] = step * step_length
+            open_ray &= ~hit
+
+    for slot, dx in ((8, -1), (9, 1)):
+        y, x = ky + 1, kx + dx
+        on_board = (y < BOARD_SIZE) & (x >= 0) & (x < BOARD_SIZE)
+        piece = boards[index, np.clip(y, 0, BOARD_SIZE - 1), np.clip(x, 0, BOARD_SIZE - 1)]
+        attack = on_board & (piece == PIECE_CODES['P'])
+        chebyshev[attack, slot] = 1
+        euclidean[attack, slot] = math.sqrt(2)
+
+    nearest = chebyshev.min(axis=1)
+    in_check = np.isfinite(nearest)
+    distance = np.where(in_check, nearest, 0).astype(np.int64)
+    threat_level = np.where(in_check, np.maximum(0, 100 - distance * 15), 0)
+
+    # A* can only reach a farther attacker first when that attacker's
+    # distance does not exceed the straight-line length to the nearest one
+    nearest_euclidean = np.where(chebyshev == nearest[:, None], euclidean, np.inf).min(axis=1)
+    next_distance = np.where(chebyshev > nearest[:, None], chebyshev, np.inf).min(axis=1)
+    ambiguous = in_check & (next_distance <= nearest_euclidean)
+    for i in np.flatnonzero(ambiguous):
+        board = [[_CODE_PIECES.get(code, ".") for code in row] for row in boards[i].tolist()]
+        threat_level[i] = checkmate_astar_board(board, (int(ky[i]), int(kx[i])))[1]
+
+    return in_check, threat_level
+
+
 # ============================================================================
 # Unified API Wrapper
 # ============================================================================
 
-def check_king_threat(board_str, use_astar=False):
+def check_king_threat(board_str, use_astar=False, strategy=None):
     """
-    Unified API for both check detection methods.
+    Unified API for all check detection methods.
     
     Args:
         board_str: String representation of the chess board
         use_astar: If True, use A* method with threat level; if False, use BFS
+        strategy: 'bfs', 'astar' or 'raycast'; overrides use_astar when given
     
     Returns:
         tuple: (in_check: bool, threat_level: int)
             - in_check: True if king is in check
-            - threat_level: 0-100 for A*, always 0 for BFS
+            - threat_level: 0-100 for A*, always 0 for BFS and ray-cast
     """
-    if use_astar:
+    if strategy is None:
+        strategy = 'astar' if use_astar else 'bfs'
+
+    if strategy == 'astar':
         return checkmate_astar(board_str)
-    else:
+    elif strategy == 'raycast':
+        return checkmate_raycast(board_str), 0
+    elif strategy == 'bfs':
         is_check = checkmate(board_str)
-        return is_check, 0
\ No newline at end of file
+        return is_check, 0
+    raise ValueError(f"Unknown check detection strategy: {strategy}")
@@ -1,6 +1,7 @@
 from gamestate import GameState
-from checkmate import checkmate, checkmate_astar
-from solver import can_still_win, find_complete_solution, find_remaining_solution
+from checkmate import checkmate_board, checkmate_astar_board
+from solver import find_complete_solution, find_remaining_solution, win_feasible
+from belief import KingBelief
 
 import random
 
@@ -27,14 +28,15 @@ def board_to_string(board, king_pos):
 def check_win_possibility(game_state, king_pos,search_type):
     current_board = [row[:] for row in game_state.board]
     remaining = game_state.remaining_pieces.copy()
-    can_win = can_still_win(current_board, remaining, king_pos, search_type = search_type)
+    # Answered from the King's attack lines: no search needed
+    can_win = win_feasible(current_board, remaining, king_pos)
     algo_name = "A*" if search_type == "astar" else "DFS"
 
     if not can_win:
-        print(f"\n[{algo_name} Analysis] No possible way to catch the King with the remaining pieces!You lose!!!")
+        print("\n[Attack Line Analysis] No possible way to catch the King with the remaining pieces!You lose!!!")
         return False
     else:
-        print(f"\n[{algo_name}] There is still a possibility to catch the King with the remaining pieces!!!")
+        print("\n[Attack Line Analysis] There is still a possibility to catch the King with the remaining pieces!!!")
         while True:
             try:
                 print("You Have option to choose Yes or No to see the Solution for remaining pieces. If you would like to see the solution, type 'y' and The soultion will show and the Game End. If not the game will continue!")
@@ -67,12 +69,12 @@ def chessgame():
         choice = input("Enter your choice (1 or 2): ").strip()
         if choice == '1':
             search_type = 'dfs'
-            check_func = checkmate
+            check_func = checkmate_board
             print("\nUsing Normal Mode: BFS (Checkmate) + DFS (Solver)")
             break
         elif choice == '2':
             search_type = 'astar'
-            check_func = checkmate_astar
+            check_func = checkmate_astar_board
             print("\nUsing A* Mode: A* (Checkmate) + A* (Solver)")
             break
         else:
@@ -115,6 +117,8 @@ def chessgame():
     game_state.used_positions.add(king_pos)
     
     display_board(game_state.board, hide_king=True)
+    # What the player knows about the King: every square is still possible
+    belief = KingBelief(game_state.board)
     
     print("Available pieces:")
     for piece, count in game_state.remaining_pieces.items():
@@ -125,7 +129,15 @@ def chessgame():
         print(f"\nRemaining pieces: {game_state.remaining_pieces}")
         
         while True:
-            piece = input("Choose a piece to place (Q/R/B/P): ").upper().strip()
+            piece = input("Choose a piece to place (Q/R/B/P, or H for a hint): ").upper().strip()
+            if piece == 'H':
+                # Only on request: the hint is the best move the player can make
+                best = belief.recommend(game_state.remaining_pieces)
+                if best is not None:
+                    (best_piece, best_row, best_col), caught = best
+                    print(f"[Belief] King on one of {len(belief)} squares; "
+                          f"{best_piece} at ({best_row}, {best_col}) would catch it on {caught}")
+                continue
             if piece in game_state.remaining_pieces:
                 if game_state.remaining_pieces[piece] > 0:
                     break
@@ -166,16 +178,14 @@ def chessgame():
         display_board(game_state.board, hide_king=True)
         
         # This is for checking the checkmate condition
-        board_str = board_to_string(game_state.board, king_pos)
-        
         if search_type == "astar":
-            check_result, threat = check_func(board_str)
+            check_result, threat = check_func(game_state.board, king_pos)
             if check_result:
                 print(f"\nYou Win!!! A* detected King capture! Threat level: {threat}")
                 display_board(game_state.board, hide_king=False, king_pos=king_pos)
                 return
         else:
-            if check_func(board_str):
+            if check_func(game_state.board, king_pos):
                 print("\nYou Win!!! You have successfully catched the King!!!")
                 display_board(game_state.board, hide_king=False, king_pos=king_pos)
                 #solution_analysis(game_state, king_pos, game_won=True)
@@ -183,6 +193,7 @@ def chessgame():
         
         # After placing a piece, check win possibility and offer solutions again
         print(f"\n=== Analysis after placing {piece} at ({row}, {col}) ===")
+        belief.observe(piece, row, col)
         can_continue = check_win_possibility(game_state, king_pos, search_type)
         if not can_continue:
             break
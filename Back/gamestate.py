@@ -1,7 +1,134 @@
 # gamestate.py
+import random
+
+# Fixed seed so Zobrist keys are stable across runs (and across processes)
+ZOBRIST_SEED = 0x5EED
+ZOBRIST_PIECES = ('Q', 'R', 'B', 'P', 'K')
+
+_zobrist_tables = {}
+
+
+def zobrist_table(size=8):
+    """
+    Random 64-bit key for every (piece, square) on a board of the given size.
+    The 'K' entries key the King's square; INVENTORY entries key piece counts.
+    """
+    table = _zobrist_tables.get(size)
+    if table is None:
+        rng = random.Random(ZOBRIST_SEED + size)
+        table = {piece: [[rng.getrandbits(64) for _ in range(size)] for _ in range(size)]
+                 for piece in ZOBRIST_PIECES}
+        table['INVENTORY'] = {piece: [rng.getrandbits(64) for _ in range(size * size + 1)]
+                              for piece in ZOBRIST_PIECES[:4]}
+        _zobrist_tables[size] = table
+    return table
+
+
+def zobrist_hash(board):
+    """Zobrist key of a board from scratch (XOR of its pieces' keys)."""
+    table = zobrist_table(len(board))
+    key = 0
+    for y, row in enumerate(board):
+        for x, piece in enumerate(row):
+            if piece in table:
+                key ^= table[piece][y][x]
+    return key
+
+
+def zobrist_mirror_hash(board):
+    """Zobrist key of the board mirrored left-right (see symmetry.py)."""
+    return zobrist_hash([row[::-1] for row in board])
+
+
+def zobrist_inventory(remaining_pieces, size=8):
+    """Zobrist key of a remaining-pieces inventory (a dict or (piece, count) pairs)."""
+    keys = zobrist_table(size)['INVENTORY']
+    key = 0
+    if isinstance(remaining_pieces, dict):
+        remaining_pieces = remaining_pieces.items()
+    for piece, count in remaining_pieces:
+        if count:  # a missing piece and a zero count are the same inventory
+            key ^= keys[piece][count]
+    return key
+
+
 class GameState:
     def __init__(self, size=8):
         self.board = [['.' for _ in range(size)] for _ in range(size)]
         self.size = size
         self.remaining_pieces = {'Q': 1, 'R': 2, 'B': 2, 'P': 8}
         self.used_positions = set()
+
+
+EMPTY = ord('.')
+
+
+class CompactState:
+    """
+    Immutable, hashable solver state.
+
+    The board is a bytes string of size * size piece characters in row-major
+    order, the inventory is a tuple of (piece, count) pairs in the order of
+    the remaining_pieces dict it came from, and occupied has bit
+    y * size + x set for every occupied square. Placing a piece builds a new
+    state from a few slices instead of copying a 2D list, a dict and a set.
+
+    Args:
+        size: Board size
+        board: bytes of length size * size
+        inventory: Tuple of (piece, count) pairs
+        occupied: Occupancy bitmask
+        zobrist: Zobrist key of the board
+        mirror_zobrist: Zobrist key of the board mirrored left-right
+    """
+    __slots__ = ('size', 'board', 'inventory', 'occupied', 'zobrist', 'mirror_zobrist')
+
+    def __init__(self, size, board, inventory, occupied, zobrist, mirror_zobrist):
+        self.size = size
+        self.board = board
+        self.inventory = inventory
+        self.occupied = occupied
+        self.zobrist = zobrist
+        self.mirror_zobrist = mirror_zobrist
+
+    @classmethod
+    def from_game_state(cls, state):
+        """Pack a GameState (its board and remaining_pieces), computing its Zobrist keys."""
+        board = ''.join(''.join(row) for row in state.board).encode('ascii')
+        occupied = 0
+        for square, code in enumerate(board):
+            if code != EMPTY:
+                occupied |= 1 << square
+        return cls(state.size, board, tuple(state.remaining_pieces.items()), occupied,
+                   zobrist_hash(state.board), zobrist_mirror_hash(state.board))
+
+    def place(self, piece, row, col):
+        """Return a new state with piece placed on (row, col) and taken from the inventory."""
+        square = row * self.size + col
+        board = self.board[:square] + piece.encode('ascii') + self.board[square + 1:]
+        inventory = tuple((p, count - 1) if p == piece else (p, count) for p, count in self.inventory)
+        keys = zobrist_table(self.size)[piece][row]
+        return CompactState(self.size, board, inventory, self.occupied | (1 << square),
+                            self.zobrist ^ keys[col], self.mirror_zobrist ^ keys[self.size - 1 - col])
+
+    @property
+    def remaining_pieces(self):
+        """Inventory as a dict, like GameState.remaining_pieces."""
+        return dict(self.inventory)
+
+    def pieces_left(self):
+        """Piece types with a count above zero, in inventory order."""
+        return [piece for piece, count in self.inventory if count > 0]
+
+    def empty_squares(self):
+        """(row, col) of every empty square, in row-major order."""
+        occupied = self.occupied
+        return [divmod(square, self.size) for square in range(self.size * self.size)
+                if not occupied >> square & 1]
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactState) and self.board == other.board
+                and self.inventory == other.inventory)
+
+    def __hash__(self):
+        return hash((self.board, self.inventory))
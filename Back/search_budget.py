@@ -0,0 +1,106 @@
+"""
+Node and time budgets for the solvers.
+
+A SearchBudget is handed to a search, which calls expand() once per node it
+expands. When the node limit, the deadline or a cancellation stops the
+search, expand() raises BudgetExhausted and the budget keeps the nodes
+expanded so far and the best partial path. The solver entry points turn
+that into a SearchResult.
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+
+# SearchResult.status values
+SOLVED = 'solved'
+UNSOLVABLE = 'unsolvable'
+BUDGET_EXHAUSTED = 'budget_exhausted'
+
+SearchResult = namedtuple('SearchResult', ['status', 'path', 'nodes_expanded'])
+SearchResult.__doc__ = """
+Outcome of a budgeted search.
+
+Fields:
+    status: SOLVED, UNSOLVABLE or BUDGET_EXHAUSTED
+    path: The solution if solved, the best partial path found if the budget
+        ran out, None if unsolvable
+    nodes_expanded: Nodes the search expanded
+"""
+
+# The clock and the cancellation token are read every this many nodes
+CHECK_INTERVAL = 64
+
+
+class BudgetExhausted(Exception):
+    """Raised by SearchBudget.expand() when the search has to stop."""
+
+
+class CancellationToken:
+    """
+    Thread-safe flag another thread sets to stop a running search.
+
+    One token can be shared by several searches; cancelling it stops all of them.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class SearchBudget:
+    """
+    Limits for one search.
+
+    Args:
+        max_nodes: Most nodes the search may expand, or None for no limit
+        deadline: time.monotonic() value to stop at, or None for no limit
+        cancel: CancellationToken, or None
+    """
+    __slots__ = ('max_nodes', 'deadline', 'cancel', 'nodes', 'best_path')
+
+    def __init__(self, max_nodes=None, deadline=None, cancel=None):
+        self.max_nodes = max_nodes
+        self.deadline = deadline
+        self.cancel = cancel
+        self.nodes = 0
+        self.best_path = []
+
+    def expand(self, partial=None):
+        """
+        Count one expanded node.
+
+        Args:
+            partial: Path of the node, kept as best_path if the search stops
+                here (searches that track their own best path pass None)
+
+        Raises:
+            BudgetExhausted: If the node limit is reached, the deadline has
+                passed or the token was cancelled
+        """
+        if (self.max_nodes is not None and self.nodes >= self.max_nodes
+                or not self.nodes % CHECK_INTERVAL and self.stopped()):
+            if partial is not None:
+                self.best_path = list(partial)
+            raise BudgetExhausted()
+        self.nodes += 1
+
+    def stopped(self):
+        """True if the deadline has passed or the token was cancelled."""
+        if self.cancel is not None and self.cancel.cancelled:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+
+def make_budget(max_nodes=None, deadline=None, cancel=None):
+    """A SearchBudget for the given limits, or None if there are none."""
+    if max_nodes is None and deadline is None and cancel is None:
+        return None
+    return SearchBudget(max_nodes, deadline, cancel)
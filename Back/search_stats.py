@@ -0,0 +1,104 @@
+"""
+Instrumentation for the solvers.
+
+Pass a SearchStats as stats= to a search or a solver entry point and it is
+filled in as the search runs; leave it out and the search runs uninstrumented
+(a few `stats is not None` tests per node). Timed calls are wrapped only when
+stats are on, so nothing is timed otherwise.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+
+class SearchStats:
+    """
+    Counters and timings of one or more searches (they accumulate).
+
+    Attributes:
+        nodes_expanded: Nodes whose children were generated
+        nodes_generated: Child nodes created (A*: pushed on the frontier,
+            DFS: placements made)
+        goal_tests: Check tests run
+        visited_hits: Nodes skipped because their board was already visited
+        table_hits: Nodes skipped because the transposition table knows them
+            to be unsolvable
+        peak_frontier: Largest frontier (A*: heap entries, DFS: stack depth)
+        peak_memory: Peak traced allocation in bytes (with trace_memory only)
+        time_heuristic: Seconds in heuristic / lower-bound calls
+        time_goal_test: Seconds in check tests (including the attack-map update)
+        time_expansion: Seconds generating children, heuristic excluded
+        wall_time: Seconds from the start to the end of each search
+
+    Args:
+        trace_memory: Also trace peak memory with tracemalloc (slows the
+            search down several times)
+    """
+    __slots__ = ('trace_memory', 'nodes_expanded', 'nodes_generated', 'goal_tests', 'visited_hits',
+                 'table_hits', 'peak_frontier', 'peak_memory', 'time_heuristic', 'time_goal_test',
+                 'time_expansion', 'wall_time')
+
+    COUNTERS = ('nodes_expanded', 'nodes_generated', 'goal_tests', 'visited_hits', 'table_hits',
+                'peak_frontier', 'peak_memory')
+    TIMERS = ('time_heuristic', 'time_goal_test', 'time_expansion', 'wall_time')
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        for name in self.TIMERS:
+            setattr(self, name, 0.0)
+
+    def frontier(self, size):
+        """Record a frontier size."""
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def timed(self, fn, time_field, *count_fields):
+        """
+        Wrap fn so each call adds its duration to time_field and one to each count field.
+
+        Returns:
+            The wrapper, to be called instead of fn
+        """
+        clock = time.perf_counter
+
+        def wrapper(*args):
+            for field in count_fields:
+                setattr(self, field, getattr(self, field) + 1)
+            start = clock()
+            result = fn(*args)
+            setattr(self, time_field, getattr(self, time_field) + clock() - start)
+            return result
+        return wrapper
+
+    @contextmanager
+    def measure(self):
+        """Add the wall time (and, with trace_memory, the peak memory) of the block."""
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.wall_time += time.perf_counter() - start
+            if tracing:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self.peak_memory = max(self.peak_memory, peak)
+
+    def as_dict(self):
+        """All counters and timings, e.g. for logging."""
+        return {name: getattr(self, name) for name in self.COUNTERS + self.TIMERS}
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={value:.6f}" if isinstance(value, float) else f"{name}={value}"
+                           for name, value in self.as_dict().items())
+        return f"SearchStats({fields})"
+
+
+def measure(stats):
+    """stats.measure(), or a no-op context when stats is None."""
+    return nullcontext() if stats is None else stats.measure()
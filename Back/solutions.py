@@ -0,0 +1,290 @@
+"""
+Enumeration of every solution of a position.
+
+A solution is a set of placements that the game can play to a check: the
+board without them is not in check, and they can be placed in some order
+that gives check only with the last one. Pieces never move, so that holds
+exactly when one placement x of the set gives check and the board with the
+others does not. (A set T that leaves the King out of check can always be
+played without giving check: some piece of T can be taken away without
+unblocking an attacker of T, so by induction T can be placed in the reverse
+of that order.) The checking x is then the only checking piece of the set,
+so every solution splits uniquely into a check-free set T plus one checking
+placement on the board with T. Enumerating (T, x) pairs yields each set
+exactly once, without a seen-set in memory.
+
+The fewest placements a solution can have is 0 (the board already gives
+check; the only solution is the empty one) or 1 (a single checking
+placement), see solver.placements_lower_bound().
+
+count_solutions() counts the same sets without enumerating them. Whether
+the board with T gives check, and which squares x can check from, depend on
+each of the King's rays separately (on its nearest piece), so the count is
+a product over rays of generating polynomials in the pieces used, times the
+squares that cannot matter (off every ray, or behind a ray's nearest piece).
+
+Usage: python3 Back/solutions.py ROW COL [MAX_PLACEMENTS] [LIMIT] > solutions.txt
+    (empty board, default inventory; one solution per line)
+"""
+
+import sys
+from functools import lru_cache
+from itertools import product
+from math import comb, factorial
+
+from attack_state import AttackState
+from attack_tables import PIECE_TYPES, king_rays
+from symmetry import canonicalize
+
+
+def iter_solutions(current_board, remaining_pieces, king_pos, max_placements=None, limit=None,
+                   minimal=False):
+    """
+    Lazily yield every distinct solution, by increasing placement count.
+
+    Only the placements being tried are held in memory, so the stream can be
+    written out as it is produced however many solutions there are.
+
+    Args:
+        current_board: 2D list board without the King
+        remaining_pieces: Dict of piece counts still available
+        king_pos: (y, x) position of the King
+        max_placements: Largest solution to yield (defaults to every
+            remaining piece)
+        limit: Most solutions to yield, or None
+        minimal: Stop after the smallest placement count that has solutions
+
+    Yields:
+        Tuples of (piece, row, col) placements in row-major square order;
+        the empty tuple if the board already gives check
+    """
+    if limit is not None and limit <= 0:
+        return
+    attack = AttackState(king_pos, current_board)
+    if attack.in_check:
+        yield ()
+        return
+    counts = {piece: count for piece, count in remaining_pieces.items() if count > 0}
+    total = sum(counts.values())
+    if max_placements is None or max_placements > total:
+        max_placements = total
+    size = len(current_board)
+    empty = [(row, col) for row in range(size) for col in range(size)
+             if current_board[row][col] == '.' and (row, col) != tuple(king_pos)]
+
+    yielded = 0
+    for placements in range(1, max_placements + 1):
+        found = False
+        for solution in _solutions_of_size(attack, empty, counts, placements - 1, size):
+            yield solution
+            found = True
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+        if minimal and found:
+            return
+
+
+def _solutions_of_size(attack, empty, counts, fillers, size):
+    # Solutions of fillers + 1 placements: every check-free set T of fillers
+    # placements (in square order, made and unmade on attack), each followed
+    # by every checking placement the pieces left can make
+    chosen = []
+
+    def extend(start, left):
+        if left == 0:
+            if attack.in_check:
+                return
+            pieces = [piece for piece, count in counts.items() if count > 0]
+            for (row, col), attackers in attack.checking_squares():
+                for piece in pieces:
+                    if piece in attackers:
+                        yield tuple(sorted(chosen + [(piece, row, col)],
+                                           key=lambda p: p[1] * size + p[2]))
+            return
+        # Leave room for the remaining left - 1 placements after this square
+        for index in range(start, len(empty) - left + 1):
+            row, col = empty[index]
+            for piece in counts:
+                if counts[piece] == 0:
+                    continue
+                counts[piece] -= 1
+                attack.add(piece, row, col)
+                chosen.append((piece, row, col))
+                yield from extend(index + 1, left - 1)
+                chosen.pop()
+                attack.remove(row, col)
+                counts[piece] += 1
+
+    return extend(0, fillers)
+
+
+# ============================================================================
+# Counting
+# ============================================================================
+# A polynomial maps a usage vector (pieces of each type in PIECE_TYPES order)
+# to a number of placement sets using exactly those pieces, truncated to the
+# inventory. Each ray contributes a pair: its ways of holding part of T
+# without giving check, and the same weighted by the checking squares left
+# for each piece type.
+
+def count_solutions(current_board, remaining_pieces, king_pos, max_placements=None, minimal=False):
+    """
+    Number of solutions iter_solutions() would yield, counted without enumerating them.
+
+    Args:
+        current_board: 2D list board without the King
+        remaining_pieces: Dict of piece counts still available
+        king_pos: (y, x) position of the King
+        max_placements: Count only solutions up to this many placements
+        minimal: Count only the solutions with the fewest placements
+
+    Returns:
+        Number of distinct solutions
+    """
+    counts = solution_counts(current_board, remaining_pieces, king_pos)
+    if minimal:
+        return counts[min(counts)] if counts else 0
+    return sum(count for placements, count in counts.items()
+               if max_placements is None or placements <= max_placements)
+
+
+def solution_counts(current_board, remaining_pieces, king_pos):
+    """
+    Number of solutions of each placement count.
+
+    Results are cached per mirror-canonical position and inventory (see
+    symmetry.py), so repeated and mirrored queries are lookups.
+
+    Returns:
+        Dict of placements -> number of solutions, without zero counts
+    """
+    board, king_pos, _ = canonicalize([list(row) for row in current_board], tuple(king_pos))
+    inventory = tuple(max(0, remaining_pieces.get(piece, 0)) for piece in PIECE_TYPES)
+    return dict(_solution_counts(tuple(''.join(row) for row in board), king_pos, inventory))
+
+
+@lru_cache(maxsize=4096)
+def _solution_counts(board, king_pos, inventory):
+    if AttackState(king_pos, board).in_check:
+        return ((0, 1),)
+    size = len(board)
+    rays, pawn_squares = king_rays(king_pos, size)
+    on_rays = {square for _, squares in rays for square in squares}
+    free = sum(1 for y in range(size) for x in range(size)
+               if board[y][x] == '.' and (y, x) not in on_rays and (y, x) != king_pos)
+
+    ways = _fillers(free, inventory)
+    checks = [{} for _ in PIECE_TYPES]
+    for attackers, squares in rays:
+        ray_ways, ray_checks = _ray_polynomials(board, attackers, squares, pawn_squares, inventory)
+        checks = [_add(_multiply(ways, ray_checks[t], inventory), _multiply(checks[t], ray_ways, inventory))
+                  for t in range(len(PIECE_TYPES))]
+        ways = _multiply(ways, ray_ways, inventory)
+
+    # The checking placement needs one more piece of its type than T uses
+    counts = {}
+    for t, polynomial in enumerate(checks):
+        for usage, count in polynomial.items():
+            if usage[t] < inventory[t] and count:
+                placements = sum(usage) + 1
+                counts[placements] = counts.get(placements, 0) + count
+    return tuple(sorted(counts.items()))
+
+
+def _ray_polynomials(board, attackers, squares, pawn_squares, inventory):
+    # Walk the ray outward. Its nearest piece (on the board, or the T piece
+    # placed on the first non-empty square) must not attack along it; every
+    # empty square before it is a checking square, and the empty squares
+    # behind it are fillers.
+    ways = {}
+    checks = [{} for _ in PIECE_TYPES]
+    empty_after = [0] * (len(squares) + 1)
+    for i in range(len(squares) - 1, -1, -1):
+        y, x = squares[i]
+        empty_after[i] = empty_after[i + 1] + (board[y][x] == '.')
+
+    def outcome(leading, placed, fillers):
+        polynomial = _fillers(fillers, inventory)
+        if placed is not None:
+            polynomial = _shift(polynomial, PIECE_TYPES.index(placed), inventory)
+        _add_into(ways, polynomial)
+        for t, piece in enumerate(PIECE_TYPES):
+            checking = leading if piece in attackers else 0
+            if piece == 'P' and leading and squares[0] in pawn_squares:
+                checking += 1
+            if checking:
+                _add_into(checks[t], {usage: count * checking for usage, count in polynomial.items()})
+
+    for i, (y, x) in enumerate(squares):
+        if board[y][x] != '.':
+            # The board was not in check, so this piece does not attack along the ray
+            outcome(i, None, empty_after[i + 1])
+            break
+        for t, piece in enumerate(PIECE_TYPES):
+            if inventory[t] and piece not in attackers and not (piece == 'P' and (y, x) in pawn_squares):
+                outcome(i, piece, empty_after[i + 1])
+    else:
+        outcome(len(squares), None, 0)
+    return ways, checks
+
+
+@lru_cache(maxsize=None)
+def _fillers(squares, inventory):
+    # (1 + zQ + zR + zB + zP) ** squares: choose which squares hold pieces,
+    # then which type each one gets
+    polynomial = {}
+    for usage in product(*(range(count + 1) for count in inventory)):
+        used = sum(usage)
+        if used <= squares:
+            ways = comb(squares, used) * factorial(used)
+            for count in usage:
+                ways //= factorial(count)
+            polynomial[usage] = ways
+    return polynomial
+
+
+def _shift(polynomial, t, inventory):
+    # Multiply by z_t: one more piece of type t
+    shifted = {}
+    for usage, count in polynomial.items():
+        if usage[t] < inventory[t]:
+            shifted[usage[:t] + (usage[t] + 1,) + usage[t + 1:]] = count
+    return shifted
+
+
+def _multiply(a, b, inventory):
+    result = {}
+    for usage_a, count_a in a.items():
+        for usage_b, count_b in b.items():
+            usage = tuple(i + j for i, j in zip(usage_a, usage_b))
+            if all(used <= limit for used, limit in zip(usage, inventory)):
+                result[usage] = result.get(usage, 0) + count_a * count_b
+    return result
+
+
+def _add(a, b):
+    total = dict(a)
+    _add_into(total, b)
+    return total
+
+
+def _add_into(total, polynomial):
+    for usage, count in polynomial.items():
+        total[usage] = total.get(usage, 0) + count
+
+
+def _format(solution):
+    return ' '.join(f"{piece}@{row},{col}" for piece, row, col in solution)
+
+
+if __name__ == "__main__":
+    from gamestate import GameState
+
+    row, col = int(sys.argv[1]), int(sys.argv[2])
+    max_placements = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    limit = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    state = GameState()
+    for solution in iter_solutions(state.board, state.remaining_pieces, (row, col),
+                                   max_placements, limit):
+        print(_format(solution))
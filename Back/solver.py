@@ -1,30 +1,85 @@
-from checkmate import checkmate, checkmate_astar
-from gamestate import GameState
+from attack_state import AttackState
+from gamestate import (CompactState, GameState, zobrist_hash, zobrist_inventory, zobrist_mirror_hash,
+                       zobrist_table)
 import heapq
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+from attack_tables import BOARD_SIZE, PIECE_TYPES, king_rays
+from search_budget import (BUDGET_EXHAUSTED, SOLVED, UNSOLVABLE, BudgetExhausted, SearchResult,
+                           make_budget)
+from search_stats import measure
+from tablebase import get_tablebase
+from bitboard import (FULL_BOARD, board_to_bitboard, checking_masks, is_king_attacked,
+                      iter_squares, square_bit)
+
+@lru_cache(maxsize=None)
+def _heuristic_weights(king_pos, size):
+    """Per-square threat weight of each piece type, built once per King square."""
+    ky, kx = king_pos
+    weights = {piece: [0] * (size * size) for piece in PIECE_TYPES}
+    for y in range(size):
+        for x in range(size):
+            dist = abs(ky - y) + abs(kx - x)
+            weights['Q'][y * size + x] = 5 / (dist + 1)
+            if y == ky or x == kx:
+                weights['R'][y * size + x] = 4 / (dist + 1)
+            if abs(ky - y) == abs(kx - x):
+                weights['B'][y * size + x] = 3 / (dist + 1)
+            if ky == y - 1 and abs(kx - x) == 1:
+                weights['P'][y * size + x] = 2
+    return weights
 
 def heuristic(board, king_pos):
+    size = len(board)
+    weights = _heuristic_weights(tuple(king_pos), size)
     score = 0
-    ky, kx = king_pos
 
-    for y in range(len(board)):
-        for x in range(len(board)):
-            piece = board[y][x]
+    for y in range(size):
+        base = y * size
+        row = board[y]
+        for x in range(size):
+            piece = row[x]
             if piece == '.': 
                 continue
-            dist = abs(ky - y) + abs(kx - x)
-            if piece == 'Q':
-                score += 5 / (dist + 1)
-            elif piece == 'R':
-                if y == ky or x == kx:
-                    score += 4 / (dist + 1)
-            elif piece == 'B':
-                if abs(ky - y) == abs(kx - x):
-                    score += 3 / (dist + 1)
-            elif piece == 'P':
-                if ky == y - 1 and abs(kx - x) == 1:
-                    score += 2
+            if piece in weights:
+                score += weights[piece][base + x]
     return -score  
 
+def bitboard_heuristic(bitboard, king_pos):
+    """Same score as heuristic(), read from a Bitboard in row-major order."""
+    weights = _heuristic_weights(tuple(king_pos), BOARD_SIZE)
+    masks = bitboard.masks
+    score = 0
+    occupied = bitboard.occupied
+    while occupied:
+        low = occupied & -occupied
+        sq = low.bit_length() - 1
+        for piece in PIECE_TYPES:
+            if masks[piece] & low:
+                score += weights[piece][sq]
+                break
+        occupied ^= low
+    return -score
+
+def compact_heuristic(state, king_pos):
+    """Same score as heuristic(), read from a CompactState in row-major order."""
+    weights = _heuristic_weights(tuple(king_pos), state.size)
+    board = state.board
+    score = 0
+    occupied = state.occupied
+    while occupied:
+        low = occupied & -occupied
+        sq = low.bit_length() - 1
+        piece_weights = weights.get(chr(board[sq]))
+        if piece_weights is not None:
+            score += piece_weights[sq]
+        occupied ^= low
+    return -score
+
 def get_empty_squares(board):
     empty = []
     for row in range(len(board)):
@@ -35,9 +90,7 @@ def get_empty_squares(board):
 
 def place_piece(state, piece, row, col):
     new_state = GameState(state.size)
-    for r in range(state.size):
-        for c in range(state.size):
-            new_state.board[r][c] = state.board[r][c]
+    new_state.board = [cells[:] for cells in state.board]
     new_state.board[row][col] = piece
     new_state.remaining_pieces = state.remaining_pieces.copy()
     new_state.remaining_pieces[piece] -= 1
@@ -51,66 +104,790 @@ def board_to_string(board, king_pos):
     test_board[king_row][king_col] = 'K'
     return '\n'.join(' '.join(row) for row in test_board)
 
-def astar_search(state, king_pos):
-    start_board_str = board_to_string(state.board, king_pos)
+# Candidate generators: 'relevant' tries only placements that give check,
+# 'all' tries every piece on every empty square
+CANDIDATE_MODES = ('relevant', 'all')
+
+def candidate_placements(board, remaining_pieces, attack, candidates='relevant'):
+    """
+    Placements a solver should try next, in row-major then inventory order.
+
+    A piece that does not give check when placed never will: pieces are never
+    moved or removed, so later placements can only block it further. Only
+    placements that check right away can lead to a solution, so the
+    'relevant' generator yields nothing else.
+
+    Args:
+        board: 2D list board without the King
+        remaining_pieces: Dict of piece counts still available
+        attack: AttackState of board around the King
+        candidates: 'relevant' or 'all' (every piece on every empty square)
+
+    Returns:
+        List of (row, col, piece) placements
+    """
+    pieces = [piece for piece, count in remaining_pieces.items() if count > 0]
+    return _candidates(pieces, attack, candidates, lambda: get_empty_squares(board))
+
+def _candidates(pieces, attack, candidates, empty_squares):
+    # empty_squares is only called for 'all'
+    if candidates == 'relevant':
+        return [(row, col, piece) for (row, col), attackers in attack.checking_squares()
+                for piece in pieces if piece in attackers]
+    if candidates == 'all':
+        return [(row, col, piece) for row, col in empty_squares() for piece in pieces]
+    raise ValueError(f"Unknown candidates: {candidates!r} (expected one of {CANDIDATE_MODES})")
+
+def _bitboard_candidates(board, remaining, king_pos, candidates, start=0):
+    # candidate_placements() for a Bitboard, limited to squares from start on
+    pieces = [piece for piece, count in remaining.items() if count > 0]
+    empty = ~board.occupied & FULL_BOARD & -(1 << start)
+    if candidates == 'all':
+        return [(row, col, piece) for row, col in iter_squares(empty) for piece in pieces]
+    if candidates != 'relevant':
+        raise ValueError(f"Unknown candidates: {candidates!r} (expected one of {CANDIDATE_MODES})")
+    orthogonal, diagonal, pawn = checking_masks(board, king_pos)
+    placements = []
+    for row, col in iter_squares((orthogonal | diagonal | pawn) & empty):
+        bit = square_bit(row, col)
+        for piece in pieces:
+            if piece == 'P':
+                useful = pawn & bit
+            elif piece == 'Q':
+                useful = (orthogonal | diagonal) & bit
+            else:
+                useful = (orthogonal if piece == 'R' else diagonal) & bit
+            if useful:
+                placements.append((row, col, piece))
+    return placements
+
+class TranspositionTable:
+    """
+    Zobrist-keyed set of states known to be unsolvable, shared by DFS and A*.
+
+    A state is (board, remaining pieces, King square), keyed by state_key().
+    Every continuation of an unsolvable state is unsolvable too, so a search
+    can skip such a state however it reached it.
+    """
+    def __init__(self, max_entries=1_000_000):
+        self.max_entries = max_entries
+        self._dead = set()
+
+    def __contains__(self, key):
+        return key in self._dead
+
+    def __len__(self):
+        return len(self._dead)
+
+    def add(self, key):
+        if len(self._dead) >= self.max_entries:
+            self._dead.clear()  # simple bound: start over rather than grow forever
+        self._dead.add(key)
+
+    def clear(self):
+        self._dead.clear()
+
+# Shared by the solver entry points below
+TRANSPOSITION_TABLE = TranspositionTable()
+
+def state_key(state, king_pos):
+    """64-bit key of (board, remaining pieces, King square) for a TranspositionTable.
+
+    state may be a GameState or a CompactState; both give the same key. A
+    position and its left-right mirror image share a key (see symmetry.py),
+    since one is unsolvable exactly when the other is.
+    """
+    ky, kx = king_pos
+    size = state.size
+    if isinstance(state, CompactState):
+        inventory, zobrist, mirror_zobrist = state.inventory, state.zobrist, state.mirror_zobrist
+    else:
+        # A GameState's board may be edited at any time: hash it as it is now
+        inventory = state.remaining_pieces
+        zobrist, mirror_zobrist = zobrist_hash(state.board), zobrist_mirror_hash(state.board)
+    inventory_key = zobrist_inventory(inventory, size)
+    king_keys = zobrist_table(size)['K'][ky]
+    return min(zobrist ^ inventory_key ^ king_keys[kx],
+               mirror_zobrist ^ inventory_key ^ king_keys[size - 1 - kx])
+
+class PathNode:
+    """
+    Last placement of a search path, linked to the node it was made from.
+
+    Frontier entries hold a PathNode instead of their own copy of the path,
+    so an entry costs the same at any depth and pushing one copies nothing;
+    path() rebuilds the list only when it is needed.
+
+    Args:
+        parent: PathNode this placement extends, or None for the root
+        placement: (piece, row, col), or None for the root
+    """
+    __slots__ = ('parent', 'placement', 'depth')
+
+    def __init__(self, parent=None, placement=None):
+        self.parent = parent
+        self.placement = placement
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    def path(self):
+        """Placements from the root to this node, as a list."""
+        path = []
+        node = self
+        while node.parent is not None:
+            path.append(node.placement)
+            node = node.parent
+        path.reverse()
+        return path
+
+def astar_search(state, king_pos, backend='list', table=None, candidates='relevant', budget=None,
+                 stats=None):
+    # With a SearchBudget, raises BudgetExhausted when it runs out; the
+    # expanded path with the best heuristic score is left in budget.best_path.
+    # With a SearchStats, fills it in (see search_stats.py).
+    with measure(stats):
+        if backend == 'bitboard':
+            return _astar_search_bitboard(state, king_pos, candidates, budget, stats, table)
+        return _astar_search_list(state, king_pos, table, candidates, budget, stats)
+
+def _astar_search_list(state, king_pos, table, candidates, budget, stats):
+    # Search on CompactStates; the GameState is only read here
+    root = CompactState.from_game_state(state)
+    king_square, king_keys = _king_square_keys(tuple(king_pos), root.size)
     frontier = []
+    heuristic_fn = compact_heuristic
+    if stats is not None:
+        heuristic_fn = stats.timed(compact_heuristic, 'time_heuristic')
+        clock = time.perf_counter
     
     counter = 0
-    h = heuristic(state.board, king_pos)
-    heapq.heappush(frontier, (h, counter, state, []))
+    h = heuristic_fn(root, king_pos)
+    # Each entry carries its parent's AttackState; the child's own is built
+    # (copy + one add) only when the entry is popped
+    heapq.heappush(frontier, (h, counter, root, PathNode(), AttackState(king_pos, state.board)))
     
     visited = set()
+    best_h = math.inf
 
     while frontier:
-        f, _, current_state, path = heapq.heappop(frontier)
-        board_str = board_to_string(current_state.board, king_pos)
+        f, _, current_state, node, attack = heapq.heappop(frontier)
+        key = _visited_key(current_state, king_square, king_keys)
         
-        if board_str in visited:
+        if key in visited:
+            if stats is not None:
+                stats.visited_hits += 1
             continue
-        visited.add(board_str)
-        is_check, _ = checkmate_astar(board_str)
-        if is_check:
-            return path
+        visited.add(key)
+        if table is not None and state_key(current_state, king_pos) in table:
+            if stats is not None:
+                stats.table_hits += 1
+            continue
+        if stats is not None:
+            stats.goal_tests += 1
+            start = clock()
+        if node.parent is not None:
+            attack = attack.copy()
+            attack.add(*node.placement)
+        in_check = attack.in_check
+        if stats is not None:
+            stats.time_goal_test += clock() - start
+        if in_check:
+            return node.path()
+        if budget is not None:
+            if f - node.depth < best_h:
+                best_h = f - node.depth
+                budget.best_path = node.path()
+            budget.expand()
+        if stats is not None:
+            stats.nodes_expanded += 1
+            start, heuristic_time = clock(), stats.time_heuristic
         
-        for row, col in get_empty_squares(current_state.board):
-            for piece, count in current_state.remaining_pieces.items():
-                if count > 0:
-                    new_state = place_piece(current_state, piece, row, col)
-                    new_path = path + [(piece, row, col)]
-                    
-                    g = len(new_path)
-                    h = heuristic(new_state.board, king_pos)
-                    f_new = g + h
-                    
-                    counter += 1
-                    
-                    heapq.heappush(frontier, (f_new, counter, new_state, new_path))
+        placements = _candidates(current_state.pieces_left(), attack, candidates,
+                                 current_state.empty_squares)
+        g = node.depth + 1
+        for row, col, piece in placements:
+            new_state = current_state.place(piece, row, col)
+            h = heuristic_fn(new_state, king_pos)
+            f_new = g + h
+            
+            counter += 1
+            
+            heapq.heappush(frontier, (f_new, counter, new_state, PathNode(node, (piece, row, col)), attack))
+        if stats is not None:
+            stats.nodes_generated += len(placements)
+            stats.time_expansion += clock() - start - (stats.time_heuristic - heuristic_time)
+            stats.frontier(len(frontier))
 
+    if table is not None:
+        table.add(state_key(root, king_pos))
     return None
 
-def dfs_search(state, king_pos, find_solution=False, solution=None):
-    if solution is None:
-        solution = []
-        
-    board_str = board_to_string(state.board, king_pos)
-    if checkmate(board_str): #assuming checkmate return True/False
-        if find_solution:
-            return solution
-        return True
-    
-    if all(state.remaining_pieces[piece] == 0 for piece in state.remaining_pieces):
+@lru_cache(maxsize=None)
+def _king_square_keys(king_pos, size):
+    # The King's square index and, per piece code, the Zobrist key of that
+    # piece on it
+    ky, kx = king_pos
+    return ky * size + kx, {ord(piece): keys[ky][kx] for piece, keys in zobrist_table(size).items()
+                            if piece in PIECE_TYPES}
+
+def _visited_key(state, king_square, king_keys):
+    # Visited key of a CompactState: its Zobrist key without whatever sits on
+    # the King's square
+    key = state.zobrist
+    on_king = state.board[king_square]
+    if on_king in king_keys:
+        key ^= king_keys[on_king]
+    return key
+
+def dfs_search(state, king_pos, find_solution=False, solution=None, backend='list', table=None,
+               candidates='relevant', budget=None, stats=None):
+    # With a SearchBudget, raises BudgetExhausted when it runs out; the path
+    # being explored at that point is left in budget.best_path.
+    # With a SearchStats, fills it in (see search_stats.py).
+    with measure(stats):
+        if backend == 'bitboard':
+            return _dfs_search_bitboard(board_to_bitboard(state.board), state.remaining_pieces,
+                                        king_pos, find_solution, solution or [], candidates, budget,
+                                        stats, table=table,
+                                        key=state_key(state, king_pos) if table is not None else None)
+        if solution is None:
+            solution = []
+        # Search on CompactStates; the GameState is only read here
+        root = CompactState.from_game_state(state)
+        return _dfs_search_list(root, king_pos, AttackState(king_pos, state.board),
+                                find_solution, solution, table, candidates, budget=budget,
+                                stats=stats)
+
+def _dfs_search_list(root, king_pos, attack, find_solution, solution, table, candidates,
+                     limit=None, lower_bound=None, cutoff=None, budget=None, stats=None):
+    # Iterative make/unmake DFS. One position is mutated in place: the
+    # occupancy mask, the piece counts, the Zobrist key and the shared
+    # AttackState. Each placement is made, tested and unmade again, and
+    # stack holds one iterator of untried placements per level.
+    # Placements are made in increasing square order, so every set of
+    # placements is reached exactly once instead of once per ordering, and
+    # two pieces of the same type are never tried in both orders.
+    # With a limit, a position whose placements so far plus lower_bound()
+    # exceed it is not expanded; the smallest such total goes to cutoff[0].
+    if stats is not None:
+        stats.goal_tests += 1
+    if attack.in_check:
+        return solution if find_solution else True
+
+    size = root.size
+    counts = dict(root.inventory)
+    occupied = root.occupied
+    zobrist = root.zobrist
+    mirror_zobrist = root.mirror_zobrist
+    keys = zobrist_table(size)
+    king_key = keys['K'][king_pos[0]][king_pos[1]]
+    mirror_king_key = keys['K'][king_pos[0]][size - 1 - king_pos[1]]
+
+    def empty_squares():
+        return [divmod(square, size) for square in range(size * size) if not occupied >> square & 1]
+
+    def children(start):
+        # Untried placements of the current position, from square start on
+        pieces = [piece for piece, count in counts.items() if count > 0]
+        return iter([(row, col, piece) for row, col, piece in _candidates(pieces, attack, candidates, empty_squares)
+                     if row * size + col >= start])
+
+    def position_key():
+        # state_key() of the current position, kept incrementally
+        inventory_key = zobrist_inventory(counts, size)
+        return min(zobrist ^ inventory_key ^ king_key, mirror_zobrist ^ inventory_key ^ mirror_king_key)
+
+    def is_dead():
+        # A position with nothing left to place, or one the table knows to be unsolvable
+        if not any(counts.values()):
+            return True
+        if table is not None and position_key() in table:
+            if stats is not None:
+                stats.table_hits += 1
+            return True
+        return False
+
+    def over_limit():
+        pieces = [piece for piece, count in counts.items() if count > 0]
+        total = len(path) + lower_bound(attack, pieces)
+        if total > limit:
+            cutoff[0] = min(cutoff[0], total)
+            return True
+        return False
+
+    add = attack.add
+    if stats is not None:
+        # Placing a piece updates the attack map the goal test reads
+        add = stats.timed(attack.add, 'time_goal_test', 'goal_tests', 'nodes_generated')
+        children = stats.timed(children, 'time_expansion', 'nodes_expanded')
+
+    if is_dead():
         return [] if find_solution else False
-    
-    empty_squares = get_empty_squares(state.board)
-    
-    for row, col in empty_squares:
-        for piece, count in state.remaining_pieces.items():
-            if count > 0:
-                new_state = place_piece(state, piece, row, col)
-                new_solution = solution + [(piece, row, col)] if find_solution else []
-                result = dfs_search(new_state, king_pos, find_solution, new_solution)
-                if (find_solution and result) or (not find_solution and result):
-                    return result
+    root_key = position_key()
+
+    path = []
+    if budget is not None:
+        budget.expand(solution)
+    stack = [children(0)]
+    if stats is not None:
+        stats.frontier(1)
+    while stack:
+        placement = next(stack[-1], None)
+        if placement is None:
+            # Level exhausted: unmake the placement that led to it
+            stack.pop()
+            if path:
+                piece, row, col = path.pop()
+                attack.remove(row, col)
+                occupied ^= 1 << (row * size + col)
+                counts[piece] += 1
+                zobrist ^= keys[piece][row][col]
+                mirror_zobrist ^= keys[piece][row][size - 1 - col]
+            continue
+
+        row, col, piece = placement
+        add(piece, row, col)
+        occupied |= 1 << (row * size + col)
+        counts[piece] -= 1
+        zobrist ^= keys[piece][row][col]
+        mirror_zobrist ^= keys[piece][row][size - 1 - col]
+        path.append((piece, row, col))
+
+        if attack.in_check:
+            return solution + path if find_solution else True
+        if is_dead() or limit is not None and over_limit():
+            path.pop()
+            attack.remove(row, col)
+            occupied ^= 1 << (row * size + col)
+            counts[piece] += 1
+            zobrist ^= keys[piece][row][col]
+            mirror_zobrist ^= keys[piece][row][size - 1 - col]
+            continue
+        if budget is not None:
+            budget.expand(solution + path)
+        stack.append(children(row * size + col + 1))
+        if stats is not None:
+            stats.frontier(len(stack))
+
+    # Only a search over every square proves the root unsolvable; deeper
+    # levels skipped the squares before their start. A position cut off by
+    # the limit was not searched at all.
+    if table is not None and (cutoff is None or cutoff[0] == math.inf):
+        table.add(root_key)
+    return [] if find_solution else False
+
+# ============================================================================
+# Iterative deepening
+# ============================================================================
+# Both modes return a solution with the fewest placements. They run the
+# make/unmake DFS above under a growing limit on placements, so memory stays
+# linear in the depth instead of holding an A* frontier.
+
+def placements_lower_bound(attack, pieces):
+    """
+    Admissible lower bound on the placements still needed to give check.
+
+    A single placement that gives check is always enough, and pieces never
+    move, so if no remaining piece can check the King from any empty square
+    now, none ever will.
+
+    Args:
+        attack: AttackState of the current board
+        pieces: Piece types still available
+
+    Returns:
+        0 if the King is in check, 1 if a remaining piece can give check,
+        otherwise math.inf
+    """
+    if attack.in_check:
+        return 0
+    for _, attackers in attack.checking_squares():
+        if any(piece in attackers for piece in pieces):
+            return 1
+    return math.inf
+
+def _depth_bound(attack, pieces):
+    # Plain iterative deepening: one more placement unless in check or out of pieces
+    if attack.in_check:
+        return 0
+    return 1 if pieces else math.inf
+
+def iddfs_search(state, king_pos, table=None, candidates='relevant', budget=None, stats=None):
+    """
+    Iterative-deepening DFS: depth-limited searches with limits 1, 2, 3, ...
+
+    Returns:
+        Placement path with the fewest placements, or None if there is none
+    """
+    with measure(stats):
+        return _deepening_search(state, king_pos, table, candidates, _depth_bound, budget, stats)
+
+def idastar_search(state, king_pos, table=None, candidates='relevant', budget=None, stats=None):
+    """
+    IDA*: depth-first searches bounded by placements + placements_lower_bound().
+
+    Returns:
+        Placement path with the fewest placements, or None if there is none
+    """
+    with measure(stats):
+        return _deepening_search(state, king_pos, table, candidates, placements_lower_bound, budget, stats)
+
+# search_type values served by the iterative-deepening solvers
+DEEPENING_SEARCHES = {'iddfs': iddfs_search, 'idastar': idastar_search}
+
+def _deepening_search(state, king_pos, table, candidates, lower_bound, budget=None, stats=None):
+    if stats is not None:
+        lower_bound = stats.timed(lower_bound, 'time_heuristic')
+    root = CompactState.from_game_state(state)
+    attack = AttackState(king_pos, state.board)
+    limit = lower_bound(attack, root.pieces_left())
+    if limit == 0:
+        return []
+    while limit < math.inf:
+        cutoff = [math.inf]
+        path = _dfs_search_list(root, king_pos, attack, True, [], table, candidates,
+                                limit, lower_bound, cutoff, budget, stats)
+        if path:
+            return path
+        limit = cutoff[0]
+    if table is not None:
+        table.add(state_key(root, king_pos))
+    return None
+
+# ============================================================================
+# Bounded-memory searches
+# ============================================================================
+# A* keeps every generated child on its frontier. These two modes bound it:
+# beam search keeps a fixed number of nodes per placement count, weighted A*
+# orders by an admissible bound so it commits to a solution early. Both
+# return a shortest solution in this game (see their docstrings); pass a
+# SearchStats with trace_memory=True to see their peak memory.
+
+BEAM_WIDTH = 64
+WASTAR_WEIGHT = 2.0
+
+def beam_search(state, king_pos, width=BEAM_WIDTH, table=None, candidates='relevant', budget=None,
+                stats=None):
+    """
+    Beam search: breadth-first by placement count, keeping only the width
+    children with the best heuristic score at each level.
+
+    Children are goal-tested as they are generated, so every placement from
+    the root is tested before anything is pruned. If a position has any
+    solution it has a one-placement one (the piece giving check already
+    checks the board without the pieces placed before it), so pruning never
+    loses a solution and the result has the fewest placements.
+
+    Args:
+        width: Nodes kept per level; the frontier never holds more, whatever
+            the inventory
+
+    Returns:
+        Placement path with the fewest placements, or None if there is none
+    """
+    if width < 1:
+        raise ValueError(f"Beam width must be at least 1, got {width}")
+    with measure(stats):
+        return _beam_search(state, king_pos, width, table, candidates, budget, stats)
+
+def _beam_search(state, king_pos, width, table, candidates, budget, stats):
+    root = CompactState.from_game_state(state)
+    attack = AttackState(king_pos, state.board)
+    if attack.in_check:
+        return []
+    king_square, king_keys = _king_square_keys(tuple(king_pos), root.size)
+    heuristic_fn = compact_heuristic
+    if stats is not None:
+        heuristic_fn = stats.timed(compact_heuristic, 'time_heuristic')
+        clock = time.perf_counter
+
+    # Each beam entry carries its parent's AttackState and its own last
+    # placement; the node's own AttackState is built when it is expanded
+    beam = [(root, [], attack, None, heuristic_fn(root, king_pos))]
+    best_h = math.inf
+    while beam:
+        if stats is not None:
+            stats.frontier(len(beam))
+        # The width best children of the level: a heap whose top is the worst
+        # kept child, as (-score, -counter), so ties keep the earliest child
+        kept = []
+        kept_keys = set()
+        counter = 0
+        for node, path, attack, placement, node_h in beam:
+            if table is not None and state_key(node, king_pos) in table:
+                if stats is not None:
+                    stats.table_hits += 1
+                continue
+            if stats is not None:
+                start = clock()
+            if placement is not None:
+                attack = attack.copy()
+                attack.add(*placement)
+            # The node is not in check, so a child checks exactly when its
+            # piece attacks the King from its square
+            checks = dict(attack.checking_squares())
+            if stats is not None:
+                stats.time_goal_test += clock() - start
+            if budget is not None:
+                if node_h < best_h:
+                    best_h = node_h
+                    budget.best_path = path
+                budget.expand()
+            if stats is not None:
+                stats.nodes_expanded += 1
+                start, heuristic_time = clock(), stats.time_heuristic
+
+            placements = _candidates(node.pieces_left(), attack, candidates, node.empty_squares)
+            for index, (row, col, piece) in enumerate(placements):
+                if piece in checks.get((row, col), ()):
+                    if stats is not None:
+                        stats.goal_tests += index + 1
+                        stats.nodes_generated += index + 1
+                    return path + [(piece, row, col)]
+                child = node.place(piece, row, col)
+                key = _visited_key(child, king_square, king_keys)
+                if key in kept_keys:
+                    if stats is not None:
+                        stats.visited_hits += 1
+                    continue
+                h = heuristic_fn(child, king_pos)
+                counter += 1
+                if len(kept) < width:
+                    heapq.heappush(kept, (-h, -counter, key, child, path, attack, (piece, row, col)))
+                elif -h > kept[0][0]:
+                    kept_keys.discard(heapq.heapreplace(
+                        kept, (-h, -counter, key, child, path, attack, (piece, row, col)))[2])
+                else:
+                    continue
+                kept_keys.add(key)
+            if stats is not None:
+                stats.goal_tests += len(placements)
+                stats.nodes_generated += len(placements)
+                stats.time_expansion += clock() - start - (stats.time_heuristic - heuristic_time)
+        kept.sort(reverse=True)
+        beam = [(child, path + [placement], attack, placement, -h)
+                for h, _, _, child, path, attack, placement in kept]
+
+    if table is not None:
+        table.add(state_key(root, king_pos))
+    return None
+
+def wastar_search(state, king_pos, weight=WASTAR_WEIGHT, table=None, candidates='relevant',
+                  budget=None, stats=None):
+    """
+    Weighted A*: best-first on placements + weight * placements_lower_bound(),
+    ties broken by the threat heuristic.
+
+    The lower bound is admissible and consistent, so the solution found has
+    at most weight times the fewest placements. A child's bound is read from
+    its parent's checking squares (0 if its placement checks, 1 otherwise);
+    its exact bound is computed when it is popped, and a child that can no
+    longer give check is dropped then. A solvable position is therefore
+    solved after expanding the root alone (its checking children come first),
+    and an unsolvable one is dropped at the root, so the frontier never holds
+    more than one expansion, whatever the inventory.
+
+    Args:
+        weight: Weight w >= 1 on the lower bound; 1 is plain A*
+
+    Returns:
+        Placement path with at most weight times the fewest placements, or
+        None if there is none
+    """
+    if weight < 1:
+        raise ValueError(f"Weight must be at least 1, got {weight}")
+    with measure(stats):
+        return _wastar_search(state, king_pos, weight, table, candidates, budget, stats)
+
+def _wastar_search(state, king_pos, weight, table, candidates, budget, stats):
+    root = CompactState.from_game_state(state)
+    king_square, king_keys = _king_square_keys(tuple(king_pos), root.size)
+    heuristic_fn, lower_bound = compact_heuristic, placements_lower_bound
+    if stats is not None:
+        heuristic_fn = stats.timed(compact_heuristic, 'time_heuristic')
+        lower_bound = stats.timed(placements_lower_bound, 'time_heuristic')
+        clock = time.perf_counter
+
+    counter = 0
+    # Entries are (f, threat score, counter, state, PathNode, parent
+    # AttackState), with the root's f the best a non-checking state can have
+    frontier = [(weight, heuristic_fn(root, king_pos), counter, root, PathNode(),
+                 AttackState(king_pos, state.board))]
+    visited = set()
+    best_h = math.inf
+
+    while frontier:
+        _, h, _, current_state, node, attack = heapq.heappop(frontier)
+        key = _visited_key(current_state, king_square, king_keys)
+        if key in visited:
+            if stats is not None:
+                stats.visited_hits += 1
+            continue
+        visited.add(key)
+        if table is not None and state_key(current_state, king_pos) in table:
+            if stats is not None:
+                stats.table_hits += 1
+            continue
+        if stats is not None:
+            stats.goal_tests += 1
+            start = clock()
+        if node.parent is not None:
+            attack = attack.copy()
+            attack.add(*node.placement)
+        in_check = attack.in_check
+        if stats is not None:
+            stats.time_goal_test += clock() - start
+        if in_check:
+            return node.path()
+        pieces = current_state.pieces_left()
+        if lower_bound(attack, pieces) == math.inf:
+            continue
+        if budget is not None:
+            if h < best_h:
+                best_h = h
+                budget.best_path = node.path()
+            budget.expand()
+        if stats is not None:
+            stats.nodes_expanded += 1
+            start, heuristic_time = clock(), stats.time_heuristic
+
+        checks = dict(attack.checking_squares())
+        placements = _candidates(pieces, attack, candidates, current_state.empty_squares)
+        g = node.depth + 1
+        for row, col, piece in placements:
+            new_state = current_state.place(piece, row, col)
+            bound = 0 if piece in checks.get((row, col), ()) else 1
+            counter += 1
+            heapq.heappush(frontier, (g + weight * bound, heuristic_fn(new_state, king_pos), counter,
+                                      new_state, PathNode(node, (piece, row, col)), attack))
+        if stats is not None:
+            stats.nodes_generated += len(placements)
+            stats.time_expansion += clock() - start - (stats.time_heuristic - heuristic_time)
+            stats.frontier(len(frontier))
+
+    if table is not None:
+        table.add(state_key(root, king_pos))
+    return None
+
+# search_type values served by the bounded-memory solvers
+BOUNDED_SEARCHES = {'beam': beam_search, 'wastar': wastar_search}
+
+# ============================================================================
+# Bitboard backend
+# ============================================================================
+# Same search order and results as the list backend, but every node is a
+# Bitboard and the goal test is bitwise. The King is never stored in the
+# masks, so (as with board_to_string) a piece dropped on the King's square
+# is ignored by the goal test and by the visited-set key. Bitboard nodes
+# carry no Zobrist key, so a transposition table is only consulted for the
+# root position, and the root is recorded when the search proves it
+# unsolvable.
+
+def _astar_search_bitboard(state, king_pos, candidates, budget=None, stats=None, table=None):
+    if table is not None:
+        root_key = state_key(state, king_pos)
+        if root_key in table:
+            if stats is not None:
+                stats.table_hits += 1
+            return None
+    king_mask = ~square_bit(*king_pos)
+    start = board_to_bitboard(state.board)
+    frontier = []
+    heuristic_fn, attacked_fn = bitboard_heuristic, is_king_attacked
+    if stats is not None:
+        heuristic_fn = stats.timed(bitboard_heuristic, 'time_heuristic')
+        attacked_fn = stats.timed(is_king_attacked, 'time_goal_test', 'goal_tests')
+        clock = time.perf_counter
+
+    counter = 0
+    heapq.heappush(frontier, (heuristic_fn(start, king_pos), counter,
+                              start, state.remaining_pieces, PathNode()))
+
+    visited = set()
+    best_h = math.inf
+
+    while frontier:
+        f, _, board, remaining, node = heapq.heappop(frontier)
+        key = tuple(mask & king_mask for mask in board.key())
+
+        if key in visited:
+            if stats is not None:
+                stats.visited_hits += 1
+            continue
+        visited.add(key)
+        if attacked_fn(board, king_pos):
+            return node.path()
+        if budget is not None:
+            if f - node.depth < best_h:
+                best_h = f - node.depth
+                budget.best_path = node.path()
+            budget.expand()
+        if stats is not None:
+            stats.nodes_expanded += 1
+            expand_start, heuristic_time = clock(), stats.time_heuristic
+
+        placements = _bitboard_candidates(board, remaining, king_pos, candidates)
+        g = node.depth + 1
+        for row, col, piece in placements:
+            new_board = board.place(piece, row, col)
+            new_remaining = remaining.copy()
+            new_remaining[piece] -= 1
+
+            f_new = g + heuristic_fn(new_board, king_pos)
+            counter += 1
+            heapq.heappush(frontier, (f_new, counter, new_board, new_remaining,
+                                      PathNode(node, (piece, row, col))))
+        if stats is not None:
+            stats.nodes_generated += len(placements)
+            stats.time_expansion += clock() - expand_start - (stats.time_heuristic - heuristic_time)
+            stats.frontier(len(frontier))
+
+    if table is not None:
+        table.add(root_key)
+    return None
+
+def _dfs_search_bitboard(board, remaining, king_pos, find_solution, solution, candidates,
+                         budget=None, stats=None, start=0, depth=1, table=None, key=None):
+    # table and key (the root's state_key()) are passed for the root call only
+    if stats is not None:
+        stats.goal_tests += 1
+        clock = time.perf_counter
+        goal_start = clock()
+    in_check = is_king_attacked(board, king_pos)
+    if stats is not None:
+        stats.time_goal_test += clock() - goal_start
+    if in_check:
+        return solution if find_solution else True
+
+    if all(count == 0 for count in remaining.values()):
+        return [] if find_solution else False
+    if table is not None and key in table:
+        if stats is not None:
+            stats.table_hits += 1
+        return [] if find_solution else False
+    if budget is not None:
+        budget.expand(solution)
+
+    # Squares from start on only, as in _dfs_search_list
+    if stats is not None:
+        expand_start = clock()
+    placements = _bitboard_candidates(board, remaining, king_pos, candidates, start)
+    if stats is not None:
+        stats.nodes_expanded += 1
+        stats.time_expansion += clock() - expand_start
+        stats.frontier(depth)
+    for row, col, piece in placements:
+        if stats is not None:
+            stats.nodes_generated += 1
+        new_remaining = remaining.copy()
+        new_remaining[piece] -= 1
+        new_solution = solution + [(piece, row, col)] if find_solution else []
+        result = _dfs_search_bitboard(board.place(piece, row, col), new_remaining,
+                                      king_pos, find_solution, new_solution, candidates,
+                                      budget, stats, row * BOARD_SIZE + col + 1, depth + 1)
+        if result:
+            return result
+    if table is not None:
+        table.add(key)
     if find_solution:
         return []
     return False
@@ -129,21 +906,134 @@ def _create_game_state_from_board(current_board, remaining_pieces, king_pos):
     state.used_positions.add(king_pos)  # King position is also used
     return state
 
-def can_still_win(current_board, remaining_pieces, king_pos, search_type='astar'):
+def can_still_win(current_board, remaining_pieces, king_pos, search_type='astar',
+                  max_nodes=None, deadline=None, cancel=None, stats=None, beam_width=BEAM_WIDTH,
+                  weight=WASTAR_WEIGHT):
+    # 'astar' returns a solution path (or None). With any of max_nodes,
+    # deadline (a time.monotonic() value) or cancel (a CancellationToken),
+    # returns a SearchResult instead; a SearchStats passed as stats is filled
+    # in by these searches, and beam_width and weight configure the 'beam'
+    # and 'wastar' search types. Every other call only asks yes or no, which
+    # win_feasible() answers exactly without a search.
+    budget = make_budget(max_nodes, deadline, cancel)
+    if budget is None and search_type != 'astar':
+        return win_feasible(current_board, remaining_pieces, king_pos)
     state = _create_game_state_from_board(current_board, remaining_pieces, king_pos)
+    if budget is not None:
+        return _budgeted_solve(state, king_pos, search_type, budget, stats, beam_width, weight)
+    return astar_search(state, king_pos, table=TRANSPOSITION_TABLE, stats=stats)
+
+def win_feasible(current_board, remaining_pieces, king_pos):
+    """
+    Whether the King can still be checked, decided without a search.
+
+    Pieces never move and later placements can only block, so the King can
+    be checked exactly when it already is, or when some remaining piece
+    attacks it from an empty square before the nearest blocker of one of
+    its rays (or a Pawn from an empty Pawn square). The King's precomputed
+    rays (attack_tables.king_rays) answer that with one scan out to each
+    ray's nearest blocker, in a few microseconds. The answer is the one a
+    full search finds, and can_still_win() returns it for every yes-or-no call.
+
+    Args:
+        current_board: 2D list board without the King
+        remaining_pieces: Dict of piece counts still available
+        king_pos: (y, x) position of the King
+
+    Returns:
+        True if some sequence of placements can still give check
+    """
+    pieces = {piece for piece, count in remaining_pieces.items() if count > 0}
+    rays, pawn_squares = king_rays(king_pos, len(current_board))
+    for attackers, squares in rays:
+        placeable = not attackers.isdisjoint(pieces)
+        for y, x in squares:
+            piece = current_board[y][x]
+            if piece == '.':
+                if placeable:
+                    return True
+            else:
+                if piece in attackers:
+                    return True  # already in check
+                break
+    for y, x in pawn_squares:
+        piece = current_board[y][x]
+        if piece == 'P' or (piece == '.' and 'P' in pieces):
+            return True
+    return False
+
+def _is_dfs(search_type):
+    # Every search_type without a solver of its own runs DFS (the frontend
+    # passes 'none')
+    return (search_type != 'astar' and search_type not in DEEPENING_SEARCHES
+            and search_type not in BOUNDED_SEARCHES)
+
+def _solve_state(state, king_pos, search_type, budget=None, stats=None, beam_width=BEAM_WIDTH,
+                 weight=WASTAR_WEIGHT):
+    # Solution path for search_type, sharing the module transposition table
     if search_type == 'astar':
-        return astar_search(state, king_pos)
-    return dfs_search(state, king_pos)
+        return astar_search(state, king_pos, table=TRANSPOSITION_TABLE, budget=budget, stats=stats)
+    if search_type in DEEPENING_SEARCHES:
+        return DEEPENING_SEARCHES[search_type](state, king_pos, table=TRANSPOSITION_TABLE,
+                                               budget=budget, stats=stats)
+    if search_type == 'beam':
+        return beam_search(state, king_pos, beam_width, TRANSPOSITION_TABLE, budget=budget, stats=stats)
+    if search_type == 'wastar':
+        return wastar_search(state, king_pos, weight, TRANSPOSITION_TABLE, budget=budget, stats=stats)
+    return dfs_search(state, king_pos, find_solution=True, table=TRANSPOSITION_TABLE, budget=budget,
+                      stats=stats)
+
+def _budgeted_solve(state, king_pos, search_type, budget, stats=None, beam_width=BEAM_WIDTH,
+                    weight=WASTAR_WEIGHT):
+    # _solve_state() under a budget, as a SearchResult. A search stopped by
+    # the budget adds nothing to the transposition table: it only records
+    # states it finished proving unsolvable.
+    try:
+        path = _solve_state(state, king_pos, search_type, budget, stats, beam_width, weight)
+    except BudgetExhausted:
+        return SearchResult(BUDGET_EXHAUSTED, budget.best_path, budget.nodes)
+    if not path and _is_dfs(search_type):
+        # DFS returns [] both when unsolvable and when already in check
+        path = [] if AttackState(king_pos, state.board).in_check else None
+    return SearchResult(UNSOLVABLE if path is None else SOLVED, path, budget.nodes)
+
+_NOT_IN_TABLEBASE = object()
 
-def find_complete_solution(king_pos, available_pieces, board_size=8, search_type='astar'):
+def _tablebase_solution(king_pos, remaining_pieces, board_size, search_type):
+    # Empty-board solution from the tablebase. Every mode that returns a
+    # shortest solution can use it; plain DFS keeps its own first hit.
+    if _is_dfs(search_type):
+        return _NOT_IN_TABLEBASE
+    tablebase = get_tablebase()
+    if tablebase is None or board_size != tablebase.board_size:
+        return _NOT_IN_TABLEBASE
+    try:
+        return tablebase.lookup(king_pos, remaining_pieces)
+    except KeyError:
+        return _NOT_IN_TABLEBASE
+
+def find_complete_solution(king_pos, available_pieces, board_size=8, search_type='astar',
+                           max_nodes=None, deadline=None, cancel=None, stats=None,
+                           beam_width=BEAM_WIDTH, weight=WASTAR_WEIGHT):
+    # Budget, stats and search type arguments as for can_still_win(); with any budget
+    # argument, returns a SearchResult. A tablebase hit runs no search.
     initial_state = GameState(board_size)
     if available_pieces:
         initial_state.remaining_pieces = available_pieces.copy()
-    if search_type == 'astar':
-        solution = astar_search(initial_state, king_pos)
+    budget = make_budget(max_nodes, deadline, cancel)
+    solution = _tablebase_solution(king_pos, initial_state.remaining_pieces, board_size, search_type)
+    if solution is not _NOT_IN_TABLEBASE:
+        result = SearchResult(UNSOLVABLE if solution is None else SOLVED, solution, 0)
+    elif budget is not None:
+        result = _budgeted_solve(initial_state, king_pos, search_type, budget, stats, beam_width, weight)
+        solution = result.path if result.status == SOLVED else None
     else:
-        solution = dfs_search(initial_state, king_pos, find_solution=True)
+        solution = _solve_state(initial_state, king_pos, search_type, stats=stats,
+                                beam_width=beam_width, weight=weight)
     
+    if budget is not None and result.status == BUDGET_EXHAUSTED:
+        print("Search stopped before a solution was found")
+        return result
     if solution:
         current_state = GameState(board_size)
         for i, (piece, row, col) in enumerate(solution, 1):
@@ -153,17 +1043,27 @@ def find_complete_solution(king_pos, available_pieces, board_size=8, search_type
             # print(f"   Board state:\n{board_str}")
             # print(f"   Remaining pieces: {remaining_str}\n")
         print(f"   Board state:\n{board_str}")
-        return solution
+        return solution if budget is None else result
     else:
         print("No solution exists for this king position")
-        return None
+        return None if budget is None else result
 
-def find_remaining_solution(current_board, remaining_pieces, king_pos, search_type='astar'):
+def find_remaining_solution(current_board, remaining_pieces, king_pos, search_type='astar',
+                            max_nodes=None, deadline=None, cancel=None, stats=None,
+                            beam_width=BEAM_WIDTH, weight=WASTAR_WEIGHT):
+    # Budget, stats and search type arguments as for can_still_win(); with any
+    # budget argument, returns a SearchResult
     state = _create_game_state_from_board(current_board, remaining_pieces, king_pos)
-    if search_type == 'astar':
-        solution = astar_search(state, king_pos)#, find_solution=True)
+    budget = make_budget(max_nodes, deadline, cancel)
+    if budget is None:
+        solution = _solve_state(state, king_pos, search_type, stats=stats, beam_width=beam_width,
+                                weight=weight)
     else:
-        solution = dfs_search(state, king_pos, find_solution=True)
+        result = _budgeted_solve(state, king_pos, search_type, budget, stats, beam_width, weight)
+        if result.status == BUDGET_EXHAUSTED:
+            print("Search stopped before a solution was found")
+            return result
+        solution = result.path
     
     if solution:
         current_state = _create_game_state_from_board(current_board, remaining_pieces, king_pos)
@@ -176,11 +1076,91 @@ def find_remaining_solution(current_board, remaining_pieces, king_pos, search_ty
             # print(f"   Board state:\n{board_str}")
             # print(f"   Remaining pieces: {remaining_str}\n")
         print(f"   Board state:\n{board_str}")
-        return solution
+        return solution if budget is None else result
     else:
         print("No solution possible with remaining pieces")
-        return None
-    
+        return None if budget is None else result
+
+# ============================================================================
+# Batch solving
+# ============================================================================
+
+def solve_many(jobs, search_type='astar', max_workers=None, chunksize=None, max_nodes=None,
+               deadline=None, beam_width=BEAM_WIDTH, weight=WASTAR_WEIGHT):
+    """
+    Solve many positions on a pool of worker processes.
+
+    Args:
+        jobs: Iterable of (king_pos, board, inventory) tuples; board None means
+            an empty board (answered from the tablebase where possible) and
+            inventory None the default GameState inventory
+        search_type: Same values as find_remaining_solution()
+        max_workers: Number of processes (defaults to the CPU count); 1 solves
+            in this process without a pool
+        chunksize: Jobs sent to a worker at a time (defaults to about four
+            chunks per worker)
+        max_nodes: Node budget of each job, or None
+        deadline: time.monotonic() value every job stops at, or None
+        beam_width: Beam width for search_type 'beam'
+        weight: Weight for search_type 'wastar'
+
+    Yields:
+        (index, solution) pairs in completion order, where index is the job's
+        position in jobs and solution is a placement path or None. With
+        max_nodes or deadline, solution is a SearchResult instead. Nothing is
+        printed; stopping the iteration cancels the jobs not yet started.
+    """
+    indexed = list(enumerate(jobs))
+    if not indexed:
+        return
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(indexed) / (max_workers * 4)))
+    chunks = [indexed[i:i + chunksize] for i in range(0, len(indexed), chunksize)]
+
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _solve_chunk(chunk, search_type, max_nodes, deadline, beam_width, weight)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [pool.submit(_solve_chunk, chunk, search_type, max_nodes, deadline, beam_width, weight)
+                   for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        # Also runs when the caller stops iterating early
+        pool.shutdown(cancel_futures=True)
+
+def _solve_chunk(chunk, search_type, max_nodes=None, deadline=None, beam_width=BEAM_WIDTH,
+                 weight=WASTAR_WEIGHT):
+    # Runs in a worker process: solve a list of (index, job) pairs.
+    # time.monotonic() is system-wide, so the deadline holds across processes.
+    return [(index, _solve_job(job, search_type, make_budget(max_nodes, deadline), beam_width, weight))
+            for index, job in chunk]
+
+def _solve_job(job, search_type, budget=None, beam_width=BEAM_WIDTH, weight=WASTAR_WEIGHT):
+    king_pos, board, inventory = job
+    king_pos = tuple(king_pos)
+    if board is None:
+        state = GameState(BOARD_SIZE)
+        if inventory:
+            state.remaining_pieces = dict(inventory)
+        solution = _tablebase_solution(king_pos, state.remaining_pieces, BOARD_SIZE, search_type)
+        if solution is not _NOT_IN_TABLEBASE:
+            if budget is not None:
+                return SearchResult(UNSOLVABLE if solution is None else SOLVED, solution, 0)
+            return solution
+    else:
+        if inventory is None:
+            inventory = GameState(len(board)).remaining_pieces
+        state = _create_game_state_from_board(board, inventory, king_pos)
+    if budget is not None:
+        return _budgeted_solve(state, king_pos, search_type, budget, beam_width=beam_width, weight=weight)
+    return _solve_state(state, king_pos, search_type, beam_width=beam_width, weight=weight)
+
 if __name__ == "__main__":
     # Test finding a solution
     print("Testing solution finder...")
@@ -0,0 +1,106 @@
+"""
+Background solver for the game loop.
+
+SolverService runs one solver call at a time on a worker thread, so the
+frame loop keeps drawing while a search runs. Every job gets its own
+CancellationToken, passed to the solver as cancel=, and the frame loop polls
+the job instead of waiting for it. A worker thread (not a process) is used
+because the token is a threading.Event; the solvers read it every
+CHECK_INTERVAL nodes, so a cancelled job stops within a few milliseconds.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from search_budget import CancellationToken
+
+
+class SolverJob:
+    """
+    One submitted solver call.
+
+    Args:
+        kind: Caller's label for the job, e.g. 'hint'
+        future: concurrent.futures.Future of the call
+        token: CancellationToken passed to the call
+    """
+    __slots__ = ('kind', 'future', 'token')
+
+    def __init__(self, kind, future, token):
+        self.kind = kind
+        self.future = future
+        self.token = token
+
+    def done(self):
+        return self.future.done()
+
+    def result(self):
+        """The call's return value; re-raises its exception. Blocks until done."""
+        return self.future.result()
+
+    def cancel(self):
+        """Stop the call: drop it if not started yet, otherwise cancel its token."""
+        self.token.cancel()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self.token.cancelled
+
+
+class SolverService:
+    """
+    Runs solver calls on a single worker thread, one job at a time.
+
+    Submitting a job cancels the one in flight, so only the latest request is
+    ever answered.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='solver')
+        self.job = None
+
+    @property
+    def busy(self):
+        """True while a job is queued or running."""
+        return self.job is not None
+
+    def submit(self, kind, fn, *args, **kwargs):
+        """
+        Start fn(*args, cancel=token, **kwargs) on the worker thread.
+
+        Arguments are not copied: pass copies of anything the caller goes on
+        mutating (boards, inventories).
+
+        Returns:
+            The new SolverJob
+        """
+        self.cancel()
+        token = CancellationToken()
+        future = self._executor.submit(fn, *args, cancel=token, **kwargs)
+        self.job = SolverJob(kind, future, token)
+        return self.job
+
+    def poll(self):
+        """
+        Non-blocking check for the current job, meant to be called every frame.
+
+        Returns:
+            The finished SolverJob (it is no longer current), or None if there
+            is no job or it is still running
+        """
+        job = self.job
+        if job is None or not job.done():
+            return None
+        self.job = None
+        return job
+
+    def cancel(self):
+        """Cancel the current job, if any; its result is never returned by poll()."""
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+
+    def shutdown(self):
+        """Cancel the current job and stop the worker thread."""
+        self.cancel()
+        self._executor.shutdown(wait=False)
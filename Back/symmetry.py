@@ -0,0 +1,58 @@
+"""
+Left-right mirror symmetry.
+
+Every attack rule is unchanged when the columns are mirrored (x -> size-1-x),
+the Pawn's abs(px - kx) == 1 included. So a position and its mirror image are
+either both solvable or both not, and a solution of one mirrors into a
+solution of the other. Caches can store the canonical form only: the one
+whose King is in the left half of the board.
+"""
+
+from attack_tables import BOARD_SIZE
+
+
+def mirror_square(row, col, size=BOARD_SIZE):
+    """Return (row, col) mirrored across the vertical center line."""
+    return row, size - 1 - col
+
+
+def mirror_board(board):
+    """Return a mirrored copy of a 2D list board."""
+    return [row[::-1] for row in board]
+
+
+def mirror_path(path, size=BOARD_SIZE):
+    """Mirror every (piece, row, col) placement of a solution path."""
+    if path is None:
+        return None
+    return [(piece, row, size - 1 - col) for piece, row, col in path]
+
+
+def is_canonical_king(king_pos, size=BOARD_SIZE):
+    """True if the King is in the left half (or on the center column of an odd board)."""
+    return king_pos[1] <= (size - 1) // 2
+
+
+def canonicalize(board, king_pos):
+    """
+    Map a position to its mirror-canonical form.
+
+    Args:
+        board: 2D list board
+        king_pos: (y, x) position of the King
+
+    Returns:
+        (board, king_pos, mirrored): the canonical position, and whether it
+        is the mirror image of the input (so results must be mirrored back)
+    """
+    size = len(board)
+    ky, kx = king_pos
+    if kx * 2 + 1 == size:
+        # King on the center column: both halves qualify, pick the smaller board
+        mirrored = mirror_board(board)
+        if mirrored < board:
+            return mirrored, king_pos, True
+        return board, king_pos, False
+    if is_canonical_king(king_pos, size):
+        return board, king_pos, False
+    return mirror_board(board), mirror_square(ky, kx, size), True
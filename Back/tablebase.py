@@ -0,0 +1,219 @@
+"""
+Precomputed solution tablebase for the empty board.
+
+For every King square in the left half of the board and every inventory
+within TABLEBASE_LIMITS the file holds the solution find_complete_solution()
+would search for; Kings in the right half are answered from their mirror
+image (see symmetry.py). On an empty board a single placement that gives
+check is always the shortest solution, so each entry is one little-endian
+uint16: piece index << 6 | square, or NO_SOLUTION. The reader memory-maps
+the file, so a lookup is one unpack at a computed offset.
+
+File layout:
+    magic (4 bytes) | version, board size (2 x uint8) | max count per piece
+    in PIECE_TYPES order (4 x uint8) | 8 rows x 4 King columns x
+    inventory-count records
+
+Usage: python3 Back/tablebase.py [output path]
+"""
+
+import mmap
+import os
+import struct
+import sys
+from itertools import product
+
+from attack_tables import BOARD_SIZE, PIECE_TYPES
+from symmetry import is_canonical_king, mirror_path, mirror_square
+
+
+# ============================================================================
+# Format
+# ============================================================================
+
+MAGIC = b'CKTB'
+VERSION = 2
+HEADER = struct.Struct('<4sBB4B')
+RECORD = struct.Struct('<H')
+NO_SOLUTION = 0xFFFF
+
+# Largest count of each piece type covered, in PIECE_TYPES order
+TABLEBASE_LIMITS = {'Q': 1, 'R': 2, 'B': 2, 'P': 8}
+
+TABLEBASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tablebase.bin')
+
+
+def inventory_index(inventory, limits=TABLEBASE_LIMITS):
+    """
+    Position of an inventory among all inventories within limits.
+
+    Args:
+        inventory: Dict of piece counts (missing pieces count as 0)
+        limits: Largest count of each piece type
+
+    Returns:
+        Index in [0, number of inventories), or None if not covered
+    """
+    if any(count and piece not in limits for piece, count in inventory.items()):
+        return None
+    index = 0
+    for piece in PIECE_TYPES:
+        count = inventory.get(piece, 0)
+        if not 0 <= count <= limits[piece]:
+            return None
+        index = index * (limits[piece] + 1) + count
+    return index
+
+
+def _inventories(limits):
+    # Every inventory within limits, in inventory_index() order
+    ranges = [range(limits[piece] + 1) for piece in PIECE_TYPES]
+    for counts in product(*ranges):
+        yield dict(zip(PIECE_TYPES, counts))
+
+
+def _king_columns(size):
+    # King columns stored per row: the left half, plus the center column of an odd board
+    return (size + 1) // 2
+
+
+def _encode(solution):
+    if solution is None:
+        return NO_SOLUTION
+    (piece, row, col), = solution
+    return PIECE_TYPES.index(piece) << 6 | (row * BOARD_SIZE + col)
+
+
+def _decode(record):
+    if record == NO_SOLUTION:
+        return None
+    row, col = divmod(record & 0x3F, BOARD_SIZE)
+    return [(PIECE_TYPES[record >> 6], row, col)]
+
+
+# ============================================================================
+# Generator
+# ============================================================================
+
+def generate_tablebase(path=TABLEBASE_PATH, limits=TABLEBASE_LIMITS):
+    """
+    Solve every (King square, inventory) pair and write the tablebase file.
+
+    Entries are the A* solutions find_complete_solution() returns for an
+    inventory in Q, R, B, P order. Only Kings in the left half are solved.
+
+    Args:
+        path: Output file
+        limits: Largest count of each piece type
+
+    Returns:
+        Number of entries written
+    """
+    # Imported here: solver itself reads the tablebase
+    from gamestate import GameState
+    from solver import astar_search
+
+    records = bytearray()
+    for row in range(BOARD_SIZE):
+        for col in range(_king_columns(BOARD_SIZE)):
+            king_pos = (row, col)
+            for inventory in _inventories(limits):
+                state = GameState(BOARD_SIZE)
+                state.remaining_pieces = dict(inventory)
+                solution = astar_search(state, king_pos)
+                if solution is not None and len(solution) != 1:
+                    raise ValueError(f"Empty-board solution for King {king_pos}, {inventory} "
+                                     f"is not a single placement: {solution}")
+                records += RECORD.pack(_encode(solution))
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, BOARD_SIZE, *(limits[p] for p in PIECE_TYPES)))
+        f.write(records)
+    return len(records) // RECORD.size
+
+
+# ============================================================================
+# Reader
+# ============================================================================
+
+class Tablebase:
+    """
+    Memory-mapped tablebase reader.
+
+    Args:
+        path: Tablebase file written by generate_tablebase()
+    """
+
+    def __init__(self, path=TABLEBASE_PATH):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{path} is not a tablebase file")
+        magic, version, size, *maxima = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} tablebase file")
+        self.board_size = size
+        self.limits = dict(zip(PIECE_TYPES, maxima))
+        self._inventories = 1
+        for count in maxima:
+            self._inventories *= count + 1
+        expected = HEADER.size + size * _king_columns(size) * self._inventories * RECORD.size
+        if len(self._map) != expected:
+            raise ValueError(f"{path} is truncated or corrupt")
+
+    def _offset(self, king_pos, inventory):
+        # Offset of the record for a King in the left half
+        index = inventory_index(inventory, self.limits)
+        ky, kx = king_pos
+        if index is None or not (0 <= ky < self.board_size and 0 <= kx < self.board_size):
+            return None
+        if not is_canonical_king(king_pos, self.board_size):
+            ky, kx = mirror_square(ky, kx, self.board_size)
+        square = ky * _king_columns(self.board_size) + kx
+        return HEADER.size + (square * self._inventories + index) * RECORD.size
+
+    def __contains__(self, key):
+        king_pos, inventory = key
+        return self._offset(king_pos, inventory) is not None
+
+    def lookup(self, king_pos, inventory):
+        """
+        Stored solution for a King square and an inventory.
+
+        Returns:
+            List with one (piece, row, col) placement, or None if unsolvable
+
+        Raises:
+            KeyError: If the pair is not covered by the tablebase
+        """
+        offset = self._offset(king_pos, inventory)
+        if offset is None:
+            raise KeyError((king_pos, inventory))
+        record, = RECORD.unpack_from(self._map, offset)
+        solution = _decode(record)
+        if is_canonical_king(king_pos, self.board_size):
+            return solution
+        return mirror_path(solution, self.board_size)
+
+    def close(self):
+        self._map.close()
+
+
+_default_tablebase = None
+
+
+def get_tablebase():
+    """The shared reader for TABLEBASE_PATH, or None if the file is missing or invalid."""
+    global _default_tablebase
+    if _default_tablebase is None:
+        try:
+            _default_tablebase = Tablebase(TABLEBASE_PATH)
+        except (OSError, ValueError):
+            return None
+    return _default_tablebase
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else TABLEBASE_PATH
+    count = generate_tablebase(output)
+    print(f"Wrote {count} entries to {output}")
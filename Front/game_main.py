@@ -6,8 +6,12 @@ import os
 # Import backend functionality
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Back'))
 from gamestate import GameState
+from attack_state import AttackState
+from belief import KingBelief
 import checkmate as checkmate_mod
 import solver as solver_mod
+from search_budget import BUDGET_EXHAUSTED, SOLVED
+from solver_service import SolverService
 import random
 import chessgame
 
@@ -250,6 +254,10 @@ class GameScene():
         # Generate random king position
         self.king_pos = (random.randint(0, BOARD_SIZE-1), random.randint(0, BOARD_SIZE-1))
         self.game_state.used_positions.add(self.king_pos)
+        # Incremental attack map: updated per placement, answers check in O(1)
+        self.attack_state = AttackState(self.king_pos, size=BOARD_SIZE)
+        # Squares the hidden King can still be on, as far as the player knows
+        self.belief = KingBelief()
         
         # Game state variables
         self.game_won = False
@@ -264,6 +272,9 @@ class GameScene():
         # threat level (0-100). updated by update_threat_level()
         self.threat_level = 0
 
+        # Hint and can-still-win searches run here, polled once per frame
+        self.solver = SolverService()
+
         # spawn stock icons with counts from settings
         x_offset = 20
         for name, count in settings.items():
@@ -279,9 +290,14 @@ class GameScene():
              backend_piece = PIECE_MAPPING[piece_name]
              self.game_state.board[row][col] = backend_piece
              self.game_state.remaining_pieces[backend_piece] -= 1
+             self.attack_state.add(backend_piece, row, col)
+             # A search still running answers for the old position
+             self.solver.cancel()
              chessgame.display_board(self.game_state.board, hide_king=True)
              # Check win conditions
              self.check_win_conditions(row, col)
+             if not self.game_won:
+                 self.belief.observe(backend_piece, row, col)
      
     def check_win_conditions(self, row, col):
         # """Check if the game is won after placing a piece"""
@@ -292,18 +308,13 @@ class GameScene():
             self.show_king = True
             return
         
-        # Check for checkmate
-        board_str = self.board_to_string()
-        # Prefer A* checkmate if requested and available
-        if self.use_astar and hasattr(checkmate_mod, "checkmate_astar"):
-            result = checkmate_mod.checkmate_astar(board_str)
-            if isinstance(result, tuple):
-                in_check, threat = result[0], result[1]
-            else:
-                in_check = bool(result)
-                threat = 0
+        # Check for checkmate: the attack map is kept up to date per placement
+        in_check = self.attack_state.in_check
+        # A* mode additionally scores the threat level for the UI
+        if self.use_astar and hasattr(checkmate_mod, "checkmate_astar_board"):
+            result = checkmate_mod.checkmate_astar_board(self.game_state.board, self.king_pos)
+            threat = result[1] if isinstance(result, tuple) else 0
         else:
-            in_check = checkmate_mod.checkmate(board_str)
             threat = 0
 
         # store latest threat level for UI
@@ -334,29 +345,61 @@ class GameScene():
         return '\n'.join(' '.join(row) for row in test_board)
 
     def update_threat_level(self):
-        """Recompute threat level for UI (0-100). Calls checkmate_astar if available."""
-        board_str = self.board_to_string()
-        lamb ,threat = checkmate_mod.checkmate_astar(board_str)
+        """Recompute threat level for UI (0-100). Calls checkmate_astar_board if available."""
+        lamb ,threat = checkmate_mod.checkmate_astar_board(self.game_state.board, self.king_pos)
         self.threat_level = threat
 
+    def search_type(self):
+        """Solver variant for this scene: A* if requested, otherwise DFS"""
+        return 'astar' if self.use_astar else 'none'
+
     def can_still_win(self):
-        """Check if it's still possible to win with remaining pieces"""
-        # Prefer A* solver variant if requested and available, otherwise fallback
-        if self.use_astar:
-            return solver_mod.can_still_win(self.game_state.board, self.game_state.remaining_pieces, self.king_pos, 'astar')
+        """Print and return whether it's still possible to win with the remaining pieces"""
+        # Answered from the King's attack lines in microseconds: no search needed
+        can_win = solver_mod.win_feasible(self.game_state.board, self.game_state.remaining_pieces,
+                                          self.king_pos)
+        if can_win:
+            print("Still possible to win!")
         else:
-            return solver_mod.can_still_win(self.game_state.board, self.game_state.remaining_pieces, self.king_pos, 'none')
-    
+            print("No possible way to catch the King!")
+        return can_win
+
+    def recommend_placement(self):
+        """Suggest the placement that catches the most possible King squares"""
+        # Uses only what the player knows, never self.king_pos
+        best = self.belief.recommend(self.game_state.remaining_pieces)
+        if best is None:
+            print("No piece left to place!")
+            return
+        (piece, row, col), caught = best
+        print(f"King on one of {len(self.belief)} squares: "
+              f"{piece} at ({row}, {col}) catches it on {caught} of them")
+
     def show_solution(self):
+        """Start searching for the complete solution in the background"""
+        self.solver.submit('solution', solver_mod.find_complete_solution, self.king_pos,
+                           self.game_state.remaining_pieces.copy(), BOARD_SIZE, self.search_type())
+
+    def poll_solver(self):
+        """Handle the background search once it finishes (called every frame)"""
+        job = self.solver.poll()
+        if job is None:
+            return
+        try:
+            result = job.result()
+        except Exception as error:
+            # A failed search only loses the hint, never the game
+            print(f"Solver failed: {error!r}")
+            return
+        if result.status == BUDGET_EXHAUSTED:
+            return  # cancelled
+        self.apply_solution(result.path if result.status == SOLVED else None)
+
+    def apply_solution(self, solution):
         """Display the complete solution on the board"""
-        # Get the complete solution - prefer A* variant if requested and available
-        if self.use_astar:
-            solution = solver_mod.find_complete_solution(self.king_pos, self.game_state.remaining_pieces, BOARD_SIZE, 'astar')
-        else:
-            solution = solver_mod.find_complete_solution(self.king_pos, self.game_state.remaining_pieces, BOARD_SIZE, 'none')
         print(self.game_state.remaining_pieces)
          
-        if solution:
+        if solution and not self.game_over:
             # Clear current board
             
             # Place all pieces from the solution
@@ -382,6 +425,7 @@ class GameScene():
                     
                     # Update backend state
                     self.game_state.board[row][col] = piece_type
+                    self.attack_state.add(piece_type, row, col)
             
             # Show the king
             self.show_king = True
@@ -396,6 +440,9 @@ class GameScene():
     
     def restart_game(self):
         """Restart the game with the same settings"""
+        # Drop any search for the old King position
+        self.solver.cancel()
+
         # Clear all placed pieces
         GameScene.placed_positions.clear()
         
@@ -415,6 +462,8 @@ class GameScene():
         # Generate new random king position
         self.king_pos = (random.randint(0, BOARD_SIZE-1), random.randint(0, BOARD_SIZE-1))
         self.game_state.used_positions.add(self.king_pos)
+        self.attack_state = AttackState(self.king_pos, size=BOARD_SIZE)
+        self.belief = KingBelief()
         
         # Reset game state variables
         self.game_won = False
@@ -437,6 +486,7 @@ class GameScene():
     def return_to_home(self):
         """Return to settings menu to choose new piece counts"""
         from game_menu import SettingScene
+        self.solver.shutdown()
         self.game.change_scene(SettingScene(self.game))
         self.running = False  # Exit the game loop to switch scenes
     
@@ -445,15 +495,15 @@ class GameScene():
             if event.key == pygame.K_ESCAPE:
                 self.game.running = False
             elif event.key == pygame.K_h and not self.game_over:
-                # Show AI hint
+                # Show AI hint (once the background search finishes)
                 play_sfx(LOSE_SFX)  # Play button click sound
                 self.show_solution()
             elif event.key == pygame.K_a and not self.game_over:
-                # Check if still possible to win
-                if self.can_still_win():
-                    print("Still possible to win!")
-                else:
-                    print("No possible way to catch the King!")
+                # Check if still possible to win; answered and printed right away
+                self.can_still_win()
+            elif event.key == pygame.K_b and not self.game_over:
+                # Best placement without knowing where the King is
+                self.recommend_placement()
             elif event.key == pygame.K_r and self.game_over:
                 # Reset the game with the same settings
                 self.restart_game()
@@ -477,6 +527,9 @@ class GameScene():
                 # Handle game events
                 self.handle_event(event)
 
+            # Pick up a finished background search without waiting for one
+            self.poll_solver()
+
             # Update all pieces with the event list
             new_pieces = []
             for piece in list(self.pieces):
@@ -537,6 +590,8 @@ class GameScene():
             pygame.display.flip()
             clock.tick(60)
 
+        # Leaving the scene: stop any search still running
+        self.solver.cancel()
         # Don't quit pygame here - return control to main game loop
     
     def draw_game_status(self, screen):
@@ -562,10 +617,17 @@ class GameScene():
             menu_rect = menu_text.get_rect(center=(SCREEN_W // 2, 120))
             screen.blit(menu_text, menu_rect)
         
+        # Background search indicator, with dots cycling while it runs
+        if self.solver.busy:
+            dots = '.' * (pygame.time.get_ticks() // 300 % 3 + 1)
+            text = self.small_font.render("Thinking" + dots, True, (0, 0, 0))
+            screen.blit(text, (10, 25))
+
         # Draw controls hint (only during gameplay)
         if not self.game_over:
             controls = [
                 "Press H for solution",
+                "Press B for best guess",
             ]
             
             y_offset = 50
@@ -291,6 +291,9 @@ class SettingScene(Scene):
 class Game:
     def __init__(self):
         pygame.init()
+        # The solver runs on a worker thread (SolverService); a 1 ms GIL switch
+        # interval instead of 5 ms lets the frame loop take the GIL back on time
+        sys.setswitchinterval(0.001)
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.time.Clock()
         self.running = True
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the precomputed attack tables.
+Compares the table-driven is_piece_attacking_king against the original
+square-by-square implementation on a random position corpus, both directly
+and through heuristic(), checkmate() and checkmate_astar(). The solvers are
+not timed: their goal test is AttackState, which does not use the tables.
+
+Usage: python3 benchmarks/bench_attack_tables.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+import checkmate as checkmate_mod
+import solver
+
+
+# ============================================================================
+# Original implementation (reference for the "before" numbers)
+# ============================================================================
+
+def legacy_has_clear_path(board, from_y, from_x, to_y, to_x):
+    dy = 0 if from_y == to_y else (1 if to_y > from_y else -1)
+    dx = 0 if from_x == to_x else (1 if to_x > from_x else -1)
+    y, x = from_y + dy, from_x + dx
+    while (y, x) != (to_y, to_x):
+        if board[y][x] != '.':
+            return False
+        y, x = y + dy, x + dx
+    return True
+
+
+def legacy_is_piece_attacking_king(piece, piece_pos, king_pos, board):
+    py, px = piece_pos
+    ky, kx = king_pos
+    if piece == 'P':
+        return (py == ky + 1 and abs(px - kx) == 1)
+    same_row = (py == ky)
+    same_col = (px == kx)
+    same_diagonal = (abs(py - ky) == abs(px - kx))
+    if piece == 'R':
+        return (same_row or same_col) and legacy_has_clear_path(board, py, px, ky, kx)
+    if piece == 'B':
+        return same_diagonal and legacy_has_clear_path(board, py, px, ky, kx)
+    if piece == 'Q':
+        return (same_row or same_col or same_diagonal) and legacy_has_clear_path(board, py, px, ky, kx)
+    return False
+
+
+def legacy_heuristic(board, king_pos):
+    score = 0
+    ky, kx = king_pos
+    for y in range(len(board)):
+        for x in range(len(board)):
+            piece = board[y][x]
+            if piece == '.':
+                continue
+            dist = abs(ky - y) + abs(kx - x)
+            if piece == 'Q':
+                score += 5 / (dist + 1)
+            elif piece == 'R':
+                if y == ky or x == kx:
+                    score += 4 / (dist + 1)
+            elif piece == 'B':
+                if abs(ky - y) == abs(kx - x):
+                    score += 3 / (dist + 1)
+            elif piece == 'P':
+                if ky == y - 1 and abs(kx - x) == 1:
+                    score += 2
+    return -score
+
+
+# ============================================================================
+# Corpus
+# ============================================================================
+
+def random_position(rng, num_pieces):
+    board = [['.'] * 8 for _ in range(8)]
+    squares = rng.sample(range(64), num_pieces + 1)
+    king_pos = divmod(squares[0], 8)
+    for sq in squares[1:]:
+        y, x = divmod(sq, 8)
+        board[y][x] = rng.choice('QRBPPP')
+    return board, king_pos
+
+
+def to_string(board, king_pos):
+    test_board = [row[:] for row in board]
+    test_board[king_pos[0]][king_pos[1]] = 'K'
+    return '\n'.join(' '.join(row) for row in test_board)
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(label, fn):
+    """Time fn with the table engine, then with the legacy implementations patched in."""
+    table_time = timed(fn)
+    originals = (checkmate_mod.is_piece_attacking_king, solver.heuristic)
+    checkmate_mod.is_piece_attacking_king = legacy_is_piece_attacking_king
+    solver.heuristic = legacy_heuristic
+    try:
+        legacy_time = timed(fn)
+    finally:
+        checkmate_mod.is_piece_attacking_king, solver.heuristic = originals
+    print(f"{label:<28} legacy {legacy_time * 1000:8.1f} ms   "
+          f"table {table_time * 1000:8.1f} ms   speedup x{legacy_time / table_time:.2f}")
+
+
+def main():
+    rng = random.Random(1234)
+    corpus = [random_position(rng, rng.randint(1, 12)) for _ in range(2000)]
+    strings = [to_string(board, king_pos) for board, king_pos in corpus]
+    queries = []
+    for board, king_pos in corpus:
+        for y in range(8):
+            for x in range(8):
+                if board[y][x] != '.':
+                    queries.append((board[y][x], (y, x), king_pos, board))
+
+    # Sanity check: both implementations agree on every query
+    for query in queries:
+        assert checkmate_mod.is_piece_attacking_king(*query) == legacy_is_piece_attacking_king(*query)
+
+    print(f"Corpus: {len(corpus)} positions, {len(queries)} attack queries\n")
+
+    def direct():
+        attack = checkmate_mod.is_piece_attacking_king
+        for query in queries:
+            attack(*query)
+
+    compare("is_piece_attacking_king", direct)
+    compare("heuristic()", lambda: [solver.heuristic(board, king_pos) for board, king_pos in corpus])
+    compare("checkmate()", lambda: [checkmate_mod.checkmate(s) for s in strings])
+    compare("checkmate_astar()", lambda: [checkmate_mod.checkmate_astar(s) for s in strings])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the hidden-King belief state.
+Times KingBelief.recommend() as the board fills up, then plays one game per
+King square with a small piece set: once following the recommendations and
+once placing at random, and prints how often and how fast each one wins.
+
+Usage: python3 benchmarks/bench_belief.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+from belief import KingBelief
+from bitboard import Bitboard, is_king_attacked, square_bit
+
+REPEAT = 200
+PIECES = {'Q': 0, 'R': 1, 'B': 1, 'P': 3}
+
+
+def recommended(belief, remaining, rng):
+    return belief.recommend(remaining)[0]
+
+
+def at_random(belief, remaining, rng):
+    piece = rng.choice([piece for piece, count in remaining.items() if count > 0])
+    empty = [(y, x) for y in range(8) for x in range(8) if not belief.occupied & square_bit(y, x)]
+    return (piece, *rng.choice(empty))
+
+
+def play(choose, king_pos, rng):
+    # Number of placements until the King is caught, or None if it never is
+    remaining = dict(PIECES)
+    belief = KingBelief()
+    bitboard = Bitboard()
+    for placements in range(1, sum(PIECES.values()) + 1):
+        piece, row, col = choose(belief, remaining, rng)
+        remaining[piece] -= 1
+        bitboard = bitboard.place(piece, row, col)
+        if (row, col) == king_pos or is_king_attacked(bitboard, king_pos):
+            return placements
+        belief.observe(piece, row, col)
+    return None
+
+
+def main():
+    full = {'Q': 1, 'R': 2, 'B': 2, 'P': 8}
+    belief = KingBelief()
+    print("recommend(), full piece set, following its own advice:")
+    placed = 0
+    while len(belief):
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            best = belief.recommend(full)
+        elapsed = (time.perf_counter() - start) / REPEAT
+        print(f"  {placed:2d} placed, {len(belief):2d} candidates: {elapsed * 1000:.2f} ms")
+        (piece, row, col), _ = best
+        belief.observe(piece, row, col)
+        full[piece] -= 1
+        placed += 1
+
+    print(f"\nOne game per King square with {PIECES}:")
+    rng = random.Random(0)
+    for name, choose in (("recommended", recommended), ("random", at_random)):
+        results = [play(choose, (y, x), rng) for y in range(8) for x in range(8)]
+        wins = [placements for placements in results if placements is not None]
+        average = sum(wins) / len(wins) if wins else 0
+        print(f"  {name:12s} won {len(wins):2d}/64, {average:.1f} placements per win")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the relevant-placement candidate generator.
+Runs dfs_search and astar_search with candidates='all' (every piece on every
+empty square) and candidates='relevant' (only placements that give check),
+and reports nodes generated (SearchStats), time and whether both found a
+solution.
+
+Usage: python3 benchmarks/bench_candidates.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+import solver
+from gamestate import GameState
+from search_stats import SearchStats
+
+
+def make_state(board_pieces, remaining):
+    state = GameState(8)
+    for piece, row, col in board_pieces:
+        state.board[row][col] = piece
+    state.remaining_pieces = dict(remaining)
+    return state
+
+
+def run(search, board_pieces, remaining, king_pos, candidates):
+    """Run one search, returning its result, the nodes it generated and its time."""
+    stats = SearchStats()
+    start = time.perf_counter()
+    if search == 'dfs':
+        result = solver.dfs_search(make_state(board_pieces, remaining), king_pos,
+                                   find_solution=True, candidates=candidates, stats=stats)
+    else:
+        result = solver.astar_search(make_state(board_pieces, remaining), king_pos,
+                                     candidates=candidates, stats=stats)
+    elapsed = time.perf_counter() - start
+    return result, stats.nodes_generated, elapsed
+
+
+def main():
+    enclosed = [('B', 0, 1), ('B', 1, 0), ('R', 1, 1)]
+    midgame = [('P', 2, 3), ('P', 4, 1), ('B', 3, 4), ('R', 0, 2)]
+    cases = [
+        ("empty board, full set", [], {'Q': 1, 'R': 2, 'B': 2, 'P': 8}, (3, 4)),
+        ("empty board, pawns only", [], {'Q': 0, 'R': 0, 'B': 0, 'P': 2}, (2, 6)),
+        ("mid-game, R+B+P left", midgame, {'Q': 0, 'R': 1, 'B': 1, 'P': 1}, (1, 5)),
+        ("unsolvable, King on last rank", [], {'Q': 0, 'R': 0, 'B': 0, 'P': 2}, (7, 3)),
+        ("unsolvable, King walled in", enclosed, {'Q': 0, 'R': 0, 'B': 1, 'P': 1}, (0, 0)),
+    ]
+    print(f"{'case':<32} {'search':<6} {'all':>22} {'relevant':>20} {'pruned':>8}")
+    for label, pieces, remaining, king_pos in cases:
+        for search in ('dfs', 'astar'):
+            found_all, nodes_all, time_all = run(search, pieces, remaining, king_pos, 'all')
+            found_rel, nodes_rel, time_rel = run(search, pieces, remaining, king_pos, 'relevant')
+            assert bool(found_all) == bool(found_rel), "pruning must not lose solutions"
+            pruned = 1 - nodes_rel / nodes_all if nodes_all else 0
+            print(f"{label:<32} {search:<6} {nodes_all:9d} n {time_all * 1000:8.1f} ms "
+                  f"{nodes_rel:7d} n {time_rel * 1000:8.2f} ms {pruned:7.1%}")
+
+
+if __name__ == "__main__":
+    main()
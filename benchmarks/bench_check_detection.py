@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the check detectors.
+Times the BFS flood fill, the A* search and the ray-cast detector on a
+random position corpus, both through the string API and the parse-free
+board API, and verifies that all three agree. The NumPy batch API is timed
+on the same corpus.
+
+Usage: python3 benchmarks/bench_check_detection.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+from checkmate import (checkmate, checkmate_astar, checkmate_raycast,
+                       checkmate_board, checkmate_astar_board, checkmate_raycast_board,
+                       checkmate_batch, boards_to_array)
+
+
+def random_position(rng, num_pieces):
+    board = [['.'] * 8 for _ in range(8)]
+    squares = rng.sample(range(64), num_pieces + 1)
+    king_pos = divmod(squares[0], 8)
+    for sq in squares[1:]:
+        y, x = divmod(sq, 8)
+        board[y][x] = rng.choice('QRBPPP')
+    return board, king_pos
+
+
+def to_string(board, king_pos):
+    test_board = [row[:] for row in board]
+    test_board[king_pos[0]][king_pos[1]] = 'K'
+    return '\n'.join(' '.join(row) for row in test_board)
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    rng = random.Random(4321)
+    corpus = [random_position(rng, rng.randint(0, 16)) for _ in range(5000)]
+    strings = [to_string(board, king_pos) for board, king_pos in corpus]
+
+    in_check = 0
+    for (board, king_pos), board_str in zip(corpus, strings):
+        expected = checkmate(board_str)
+        assert checkmate_astar(board_str)[0] == expected
+        assert checkmate_raycast(board_str) == expected
+        assert checkmate_raycast_board(board, king_pos) == expected
+        in_check += expected
+    print(f"Corpus: {len(corpus)} positions, {in_check} in check; all detectors agree\n")
+
+    rows = [
+        ("BFS", lambda: [checkmate(s) for s in strings],
+         lambda: [checkmate_board(b, k) for b, k in corpus]),
+        ("A*", lambda: [checkmate_astar(s) for s in strings],
+         lambda: [checkmate_astar_board(b, k) for b, k in corpus]),
+        ("ray-cast", lambda: [checkmate_raycast(s) for s in strings],
+         lambda: [checkmate_raycast_board(b, k) for b, k in corpus]),
+    ]
+    baseline = None
+    print(f"{'detector':<10} {'string API':>12} {'board API':>12} {'per position':>14} {'vs BFS':>8}")
+    for label, string_fn, board_fn in rows:
+        string_time = timed(string_fn)
+        board_time = timed(board_fn)
+        if baseline is None:
+            baseline = board_time
+        print(f"{label:<10} {string_time * 1000:9.1f} ms {board_time * 1000:9.1f} ms "
+              f"{board_time / len(corpus) * 1e6:11.2f} us {baseline / board_time:7.1f}x")
+
+    # Vectorized batch: in-check flags plus A*-identical threat levels
+    codes = boards_to_array(board for board, _ in corpus)
+    kings = [king_pos for _, king_pos in corpus]
+    batch_time = timed(lambda: checkmate_batch(codes, kings))
+    print(f"{'batch':<10} {'-':>12} {batch_time * 1000:9.1f} ms "
+          f"{batch_time / len(corpus) * 1e6:11.2f} us {baseline / batch_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the square-ordered DFS.
+Compares dfs_search, which places pieces in increasing square order, with
+the previous DFS that tried every empty square at every level and so
+reached each set of placements once per ordering. Reports nodes visited and
+time on small unsolvable cases (the whole tree is searched), then counts the
+tree size of the full {'Q':1,'R':2,'B':2,'P':8} inventory analytically.
+test_issue11_dfs_dedup.py checks that both return the same solutions.
+
+Usage: python3 benchmarks/bench_dfs_dedup.py
+"""
+
+import os
+import sys
+import time
+from math import comb, factorial, perm
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+import solver
+from attack_state import AttackState
+from gamestate import GameState
+
+
+def permutation_dfs(state, attack, solution, counter):
+    """dfs_search as it was before: every empty square at every level."""
+    counter[0] += 1
+    if attack.in_check:
+        return solution
+    if all(count == 0 for count in state.remaining_pieces.values()):
+        return []
+    for row, col in solver.get_empty_squares(state.board):
+        for piece, count in state.remaining_pieces.items():
+            if count > 0:
+                attack.add(piece, row, col)
+                result = permutation_dfs(solver.place_piece(state, piece, row, col), attack,
+                                         solution + [(piece, row, col)], counter)
+                attack.remove(row, col)
+                if result:
+                    return result
+    return []
+
+
+def canonical_nodes(state, king_pos):
+    """Run dfs_search over every empty square while counting the nodes it visits."""
+    # The root, less the adds that load the starting board into the AttackState
+    counter = [1 - sum(cell != '.' for row in state.board for cell in row)]
+    original = AttackState.add
+
+    def counting(*args, **kwargs):
+        counter[0] += 1
+        return original(*args, **kwargs)
+
+    AttackState.add = counting  # one call per placement made by the search
+    try:
+        result = solver.dfs_search(state, king_pos, find_solution=True, candidates='all')
+    finally:
+        AttackState.add = original
+    return result, counter[0]
+
+
+def make_state(board_pieces, remaining):
+    state = GameState(8)
+    for piece, row, col in board_pieces:
+        state.board[row][col] = piece
+    state.remaining_pieces = dict(remaining)
+    return state
+
+
+def tree_size(inventory, squares, depth, ordered):
+    """Nodes at each depth up to depth of a search over squares empty squares."""
+    sizes = []
+    for k in range(depth + 1):
+        # distinct piece-type multisets of size k that fit the inventory
+        typed = _typed_sequences(inventory, k)
+        if ordered:
+            sizes.append(perm(squares, k) * typed)
+        else:
+            sizes.append(comb(squares, k) * typed)
+    return sizes
+
+
+def _typed_sequences(inventory, k):
+    # Ways to label k ordered squares with piece types within the inventory
+    counts = [0] * (k + 1)
+    counts[0] = 1
+    for n in inventory.values():
+        new = [0] * (k + 1)
+        for used, ways in enumerate(counts):
+            if ways:
+                for take in range(min(n, k - used) + 1):
+                    new[used + take] += ways * comb(used + take, take)
+        counts = new
+    return counts[k]
+
+
+def main():
+    enclosed = [('B', 0, 1), ('B', 1, 0), ('R', 1, 1)]
+    cases = [
+        ((7, 3), [], {'P': 2}),
+        ((7, 3), [], {'P': 3}),
+        ((0, 0), enclosed, {'B': 1, 'P': 1}),
+    ]
+    print("Unsolvable cases (whole tree searched)")
+    for king_pos, pieces, remaining in cases:
+        counter = [0]
+        state = make_state(pieces, remaining)
+        start = time.perf_counter()
+        permutation_dfs(state, AttackState(king_pos, state.board), [], counter)
+        time_perm = time.perf_counter() - start
+        start = time.perf_counter()
+        _, nodes = canonical_nodes(make_state(pieces, remaining), king_pos)
+        time_canon = time.perf_counter() - start
+        print(f"  King {king_pos} {remaining}: {counter[0]:8d} -> {nodes:6d} nodes "
+              f"({counter[0] / nodes:4.1f}x), {time_perm * 1000:8.1f} -> {time_canon * 1000:7.1f} ms")
+
+    inventory = {'Q': 1, 'R': 2, 'B': 2, 'P': 8}
+    ordered = tree_size(inventory, 63, 5, True)
+    unordered = tree_size(inventory, 63, 5, False)
+    print(f"\nTree size for {inventory} on an empty board, by depth")
+    for depth, (before, after) in enumerate(zip(ordered, unordered)):
+        print(f"  depth {depth}: {before:16,d} -> {after:14,d} nodes ({before // after}x = {depth}!)")
+    assert all(before == after * factorial(k) for k, (before, after) in enumerate(zip(ordered, unordered)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the can-still-win oracle.
+Times win_feasible() against the searches it replaces, on a winnable and an
+unwinnable position. The transposition table is cleared before every
+search, so each one does its full work.
+
+Usage: python3 benchmarks/bench_feasibility.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+import solver
+
+REPEAT = 200
+
+
+def board_with(pieces):
+    board = [['.'] * 8 for _ in range(8)]
+    for piece, row, col in pieces:
+        board[row][col] = piece
+    return board
+
+
+CASES = [
+    ("winnable", board_with([('P', 2, 3), ('P', 4, 1)]), {'Q': 0, 'R': 1, 'B': 1, 'P': 1}, (1, 5)),
+    # Every line to the King blocked
+    ("unwinnable", board_with([('B', 3, 4), ('B', 5, 4), ('B', 4, 3), ('B', 4, 5),
+                               ('R', 3, 3), ('R', 3, 5), ('R', 5, 3), ('R', 5, 5)]),
+     {'Q': 1, 'R': 2, 'B': 2, 'P': 8}, (4, 4)),
+]
+
+
+def time_per_call(fn):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - start) / REPEAT
+
+
+def searched(board, remaining, king_pos, search_type):
+    solver.TRANSPOSITION_TABLE.clear()
+    state = solver._create_game_state_from_board(board, remaining, king_pos)
+    return solver._solve_state(state, king_pos, search_type) is not None
+
+
+def main():
+    for name, board, remaining, king_pos in CASES:
+        print(f"{name}:")
+        oracle = time_per_call(lambda: solver.win_feasible(board, remaining, king_pos))
+        print(f"  {'oracle':8s} {oracle * 1e6:8.1f} us")
+        for search_type in ('astar', 'iddfs', 'none'):
+            elapsed = time_per_call(lambda: searched(board, remaining, king_pos, search_type))
+            print(f"  {search_type:8s} {elapsed * 1e6:8.1f} us  ({elapsed / oracle:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
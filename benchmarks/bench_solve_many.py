@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark for solve_many.
+Solves every King square with every inventory up to Q 1, R 2, B 2, P 8 on a
+set of mid-game boards (so the tablebase cannot answer) with 1, 2, 4, ...
+worker processes up to the CPU count, checks the answers against a serial
+run and reports throughput and speedup.
+
+Usage: python3 benchmarks/bench_solve_many.py
+"""
+
+import os
+import random
+import sys
+import time
+from itertools import product
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+import solver
+
+
+def make_jobs(num_boards=4, seed=15):
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(num_boards):
+        board = [['.'] * 8 for _ in range(8)]
+        for _ in range(10):
+            board[rng.randrange(8)][rng.randrange(8)] = rng.choice('RBPP')
+        for ky, kx in product(range(8), range(8)):
+            if board[ky][kx] != '.':
+                continue
+            for q, r, b, p in product(range(2), range(3), range(3), range(9)):
+                jobs.append(((ky, kx), board, {'Q': q, 'R': r, 'B': b, 'P': p}))
+    return jobs
+
+
+def main():
+    jobs = make_jobs()
+    cpus = os.cpu_count() or 1
+    print(f"{len(jobs)} jobs, {cpus} CPU(s)")
+
+    start = time.perf_counter()
+    serial = dict(solver.solve_many(jobs, max_workers=1))
+    baseline = time.perf_counter() - start
+    print(f"  in-process  {baseline:6.2f} s  {len(jobs) / baseline:8.0f} jobs/s")
+
+    workers = 2
+    while workers <= max(cpus, 2):
+        start = time.perf_counter()
+        results = dict(solver.solve_many(jobs, max_workers=workers))
+        elapsed = time.perf_counter() - start
+        assert results == serial
+        print(f"  {workers:2d} workers  {elapsed:6.2f} s  {len(jobs) / elapsed:8.0f} jobs/s  "
+              f"{baseline / elapsed:4.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
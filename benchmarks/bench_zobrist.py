@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Zobrist keys.
+Compares A* with 64-bit Zobrist keys in its visited set against the previous
+board_to_string keys (time and peak memory), and DFS with and without the
+shared transposition table.
+
+Usage: python3 benchmarks/bench_zobrist.py
+"""
+
+import heapq
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Back'))
+import solver
+from attack_state import AttackState
+from gamestate import GameState
+
+
+def string_keyed_astar(state, king_pos):
+    """astar_search as it was before Zobrist keys: visited holds board strings."""
+    frontier = []
+    counter = 0
+    heapq.heappush(frontier, (solver.heuristic(state.board, king_pos), counter, state, [],
+                              AttackState(king_pos, state.board)))
+    visited = set()
+    while frontier:
+        f, _, current_state, path, attack = heapq.heappop(frontier)
+        board_str = solver.board_to_string(current_state.board, king_pos)
+        if board_str in visited:
+            continue
+        visited.add(board_str)
+        if path:
+            attack = attack.copy()
+            attack.add(*path[-1])
+        if attack.in_check:
+            return path, visited
+        for row, col in solver.get_empty_squares(current_state.board):
+            for piece, count in current_state.remaining_pieces.items():
+                if count > 0:
+                    new_state = solver.place_piece(current_state, piece, row, col)
+                    new_path = path + [(piece, row, col)]
+                    f_new = len(new_path) + solver.heuristic(new_state.board, king_pos)
+                    counter += 1
+                    heapq.heappush(frontier, (f_new, counter, new_state, new_path, attack))
+    return None, visited
+
+
+def visited_key_bytes(keys):
+    """Memory held by a visited set: the set table plus the key objects."""
+    return sys.getsizeof(keys) + sum(sys.getsizeof(key) for key in keys)
+
+
+def measure(fn):
+    """Run fn twice: once timed, once under tracemalloc for its peak memory."""
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def make_state(board_pieces, remaining):
+    state = GameState(8)
+    for piece, row, col in board_pieces:
+        state.board[row][col] = piece
+    state.remaining_pieces = dict(remaining)
+    return state
+
+
+def main():
+    # King on (0, 0) walled in by pieces that do not attack it
+    enclosed = [('B', 0, 1), ('B', 1, 0), ('R', 1, 1)]
+    # Unsolvable cases make A* exhaust its frontier, so visited gets big
+    cases = [
+        ((7, 3), [], {'Q': 0, 'R': 0, 'B': 0, 'P': 2}),
+        ((0, 0), enclosed, {'Q': 0, 'R': 0, 'B': 1, 'P': 1}),
+    ]
+
+    print("A* visited set: board strings vs Zobrist keys")
+    for king_pos, pieces, remaining in cases:
+        (path_s, visited_s), time_s, peak_s = measure(
+            lambda: string_keyed_astar(make_state(pieces, remaining), king_pos))
+
+        path_z, time_z, peak_z = measure(lambda: solver.astar_search(make_state(pieces, remaining), king_pos))
+        assert path_s == path_z, "Zobrist keys must not change the A* result"
+        # Same number of entries, one full-width 64-bit int per entry
+        zobrist_keys = {(1 << 63) | i for i in range(len(visited_s))}
+
+        print(f"  King {king_pos}, {len(visited_s):5d} visited: "
+              f"time {time_s * 1000:7.1f} -> {time_z * 1000:7.1f} ms, "
+              f"visited set {visited_key_bytes(visited_s) / 1024:6.0f} -> "
+              f"{visited_key_bytes(zobrist_keys) / 1024:5.0f} KiB, "
+              f"search peak {peak_s / 1024:6.0f} -> {peak_z / 1024:6.0f} KiB")
+
+    print("\nDFS without vs with the shared transposition table (unsolvable cases)")
+    for king_pos, pieces, remaining in [((7, 3), [], {'Q': 0, 'R': 0, 'B': 0, 'P': 3}),
+                                        ((0, 0), enclosed, {'Q': 0, 'R': 0, 'B': 1, 'P': 1})]:
+        start = time.perf_counter()
+        solver.dfs_search(make_state(pieces, remaining), king_pos)
+        time_plain = time.perf_counter() - start
+        table = solver.TranspositionTable()
+        start = time.perf_counter()
+        solver.dfs_search(make_state(pieces, remaining), king_pos, table=table)
+        time_table = time.perf_counter() - start
+        start = time.perf_counter()
+        solver.astar_search(make_state(pieces, remaining), king_pos, table=table)
+        time_again = time.perf_counter() - start
+        print(f"  King {king_pos}: {time_plain * 1000:7.1f} ms -> {time_table * 1000:7.1f} ms "
+              f"({len(table)} dead states); A* on the same table afterwards {time_again * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Shared helpers for the test suites
+Builds boards, game states and random positions from lists of placed pieces
+"""
+
+import sys
+sys.path.append('Back')
+from gamestate import GameState
+
+
+def make_board(pieces, size=8):
+    """
+    Args:
+        pieces: list of (piece, row, col)
+        size: board size
+
+    Returns:
+        size x size board with the pieces placed and '.' everywhere else
+    """
+    board = [['.'] * size for _ in range(size)]
+    for piece, row, col in pieces:
+        board[row][col] = piece
+    return board
+
+
+def make_state(pieces, remaining, size=8):
+    """
+    Args:
+        pieces: list of (piece, row, col) already on the board
+        remaining: dict of piece -> count still available
+        size: board size
+
+    Returns:
+        GameState holding the pieces, with a copy of remaining
+    """
+    state = GameState(size)
+    state.board = make_board(pieces, size)
+    state.remaining_pieces = dict(remaining)
+    return state
+
+
+def random_position(rng, num_pieces, size=8, piece_types='QRBP'):
+    """
+    Args:
+        rng: random.Random to draw from
+        num_pieces: number of pieces to place
+        size: board size
+        piece_types: piece letters to choose from (repeat one to weight it)
+
+    Returns:
+        (king_pos, pieces) with the King and every piece on distinct squares
+    """
+    squares = rng.sample(range(size * size), num_pieces + 1)
+    king_pos = divmod(squares[0], size)
+    pieces = [(rng.choice(piece_types),) + divmod(sq, size) for sq in squares[1:]]
+    return king_pos, pieces
+
+
+def random_board(rng, num_pieces, size=8, piece_types='QRBP'):
+    """
+    Same as random_position, with the pieces already placed on a board.
+
+    Returns:
+        (board, king_pos)
+    """
+    king_pos, pieces = random_position(rng, num_pieces, size, piece_types)
+    return make_board(pieces, size), king_pos
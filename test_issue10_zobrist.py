@@ -0,0 +1,116 @@
+"""
+Test suite for Issue #10: Zobrist hashing
+Tests incremental Zobrist keys and the shared transposition table
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from gamestate import CompactState, zobrist_hash, zobrist_inventory
+from solver import (TranspositionTable, astar_search, dfs_search, place_piece,
+                    state_key)
+from test_helpers import make_state
+
+
+def test_place_updates_key():
+    """Keys kept up to date by CompactState.place equal keys computed from scratch"""
+    rng = random.Random(10)
+    state = make_state([], {'Q': 4, 'R': 4, 'B': 4, 'P': 8})
+    compact = CompactState.from_game_state(state)
+    for _ in range(20):
+        row, col = rng.randrange(8), rng.randrange(8)
+        if state.board[row][col] != '.':
+            continue
+        piece = rng.choice('QRBP')
+        state = place_piece(state, piece, row, col)
+        compact = compact.place(piece, row, col)
+        assert compact.zobrist == zobrist_hash(state.board)
+        assert state_key(compact, (7, 7)) == state_key(state, (7, 7))
+    print("✓ Test passed: place updates the key")
+
+
+def test_searches_leave_state_alone():
+    """Searches do not write into the caller's GameState, and keys follow board edits"""
+    king_pos = (0, 7)
+    state = make_state([('P', 1, 6)], {'R': 1})
+    before = dict(vars(state))
+    before['board'] = [row[:] for row in state.board]
+    for search in (dfs_search, astar_search):
+        search(state, king_pos)
+    assert vars(state) == before
+    key = state_key(state, king_pos)
+    state.board[5][5] = 'B'
+    assert state_key(state, king_pos) != key
+    assert state_key(state, king_pos) == state_key(CompactState.from_game_state(state), king_pos)
+    print("✓ Test passed: searches leave state alone")
+
+
+def test_keys_distinguish_states():
+    """Different boards, inventories and King squares get different keys"""
+    a = make_state([('R', 0, 0)], {'P': 1})
+    b = make_state([('B', 0, 0)], {'P': 1})
+    c = make_state([('R', 0, 0)], {'P': 2})
+    assert zobrist_hash(a.board) != zobrist_hash(b.board)
+    assert state_key(a, (7, 7)) != state_key(c, (7, 7))
+    assert state_key(a, (7, 7)) != state_key(a, (7, 6))
+    print("✓ Test passed: keys distinguish states")
+
+
+def test_zero_counts_ignored():
+    """A zero count and a missing piece are the same inventory"""
+    assert zobrist_inventory({'Q': 0, 'P': 2}) == zobrist_inventory({'P': 2})
+    assert zobrist_inventory({}) == 0
+    print("✓ Test passed: zero counts ignored")
+
+
+def test_table_does_not_change_results():
+    """DFS and A* give the same answers with and without a shared table"""
+    table = TranspositionTable()
+    cases = [
+        ((7, 3), [], {'Q': 0, 'R': 0, 'B': 0, 'P': 2}),
+        ((0, 0), [('B', 0, 1), ('B', 1, 0), ('R', 1, 1)], {'B': 1, 'P': 1}),
+        ((4, 4), [], {'Q': 0, 'R': 1, 'B': 0, 'P': 0}),
+        ((0, 7), [('P', 1, 6)], {'R': 1}),
+    ]
+    for king_pos, pieces, remaining in cases:
+        for _ in range(2):  # second round runs against a warm table
+            assert (dfs_search(make_state(pieces, remaining), king_pos, find_solution=True, table=table)
+                    == dfs_search(make_state(pieces, remaining), king_pos, find_solution=True))
+            assert (astar_search(make_state(pieces, remaining), king_pos, table=table)
+                    == astar_search(make_state(pieces, remaining), king_pos))
+    print("✓ Test passed: table does not change results")
+
+
+def test_table_records_unsolvable_root():
+    """An exhausted search stores its root, so the next query is answered at once"""
+    table = TranspositionTable()
+    king_pos = (0, 0)
+    pieces = [('B', 0, 1), ('B', 1, 0), ('R', 1, 1)]
+    state = make_state(pieces, {'B': 1, 'P': 1})
+    assert astar_search(state, king_pos, table=table) is None
+    assert state_key(state, king_pos) in table
+    assert dfs_search(make_state(pieces, {'B': 1, 'P': 1}), king_pos, table=table) == False
+    print("✓ Test passed: table records unsolvable root")
+
+
+def test_table_bounded():
+    """The table never holds more than max_entries keys"""
+    table = TranspositionTable(max_entries=3)
+    for key in range(10):
+        table.add(key)
+        assert len(table) <= 3
+    table.clear()
+    assert len(table) == 0
+    print("✓ Test passed: table bounded")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #10: Zobrist Hashing ===\n")
+    test_place_updates_key()
+    test_searches_leave_state_alone()
+    test_keys_distinguish_states()
+    test_zero_counts_ignored()
+    test_table_does_not_change_results()
+    test_table_records_unsolvable_root()
+    test_table_bounded()
+    print("\n=== All Issue #10 tests passed! ===\n")
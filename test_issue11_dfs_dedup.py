@@ -0,0 +1,98 @@
+"""
+Test suite for Issue #11: Order-independent DFS
+Tests that dfs_search reaches every set of placements once, in square order
+"""
+
+import random
+import sys
+sys.path.append('Back')
+import solver
+from attack_state import AttackState
+from math import comb
+from solver import TranspositionTable, dfs_search, place_piece, state_key
+from test_helpers import make_state
+
+
+def permutation_dfs(state, attack, solution):
+    # The DFS before this change: every empty square at every level
+    if attack.in_check:
+        return solution
+    if all(count == 0 for count in state.remaining_pieces.values()):
+        return []
+    for row, col in solver.get_empty_squares(state.board):
+        for piece, count in state.remaining_pieces.items():
+            if count > 0:
+                attack.add(piece, row, col)
+                result = permutation_dfs(place_piece(state, piece, row, col), attack,
+                                         solution + [(piece, row, col)])
+                attack.remove(row, col)
+                if result:
+                    return result
+    return []
+
+
+def test_solutions_in_square_order():
+    """Placements in a DFS solution are in increasing square order"""
+    for king_pos in [(0, 0), (3, 4), (7, 7)]:
+        solution = dfs_search(make_state([], {'Q': 0, 'R': 2, 'B': 1, 'P': 2}), king_pos,
+                              find_solution=True, candidates='all')
+        squares = [row * 8 + col for _, row, col in solution]
+        assert solution and squares == sorted(squares)
+    print("✓ Test passed: solutions in square order")
+
+
+def test_each_combination_visited_once():
+    """An unsolvable search visits each set of squares once, not once per order"""
+    counter = [0]
+    original = AttackState.add
+
+    def counting(*args, **kwargs):
+        counter[0] += 1
+        return original(*args, **kwargs)
+
+    AttackState.add = counting  # one call per placement made by the search
+    try:
+        # Pawns can never attack a King on the last rank
+        assert dfs_search(make_state([], {'P': 2}), (7, 3), candidates='all') == False
+    finally:
+        AttackState.add = original
+    # one Pawn on any of 64 squares + two Pawns on any pair of squares
+    assert counter[0] == 64 + comb(64, 2)
+    print("✓ Test passed: each combination visited once")
+
+
+def test_same_solution_as_permutation_search():
+    """The first solution found is the one the permutation DFS found"""
+    rng = random.Random(11)
+    for _ in range(100):
+        king_pos = (rng.randrange(8), rng.randrange(8))
+        pieces = []
+        for _ in range(rng.randint(0, 8)):
+            y, x = rng.randrange(8), rng.randrange(8)
+            if (y, x) != king_pos and all((y, x) != (r, c) for _, r, c in pieces):
+                pieces.append((rng.choice('RBP'), y, x))
+        remaining = {'R': rng.randint(0, 1), 'B': rng.randint(0, 1), 'P': rng.randint(0, 1)}
+        state = make_state(pieces, remaining)
+        expected = permutation_dfs(state, AttackState(king_pos, state.board), [])
+        for backend in ('list', 'bitboard'):
+            assert dfs_search(make_state(pieces, remaining), king_pos, find_solution=True,
+                              backend=backend, candidates='all') == expected
+    print("✓ Test passed: same solution as permutation search")
+
+
+def test_table_stores_only_proven_states():
+    """Only the root of a failed search goes into the transposition table"""
+    table = TranspositionTable()
+    state = make_state([], {'P': 2})
+    assert dfs_search(state, (7, 3), table=table) == False
+    assert len(table) == 1 and state_key(state, (7, 3)) in table
+    print("✓ Test passed: table stores only proven states")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #11: Order-independent DFS ===\n")
+    test_solutions_in_square_order()
+    test_each_combination_visited_once()
+    test_same_solution_as_permutation_search()
+    test_table_stores_only_proven_states()
+    print("\n=== All Issue #11 tests passed! ===\n")
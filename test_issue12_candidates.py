@@ -0,0 +1,109 @@
+"""
+Test suite for Issue #12: Relevant-placement candidate generator
+Tests that the solvers only try placements that can give check
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from attack_state import AttackState
+from bitboard import board_to_bitboard
+from search_stats import SearchStats
+from solver import (_bitboard_candidates, astar_search, candidate_placements,
+                    dfs_search)
+from test_helpers import make_state, random_position
+
+
+def test_candidates_are_exactly_the_checking_placements():
+    """A placement is a candidate if and only if it gives check"""
+    rng = random.Random(12)
+    remaining = {'Q': 1, 'R': 1, 'B': 1, 'P': 1}
+    for _ in range(300):
+        king_pos, pieces = random_position(rng, rng.randint(0, 16))
+        state = make_state(pieces, remaining)
+        attack = AttackState(king_pos, state.board)
+        if attack.in_check:
+            continue
+        relevant = candidate_placements(state.board, remaining, attack)
+        for row, col, piece in candidate_placements(state.board, remaining, attack, 'all'):
+            attack.add(piece, row, col)
+            assert attack.in_check == ((row, col, piece) in relevant)
+            attack.remove(row, col)
+    print("✓ Test passed: candidates are exactly the checking placements")
+
+
+def test_bitboard_candidates_match():
+    """The bitboard generator yields the same placements in the same order"""
+    rng = random.Random(21)
+    for _ in range(300):
+        king_pos, pieces = random_position(rng, rng.randint(0, 16))
+        remaining = {'Q': rng.randint(0, 1), 'R': rng.randint(0, 2), 'B': 1, 'P': rng.randint(0, 2)}
+        state = make_state(pieces, remaining)
+        attack = AttackState(king_pos, state.board)
+        assert (candidate_placements(state.board, remaining, attack)
+                == _bitboard_candidates(board_to_bitboard(state.board), remaining, king_pos, 'relevant'))
+    print("✓ Test passed: bitboard candidates match")
+
+
+def test_pruning_keeps_solvability():
+    """Both solvers agree with the unpruned search on whether a solution exists"""
+    rng = random.Random(3)
+    for _ in range(40):
+        king_pos, pieces = random_position(rng, rng.randint(0, 16))
+        remaining = {'R': rng.randint(0, 1), 'B': rng.randint(0, 1), 'P': rng.randint(0, 1)}
+        expected = bool(dfs_search(make_state(pieces, remaining), king_pos, candidates='all'))
+        for backend in ('list', 'bitboard'):
+            assert dfs_search(make_state(pieces, remaining), king_pos, backend=backend) == expected
+            assert (astar_search(make_state(pieces, remaining), king_pos, backend=backend) is not None) == expected
+    print("✓ Test passed: pruning keeps solvability")
+
+
+def test_pruning_generates_fewer_nodes():
+    """'relevant' generates fewer nodes than 'all' on both solvers and backends"""
+    cases = [
+        ([], {'Q': 1, 'R': 2, 'B': 2, 'P': 8}, (3, 4)),
+        ([('P', 2, 3), ('P', 4, 1), ('B', 3, 4), ('R', 0, 2)], {'R': 1, 'B': 1, 'P': 1}, (1, 5)),
+        ([], {'P': 2}, (7, 3)),  # unsolvable: Pawns can never check a King on the last rank
+    ]
+    for pieces, remaining, king_pos in cases:
+        for search in (astar_search, dfs_search):
+            for backend in ('list', 'bitboard'):
+                generated = {}
+                for candidates in ('all', 'relevant'):
+                    stats = SearchStats()
+                    search(make_state(pieces, remaining), king_pos, backend=backend,
+                           candidates=candidates, stats=stats)
+                    generated[candidates] = stats.nodes_generated
+                assert generated['relevant'] < generated['all'], (search.__name__, backend, king_pos)
+    print("✓ Test passed: pruning generates fewer nodes")
+
+
+def test_unreachable_king_has_no_candidates():
+    """A King that no remaining piece can reach is rejected without search"""
+    state = make_state([('B', 0, 1), ('B', 1, 0), ('R', 1, 1)], {'R': 2, 'B': 2, 'P': 8})
+    attack = AttackState((0, 0), state.board)
+    assert candidate_placements(state.board, state.remaining_pieces, attack) == []
+    assert astar_search(state, (0, 0)) is None
+    print("✓ Test passed: unreachable King has no candidates")
+
+
+def test_unknown_mode_rejected():
+    """An unknown candidates mode raises ValueError"""
+    state = make_state([], {'P': 1})
+    try:
+        dfs_search(state, (3, 3), candidates='some')
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    print("✓ Test passed: unknown mode rejected")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #12: Candidate Generator ===\n")
+    test_candidates_are_exactly_the_checking_placements()
+    test_bitboard_candidates_match()
+    test_pruning_keeps_solvability()
+    test_pruning_generates_fewer_nodes()
+    test_unreachable_king_has_no_candidates()
+    test_unknown_mode_rejected()
+    print("\n=== All Issue #12 tests passed! ===\n")
@@ -0,0 +1,85 @@
+"""
+Test suite for Issue #13: Compact solver state
+Tests CompactState against GameState and place_piece
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from gamestate import CompactState, GameState, zobrist_hash
+from solver import (astar_search, compact_heuristic, dfs_search, heuristic,
+                    place_piece, state_key)
+
+
+def random_game_state(rng):
+    state = GameState(8)
+    for _ in range(rng.randint(0, 20)):
+        row, col = rng.randrange(8), rng.randrange(8)
+        state.board[row][col] = rng.choice('QRBP')
+        state.used_positions.add((row, col))
+    state.remaining_pieces = {'Q': rng.randint(0, 1), 'R': rng.randint(0, 2),
+                              'B': rng.randint(0, 2), 'P': rng.randint(1, 8)}
+    return state
+
+
+def test_packs_game_state():
+    """Packing keeps the board, the inventory and the occupied squares"""
+    rng = random.Random(13)
+    for _ in range(100):
+        state = random_game_state(rng)
+        compact = CompactState.from_game_state(state)
+        assert compact.board == ''.join(''.join(row) for row in state.board).encode('ascii')
+        assert compact.remaining_pieces == state.remaining_pieces
+        assert set(compact.empty_squares()) == {(r, c) for r in range(8) for c in range(8)} - state.used_positions
+        assert compact.zobrist == zobrist_hash(state.board)
+    print("✓ Test passed: packs game state")
+
+
+def test_place_matches_place_piece():
+    """CompactState.place agrees with place_piece and leaves the parent alone"""
+    rng = random.Random(31)
+    for _ in range(100):
+        state = random_game_state(rng)
+        compact = CompactState.from_game_state(state)
+        row, col = rng.choice([(r, c) for r in range(8) for c in range(8) if state.board[r][c] == '.'])
+        piece = rng.choice('QRBP')
+        expected = place_piece(state, piece, row, col)
+        placed = compact.place(piece, row, col)
+        assert placed == CompactState.from_game_state(expected)
+        assert placed.zobrist == zobrist_hash(expected.board)
+        assert compact == CompactState.from_game_state(state)
+        assert (row, col) in compact.empty_squares() and (row, col) not in placed.empty_squares()
+        assert compact_heuristic(placed, (3, 3)) == heuristic(expected.board, (3, 3))
+        assert state_key(placed, (3, 3)) == state_key(expected, (3, 3))
+    print("✓ Test passed: place matches place_piece")
+
+
+def test_hashable_by_board_and_inventory():
+    """Equal boards and inventories hash alike, whatever the placement order"""
+    start = CompactState.from_game_state(GameState(8))
+    a = start.place('R', 0, 0).place('B', 5, 5)
+    b = start.place('B', 5, 5).place('R', 0, 0)
+    assert a == b and hash(a) == hash(b) and len({a, b}) == 1
+    assert a != start.place('R', 0, 0).place('Q', 5, 5)
+    print("✓ Test passed: hashable by board and inventory")
+
+
+def test_solvers_leave_game_state_unchanged():
+    """The solvers only read the GameState they are given"""
+    state = GameState(8)
+    state.board[2][3] = 'P'
+    state.remaining_pieces = {'Q': 0, 'R': 1, 'B': 1, 'P': 1}
+    board = [row[:] for row in state.board]
+    assert astar_search(state, (1, 5)) and dfs_search(state, (1, 5), find_solution=True)
+    assert state.board == board
+    assert state.remaining_pieces == {'Q': 0, 'R': 1, 'B': 1, 'P': 1}
+    print("✓ Test passed: solvers leave GameState unchanged")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #13: Compact Solver State ===\n")
+    test_packs_game_state()
+    test_place_matches_place_piece()
+    test_hashable_by_board_and_inventory()
+    test_solvers_leave_game_state_unchanged()
+    print("\n=== All Issue #13 tests passed! ===\n")
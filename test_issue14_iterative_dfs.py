@@ -0,0 +1,100 @@
+"""
+Test suite for Issue #14: Iterative make/unmake DFS
+Tests the explicit-stack DFS against the recursive DFS it replaces
+"""
+
+import inspect
+import random
+import sys
+sys.path.append('Back')
+from attack_state import AttackState
+from gamestate import CompactState
+from solver import _candidates, dfs_search
+from test_helpers import make_state
+
+
+def recursive_dfs(state, attack, solution, candidates, start=0):
+    # The recursive DFS before this change (new state and path per step)
+    if attack.in_check:
+        return solution
+    pieces = state.pieces_left()
+    if not pieces:
+        return []
+    for row, col, piece in _candidates(pieces, attack, candidates, state.empty_squares):
+        square = row * state.size + col
+        if square < start:
+            continue
+        attack.add(piece, row, col)
+        result = recursive_dfs(state.place(piece, row, col), attack, solution + [(piece, row, col)],
+                               candidates, square + 1)
+        attack.remove(row, col)
+        if result:
+            return result
+    return []
+
+
+def regression_corpus(seed, count):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        king_pos = (rng.randrange(8), rng.randrange(8))
+        pieces = []
+        for _ in range(rng.randint(0, 16)):
+            y, x = rng.randrange(8), rng.randrange(8)
+            if (y, x) != king_pos and all((y, x) != (r, c) for _, r, c in pieces):
+                pieces.append((rng.choice('QRBP'), y, x))
+        remaining = {'Q': rng.randint(0, 1), 'R': rng.randint(0, 1), 'B': rng.randint(0, 1),
+                     'P': rng.randint(0, 2)}
+        corpus.append((king_pos, pieces, remaining))
+    return corpus
+
+
+def test_matches_recursive_dfs():
+    """Same solutions as the recursive DFS on a regression corpus"""
+    for king_pos, pieces, remaining in regression_corpus(14, 200):
+        candidates = 'all' if sum(remaining.values()) <= 2 else 'relevant'
+        state = make_state(pieces, remaining)
+        attack = AttackState(king_pos, state.board)
+        in_check = attack.in_check
+        expected = recursive_dfs(CompactState.from_game_state(state), attack, [], candidates)
+        result = dfs_search(make_state(pieces, remaining), king_pos, find_solution=True,
+                            candidates=candidates)
+        assert result == expected, (king_pos, pieces, remaining)
+        assert dfs_search(make_state(pieces, remaining), king_pos, candidates=candidates) == (in_check or bool(expected))
+    print("✓ Test passed: matches recursive DFS")
+
+
+def test_solution_prefix_kept():
+    """A solution passed in is prefixed to the placements found"""
+    prefix = [('P', 2, 3)]
+    result = dfs_search(make_state([('P', 2, 3)], {'R': 1}), (1, 5), find_solution=True,
+                        solution=prefix)
+    assert result[:1] == prefix and len(result) == 2
+    assert prefix == [('P', 2, 3)]
+    print("✓ Test passed: solution prefix kept")
+
+
+def test_deep_search_without_recursion():
+    """A search deeper than the recursion limit still completes"""
+    # On a 16x16 board Pawns fill the squares in order until one lands on
+    # (15, 1) below the King: a single line of 242 placements
+    size = 16
+    king_pos = (14, 0)
+    state = make_state([], {'P': size * size}, size)
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 100)
+    try:
+        solution = dfs_search(state, king_pos, find_solution=True, candidates='all')
+    finally:
+        sys.setrecursionlimit(limit)
+    assert len(solution) == 15 * size + 2  # squares 0 to 241
+    assert solution[-1] == ('P', 15, 1)
+    print("✓ Test passed: deep search without recursion")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #14: Iterative Make/Unmake DFS ===\n")
+    test_matches_recursive_dfs()
+    test_solution_prefix_kept()
+    test_deep_search_without_recursion()
+    print("\n=== All Issue #14 tests passed! ===\n")
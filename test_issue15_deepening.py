@@ -0,0 +1,81 @@
+"""
+Test suite for Issue #15: Iterative deepening and IDA*
+Tests minimal solutions, the lower bound and the new search_type modes
+"""
+
+import math
+import random
+import sys
+sys.path.append('Back')
+from attack_state import AttackState
+from solver import (TranspositionTable, can_still_win, dfs_search, find_complete_solution,
+                    find_remaining_solution, iddfs_search, idastar_search,
+                    placements_lower_bound, state_key)
+from test_helpers import make_state, random_position
+
+
+def test_fewest_placements():
+    """Both modes find the shortest solution where DFS finds a long one"""
+    state_args = ([], {'Q': 1, 'R': 2, 'B': 2, 'P': 8})
+    long_solution = dfs_search(make_state(*state_args), (3, 4), find_solution=True, candidates='all')
+    assert len(long_solution) > 1
+    for search in (iddfs_search, idastar_search):
+        solution = search(make_state(*state_args), (3, 4), candidates='all')
+        assert len(solution) == 1
+        board = make_state(*state_args).board
+        piece, row, col = solution[0]
+        board[row][col] = piece
+        assert AttackState((3, 4), board).in_check
+    print("✓ Test passed: fewest placements")
+
+
+def test_lower_bound_admissible():
+    """The lower bound never exceeds the true minimum number of placements"""
+    rng = random.Random(15)
+    for _ in range(200):
+        king_pos, pieces = random_position(rng, rng.randint(0, 16))
+        remaining = {'Q': rng.randint(0, 1), 'R': rng.randint(0, 1), 'B': rng.randint(0, 1),
+                     'P': rng.randint(0, 1)}
+        state = make_state(pieces, remaining)
+        attack = AttackState(king_pos, state.board)
+        bound = placements_lower_bound(attack, [p for p, n in remaining.items() if n > 0])
+        if attack.in_check:
+            minimum = 0
+        elif dfs_search(make_state(pieces, remaining), king_pos, candidates='all'):
+            minimum = len(iddfs_search(make_state(pieces, remaining), king_pos, candidates='all'))
+        else:
+            minimum = math.inf
+        assert bound <= minimum
+        assert (idastar_search(make_state(pieces, remaining), king_pos) is None) == (minimum == math.inf)
+    print("✓ Test passed: lower bound admissible")
+
+
+def test_unsolvable_recorded_in_table():
+    """An unsolvable position is stored in the transposition table"""
+    table = TranspositionTable()
+    for search in (iddfs_search, idastar_search):
+        state = make_state([], {'P': 2})
+        assert search(state, (7, 3), table=table, candidates='all') is None
+        assert state_key(state, (7, 3)) in table
+        table.clear()
+    print("✓ Test passed: unsolvable recorded in table")
+
+
+def test_entry_points_accept_modes():
+    """can_still_win and the solution finders accept 'iddfs' and 'idastar'"""
+    board = make_state([('P', 2, 3)], {}).board
+    for mode in ('iddfs', 'idastar'):
+        assert can_still_win(board, {'R': 1}, (1, 5), mode) == True
+        assert can_still_win([['.'] * 8 for _ in range(8)], {'P': 2}, (7, 3), mode) == False
+        assert len(find_remaining_solution(board, {'R': 1, 'P': 1}, (1, 5), mode)) == 1
+        assert len(find_complete_solution((0, 0), {'Q': 1, 'R': 1}, 8, mode)) == 1
+    print("✓ Test passed: entry points accept modes")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #15: Iterative Deepening and IDA* ===\n")
+    test_fewest_placements()
+    test_lower_bound_admissible()
+    test_unsolvable_recorded_in_table()
+    test_entry_points_accept_modes()
+    print("\n=== All Issue #15 tests passed! ===\n")
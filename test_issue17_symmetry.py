@@ -0,0 +1,104 @@
+"""
+Test suite for Issue #17: Mirror symmetry
+Tests canonicalization and its use in the transposition table and tablebase
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from attack_state import AttackState
+from checkmate import checkmate_raycast_board
+from gamestate import CompactState, zobrist_hash
+from solver import TranspositionTable, _create_game_state_from_board, dfs_search, state_key
+from symmetry import canonicalize, is_canonical_king, mirror_board, mirror_path, mirror_square
+from tablebase import get_tablebase
+from test_helpers import make_state, random_board
+
+
+def test_check_is_mirror_symmetric():
+    """A position is in check exactly when its mirror image is"""
+    rng = random.Random(17)
+    for _ in range(500):
+        board, king_pos = random_board(rng, rng.randint(0, 16))
+        assert (checkmate_raycast_board(board, king_pos)
+                == checkmate_raycast_board(mirror_board(board), mirror_square(*king_pos)))
+    print("✓ Test passed: check is mirror symmetric")
+
+
+def test_canonicalize_round_trip():
+    """Canonical positions have the King on the left; solutions map back"""
+    rng = random.Random(71)
+    for size in (8, 7):
+        for _ in range(200):
+            board, king_pos = random_board(rng, rng.randint(0, 16), size)
+            canonical, canonical_king, mirrored = canonicalize(board, king_pos)
+            assert is_canonical_king(canonical_king, size)
+            assert canonicalize(canonical, canonical_king)[2] == False
+            path = [('R', y, x) for y in range(size) for x in range(size) if canonical[y][x] == '.'][:2]
+            back = mirror_path(path, size) if mirrored else path
+            for (piece, y, x), (_, cy, cx) in zip(back, path):
+                assert board[y][x] == canonical[cy][cx] == '.'
+    assert mirror_path(None) is None
+    print("✓ Test passed: canonicalize round trip")
+
+
+def test_mirror_images_share_a_key():
+    """state_key is the same for a position and its mirror, and differs otherwise"""
+    rng = random.Random(7)
+    remaining = {'Q': 0, 'R': 1, 'B': 1, 'P': 2}
+    keys = set()
+    for _ in range(200):
+        board, king_pos = random_board(rng, rng.randint(0, 16))
+        key = state_key(_create_game_state_from_board(board, remaining, king_pos), king_pos)
+        mirrored = _create_game_state_from_board(mirror_board(board), remaining, mirror_square(*king_pos))
+        assert key == state_key(mirrored, mirror_square(*king_pos))
+        assert key == state_key(CompactState.from_game_state(mirrored), mirror_square(*king_pos))
+        keys.add(key)
+    assert len(keys) > 190
+    print("✓ Test passed: mirror images share a key")
+
+
+def test_incremental_mirror_key():
+    """CompactState.place keeps the mirror key in step with the mirrored board"""
+    board = [['.'] * 8 for _ in range(8)]
+    state = CompactState.from_game_state(make_state([], {'P': 3, 'R': 1}))
+    for piece, row, col in [('P', 2, 1), ('R', 5, 7), ('P', 0, 0)]:
+        state = state.place(piece, row, col)
+        board[row][col] = piece
+        assert state.mirror_zobrist == zobrist_hash(mirror_board(board))
+    print("✓ Test passed: incremental mirror key")
+
+
+def test_table_answers_mirror_image():
+    """An unsolvable position stored in the table also rules out its mirror"""
+    table = TranspositionTable()
+    board = [['.'] * 8 for _ in range(8)]
+    board[0][1], board[1][0], board[1][1] = 'B', 'B', 'R'
+    state = _create_game_state_from_board(board, {'B': 1, 'P': 1}, (0, 0))
+    assert dfs_search(state, (0, 0), table=table, candidates='all') == False
+    mirrored = _create_game_state_from_board(mirror_board(board), {'B': 1, 'P': 1}, (0, 7))
+    assert state_key(mirrored, (0, 7)) in table
+    print("✓ Test passed: table answers mirror image")
+
+
+def test_tablebase_covers_right_half():
+    """Right-half Kings get valid solutions from the mirrored entries"""
+    tablebase = get_tablebase()
+    for ky in range(8):
+        for kx in range(4, 8):
+            (piece, row, col), = tablebase.lookup((ky, kx), {'Q': 1, 'R': 2, 'B': 2, 'P': 8})
+            attack = AttackState((ky, kx))
+            attack.add(piece, row, col)
+            assert attack.in_check
+    print("✓ Test passed: tablebase covers right half")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #17: Mirror Symmetry ===\n")
+    test_check_is_mirror_symmetric()
+    test_canonicalize_round_trip()
+    test_mirror_images_share_a_key()
+    test_incremental_mirror_key()
+    test_table_answers_mirror_image()
+    test_tablebase_covers_right_half()
+    print("\n=== All Issue #17 tests passed! ===\n")
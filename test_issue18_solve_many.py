@@ -0,0 +1,63 @@
+"""
+Test suite for Issue #18: Parallel batch solving
+Tests solve_many against one-at-a-time solving
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from solver import find_complete_solution, find_remaining_solution, solve_many
+
+
+def make_jobs(count, seed=18):
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(count):
+        board = [['.'] * 8 for _ in range(8)]
+        for _ in range(rng.randint(0, 10)):
+            board[rng.randrange(8)][rng.randrange(8)] = rng.choice('RBP')
+        king_pos = (rng.randrange(8), rng.randrange(8))
+        board[king_pos[0]][king_pos[1]] = '.'
+        inventory = {'Q': 0, 'R': rng.randint(0, 1), 'B': rng.randint(0, 1), 'P': rng.randint(0, 2)}
+        jobs.append((king_pos, board, inventory))
+    return jobs
+
+
+def test_matches_sequential_solving():
+    """Every job gets the answer find_remaining_solution gives"""
+    jobs = make_jobs(60)
+    for search_type in ('astar', 'none'):
+        results = dict(solve_many(jobs, search_type, max_workers=2, chunksize=7))
+        assert sorted(results) == list(range(len(jobs)))
+        for index, (king_pos, board, inventory) in enumerate(jobs):
+            expected = find_remaining_solution(board, inventory, king_pos, search_type)
+            # find_remaining_solution reports an empty path (already in check) as None
+            assert (results[index] or None) == expected
+    print("✓ Test passed: matches sequential solving")
+
+
+def test_empty_board_jobs():
+    """A job without a board is solved like find_complete_solution"""
+    jobs = [((ky, kx), None, {'P': 2}) for ky in range(8) for kx in range(8)]
+    results = dict(solve_many(jobs, max_workers=1))
+    for index, (king_pos, _, inventory) in enumerate(jobs):
+        assert results[index] == find_complete_solution(king_pos, inventory)
+    print("✓ Test passed: empty board jobs")
+
+
+def test_streams_and_stops_early():
+    """Results arrive one by one, and stopping early does not hang"""
+    results = solve_many(make_jobs(40), max_workers=2, chunksize=1)
+    first = next(results)
+    assert isinstance(first[0], int)
+    results.close()
+    assert list(solve_many([], max_workers=2)) == []
+    print("✓ Test passed: streams and stops early")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #18: Parallel Batch Solving ===\n")
+    test_matches_sequential_solving()
+    test_empty_board_jobs()
+    test_streams_and_stops_early()
+    print("\n=== All Issue #18 tests passed! ===\n")
@@ -0,0 +1,197 @@
+"""
+Test suite for Issue #19: Node and time budgets
+Tests max_nodes, deadlines and cancellation tokens for the solvers
+"""
+
+import sys
+import threading
+import time
+sys.path.append('Back')
+import solver
+from search_budget import (BUDGET_EXHAUSTED, SOLVED, UNSOLVABLE, BudgetExhausted,
+                           CancellationToken, SearchBudget)
+from test_helpers import make_state
+
+
+# King on (7, 3): Pawns can never check it, so every search is exhaustive
+UNSOLVABLE_CASE = ((7, 3), [], {'Q': 0, 'R': 0, 'B': 0, 'P': 3})
+SOLVABLE_CASE = ((1, 5), [('P', 2, 3), ('P', 4, 1)], {'Q': 0, 'R': 1, 'B': 1, 'P': 1})
+
+
+def test_unlimited_budget_changes_nothing():
+    """A budget that never runs out gives the unbudgeted results"""
+    king_pos, pieces, remaining = SOLVABLE_CASE
+    for backend in ('list', 'bitboard'):
+        for candidates in ('relevant', 'all'):
+            expected = solver.astar_search(make_state(pieces, remaining), king_pos, backend, None, candidates)
+            budget = SearchBudget(max_nodes=10 ** 9)
+            assert solver.astar_search(make_state(pieces, remaining), king_pos, backend, None,
+                                       candidates, budget) == expected
+            expected = solver.dfs_search(make_state(pieces, remaining), king_pos, True, None, backend,
+                                         None, candidates)
+            assert solver.dfs_search(make_state(pieces, remaining), king_pos, True, None, backend,
+                                     None, candidates, SearchBudget(max_nodes=10 ** 9)) == expected
+    expected = solver.idastar_search(make_state(pieces, remaining), king_pos)
+    assert solver.idastar_search(make_state(pieces, remaining), king_pos,
+                                 budget=SearchBudget(deadline=time.monotonic() + 60)) == expected
+    print("✓ Test passed: unlimited budget changes nothing")
+
+
+def test_max_nodes_stops_every_search():
+    """Each search expands exactly max_nodes nodes before giving up"""
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    searches = [
+        lambda state, budget: solver.astar_search(state, king_pos, candidates='all', budget=budget),
+        lambda state, budget: solver.astar_search(state, king_pos, 'bitboard', candidates='all', budget=budget),
+        lambda state, budget: solver.dfs_search(state, king_pos, True, candidates='all', budget=budget),
+        lambda state, budget: solver.dfs_search(state, king_pos, True, backend='bitboard',
+                                                candidates='all', budget=budget),
+        lambda state, budget: solver.iddfs_search(state, king_pos, candidates='all', budget=budget),
+    ]
+    for search in searches:
+        budget = SearchBudget(max_nodes=50)
+        try:
+            search(make_state(pieces, remaining), budget)
+            assert False, "search should have run out of nodes"
+        except BudgetExhausted:
+            pass
+        assert budget.nodes == 50
+    print("✓ Test passed: max_nodes stops every search")
+
+
+def test_best_partial_path_is_legal():
+    """The partial path places available pieces on distinct empty squares"""
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    for backend in ('list', 'bitboard'):
+        budget = SearchBudget(max_nodes=200)
+        try:
+            solver.dfs_search(make_state(pieces, remaining), king_pos, True, backend=backend,
+                              candidates='all', budget=budget)
+        except BudgetExhausted:
+            pass
+        assert budget.best_path
+        squares = [(row, col) for _, row, col in budget.best_path]
+        assert len(set(squares)) == len(squares)
+        assert len(budget.best_path) <= sum(remaining.values())
+        assert all(piece == 'P' for piece, _, _ in budget.best_path)
+    print("✓ Test passed: best partial path is legal")
+
+
+def test_entry_points_return_search_results():
+    """With a budget argument the entry points report status, path and nodes"""
+    king_pos, pieces, remaining = SOLVABLE_CASE
+    board = make_state(pieces, remaining).board
+    for search_type in ('astar', 'none', 'idastar'):
+        result = solver.can_still_win(board, remaining, king_pos, search_type, max_nodes=1000)
+        assert result.status == SOLVED
+        assert result.path == solver.find_remaining_solution(board, remaining, king_pos, search_type)
+        assert result.nodes_expanded >= 1
+
+        result = solver.find_remaining_solution(board, remaining, king_pos, search_type, max_nodes=0)
+        assert result.status == BUDGET_EXHAUSTED
+        assert result.path == [] and result.nodes_expanded == 0
+
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    board = make_state(pieces, remaining).board
+    for search_type in ('astar', 'none', 'iddfs'):
+        result = solver.can_still_win(board, remaining, king_pos, search_type, max_nodes=1000)
+        assert result.status == UNSOLVABLE and result.path is None
+    print("✓ Test passed: entry points return search results")
+
+
+def test_already_in_check_is_solved():
+    """A board that already gives check is solved with an empty path in every mode"""
+    remaining = {'Q': 0, 'R': 0, 'B': 0, 'P': 1}
+    board = make_state([('R', 0, 3)], remaining).board
+    for search_type in ('astar', 'none', 'iddfs'):
+        result = solver.can_still_win(board, remaining, (5, 3), search_type, max_nodes=0)
+        assert result.status == SOLVED and result.path == []
+    print("✓ Test passed: already in check is solved")
+
+
+def test_tablebase_answers_within_any_budget():
+    """Empty-board positions covered by the tablebase need no nodes"""
+    result = solver.find_complete_solution((3, 4), {'Q': 1, 'R': 0, 'B': 0, 'P': 0}, max_nodes=0)
+    assert result.status == SOLVED and result.nodes_expanded == 0
+    assert result.path == solver.find_complete_solution((3, 4), {'Q': 1, 'R': 0, 'B': 0, 'P': 0})
+    print("✓ Test passed: tablebase answers within any budget")
+
+
+def test_deadline_and_cancellation():
+    """A passed deadline or a cancelled token stops a search before its first node"""
+    king_pos, pieces, remaining = SOLVABLE_CASE
+    board = make_state(pieces, remaining).board
+    result = solver.can_still_win(board, remaining, king_pos, deadline=time.monotonic() - 1)
+    assert result.status == BUDGET_EXHAUSTED and result.nodes_expanded == 0
+    token = CancellationToken()
+    token.cancel()
+    result = solver.can_still_win(board, remaining, king_pos, 'none', cancel=token)
+    assert result.status == BUDGET_EXHAUSTED and result.nodes_expanded == 0
+    print("✓ Test passed: deadline and cancellation")
+
+
+def test_cancel_from_another_thread():
+    """Cancelling a token stops a long search running on another thread"""
+    king_pos, pieces, remaining = (7, 3), [], {'Q': 0, 'R': 0, 'B': 0, 'P': 6}
+    token = CancellationToken()
+    budget = SearchBudget(cancel=token)
+    outcome = []
+
+    def run():
+        try:
+            solver.dfs_search(make_state(pieces, remaining), king_pos, candidates='all', budget=budget)
+            outcome.append('finished')
+        except BudgetExhausted:
+            outcome.append('stopped')
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    time.sleep(0.05)
+    token.cancel()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert outcome == ['stopped'] and budget.nodes > 0
+    print("✓ Test passed: cancel from another thread")
+
+
+def test_stopped_search_records_no_dead_states():
+    """Only finished searches add states to the transposition table"""
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    table = solver.TranspositionTable()
+    for search in (solver.astar_search, solver.dfs_search, solver.iddfs_search):
+        try:
+            search(make_state(pieces, remaining), king_pos, table=table, candidates='all',
+                   budget=SearchBudget(max_nodes=10))
+        except BudgetExhausted:
+            pass
+    assert len(table) == 0
+    solver.dfs_search(make_state(pieces, remaining), king_pos, table=table, candidates='all',
+                      budget=SearchBudget(max_nodes=10 ** 9))
+    assert len(table) > 0
+    print("✓ Test passed: stopped search records no dead states")
+
+
+def test_solve_many_with_budget():
+    """solve_many yields a SearchResult per job when given a budget"""
+    king_pos, pieces, remaining = SOLVABLE_CASE
+    jobs = [(king_pos, make_state(pieces, remaining).board, remaining),
+            (UNSOLVABLE_CASE[0], None, UNSOLVABLE_CASE[2])]
+    results = dict(solver.solve_many(jobs, max_workers=1, max_nodes=100))
+    assert results[0].status == SOLVED
+    assert results[1].status == UNSOLVABLE
+    print("✓ Test passed: solve_many with budget")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #19: Node and Time Budgets ===\n")
+    test_unlimited_budget_changes_nothing()
+    test_max_nodes_stops_every_search()
+    test_best_partial_path_is_legal()
+    test_entry_points_return_search_results()
+    test_already_in_check_is_solved()
+    test_tablebase_answers_within_any_budget()
+    test_deadline_and_cancellation()
+    test_cancel_from_another_thread()
+    test_stopped_search_records_no_dead_states()
+    test_solve_many_with_budget()
+    print("\n=== All Issue #19 tests passed! ===\n")
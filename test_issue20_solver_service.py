@@ -0,0 +1,120 @@
+"""
+Test suite for Issue #20: Background solver service
+Tests SolverService jobs, polling and cancellation without pygame
+"""
+
+import sys
+import threading
+import time
+sys.path.append('Back')
+import solver
+from gamestate import GameState
+from search_budget import SOLVED, BudgetExhausted, SearchBudget
+from solver_service import SolverService
+
+
+def wait_for(service, timeout=5):
+    """Poll like the frame loop until the current job finishes."""
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        job = service.poll()
+        if job is not None:
+            return job
+        time.sleep(0.001)
+    raise AssertionError("job did not finish")
+
+
+def long_search(started, cancel):
+    """A DFS that runs for minutes unless cancelled; King (7, 3) can never be checked by Pawns."""
+    started.set()
+    state = GameState(8)
+    state.remaining_pieces = {'Q': 0, 'R': 0, 'B': 0, 'P': 6}
+    try:
+        return solver.dfs_search(state, (7, 3), candidates='all', budget=SearchBudget(cancel=cancel))
+    except BudgetExhausted:
+        return 'stopped'
+
+
+def test_job_result_matches_direct_call():
+    """A finished job carries the result of the same call made directly"""
+    service = SolverService()
+    board = [['.'] * 8 for _ in range(8)]
+    board[2][3] = 'P'
+    remaining = {'Q': 0, 'R': 1, 'B': 1, 'P': 1}
+    service.submit('can_still_win', solver.can_still_win, board, remaining, (1, 5), 'astar')
+    assert service.busy
+    job = wait_for(service)
+    assert job.kind == 'can_still_win' and not service.busy
+    result = job.result()
+    assert result.status == SOLVED
+    assert result.path == solver.can_still_win(board, remaining, (1, 5), 'astar')
+    service.shutdown()
+    print("✓ Test passed: job result matches direct call")
+
+
+def test_poll_does_not_wait():
+    """poll() returns at once while the job is still running"""
+    service = SolverService()
+    release = threading.Event()
+    service.submit('slow', lambda cancel: release.wait(5))
+    # The job is blocked on release, so a poll() that waited would never return None
+    assert service.poll() is None
+    release.set()
+    assert wait_for(service).result() is True
+    service.shutdown()
+    print("✓ Test passed: poll does not wait")
+
+
+def test_cancel_stops_running_search():
+    """cancel() stops a running search and its result is never polled"""
+    service = SolverService()
+    started = threading.Event()
+    job = service.submit('hint', long_search, started)
+    # Cancel once the search runs: a job cancelled before it starts never runs at all
+    assert started.wait(5)
+    service.cancel()
+    assert not service.busy and service.poll() is None
+    assert job.cancelled
+    assert job.future.result(timeout=5) == 'stopped'
+    service.shutdown()
+    print("✓ Test passed: cancel stops running search")
+
+
+def test_submit_replaces_job_in_flight():
+    """A new job cancels the previous one; only the latest is answered"""
+    service = SolverService()
+    started = threading.Event()
+    first = service.submit('hint', long_search, started)
+    assert started.wait(5)
+    second = service.submit('quick', lambda cancel: 42)
+    assert first.cancelled and not second.cancelled
+    job = wait_for(service)
+    assert job is second and job.result() == 42
+    assert first.future.result(timeout=5) == 'stopped'
+    service.shutdown()
+    print("✓ Test passed: submit replaces job in flight")
+
+
+def test_frames_keep_ticking():
+    """A frame loop polling every frame gets None back while a search runs"""
+    service = SolverService()
+    started = threading.Event()
+    job = service.submit('hint', long_search, started)
+    assert started.wait(5)
+    for _ in range(30):
+        assert service.poll() is None and service.busy
+        time.sleep(1 / 60)
+    assert not job.done()
+    service.shutdown()
+    assert job.future.result(timeout=5) == 'stopped'
+    print("✓ Test passed: frames keep ticking")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #20: Background Solver Service ===\n")
+    test_job_result_matches_direct_call()
+    test_poll_does_not_wait()
+    test_cancel_stops_running_search()
+    test_submit_replaces_job_in_flight()
+    test_frames_keep_ticking()
+    print("\n=== All Issue #20 tests passed! ===\n")
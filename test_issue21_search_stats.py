@@ -0,0 +1,141 @@
+"""
+Test suite for Issue #21: Solver instrumentation
+Tests SearchStats counters, timings and memory tracing for every solver
+"""
+
+import sys
+sys.path.append('Back')
+import solver
+from search_budget import SearchBudget
+from search_stats import SearchStats
+from test_helpers import make_state
+
+
+# King on (7, 3): Pawns can never check it, so every search is exhaustive
+UNSOLVABLE_CASE = ((7, 3), [], {'Q': 0, 'R': 0, 'B': 0, 'P': 2})
+SOLVABLE_CASE = ((1, 5), [('P', 2, 3), ('P', 4, 1)], {'Q': 0, 'R': 1, 'B': 1, 'P': 1})
+
+
+def test_stats_do_not_change_results():
+    """Every search returns the same answer with stats on"""
+    for king_pos, pieces, remaining in (SOLVABLE_CASE, UNSOLVABLE_CASE):
+        for candidates in ('relevant', 'all'):
+            for backend in ('list', 'bitboard'):
+                assert solver.astar_search(make_state(pieces, remaining), king_pos, backend, None, candidates,
+                                           stats=SearchStats()) == \
+                    solver.astar_search(make_state(pieces, remaining), king_pos, backend, None, candidates)
+                assert solver.dfs_search(make_state(pieces, remaining), king_pos, True, None, backend, None,
+                                         candidates, stats=SearchStats()) == \
+                    solver.dfs_search(make_state(pieces, remaining), king_pos, True, None, backend, None,
+                                      candidates)
+            for search in (solver.iddfs_search, solver.idastar_search):
+                assert search(make_state(pieces, remaining), king_pos, candidates=candidates,
+                              stats=SearchStats()) == \
+                    search(make_state(pieces, remaining), king_pos, candidates=candidates)
+    print("✓ Test passed: stats do not change results")
+
+
+def test_astar_counters_add_up():
+    """Every popped A* node is a visited hit, a table hit or a goal test"""
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    for backend in ('list', 'bitboard'):
+        stats = SearchStats()
+        solver.astar_search(make_state(pieces, remaining), king_pos, backend, candidates='all', stats=stats)
+        # The frontier runs empty: the root plus every generated node was popped
+        assert stats.nodes_generated + 1 == stats.visited_hits + stats.table_hits + stats.goal_tests
+        assert stats.nodes_expanded == stats.goal_tests  # no goal test succeeded
+        # 1 empty board + 63 one-Pawn boards + C(63, 2) two-Pawn boards (the King's square is ignored)
+        assert stats.nodes_expanded == 1 + 63 + 63 * 62 // 2
+        assert stats.visited_hits > 0
+        assert 0 < stats.peak_frontier <= stats.nodes_generated
+    print("✓ Test passed: A* counters add up")
+
+
+def test_dfs_counters_match_across_backends():
+    """Both DFS backends search the same tree, so their counters agree"""
+    king_pos, pieces, _ = UNSOLVABLE_CASE
+    remaining = {'Q': 0, 'R': 0, 'B': 0, 'P': 3}
+    results = []
+    for backend in ('list', 'bitboard'):
+        stats = SearchStats()
+        budget = SearchBudget(max_nodes=10 ** 9)
+        solver.dfs_search(make_state(pieces, remaining), king_pos, backend=backend, candidates='all',
+                          budget=budget, stats=stats)
+        assert stats.nodes_expanded == budget.nodes
+        assert stats.nodes_generated + 1 == stats.goal_tests
+        assert stats.peak_frontier == sum(remaining.values())
+        results.append((stats.nodes_expanded, stats.nodes_generated, stats.goal_tests, stats.peak_frontier))
+    assert results[0] == results[1]
+    print("✓ Test passed: DFS counters match across backends")
+
+
+def test_table_hits_counted():
+    """A search skipping states the transposition table knows counts table hits"""
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    table = solver.TranspositionTable()
+    solver.dfs_search(make_state(pieces, remaining), king_pos, table=table, candidates='all')
+    stats = SearchStats()
+    assert solver.astar_search(make_state(pieces, remaining), king_pos, table=table, candidates='all',
+                               stats=stats) is None
+    assert stats.table_hits == 1 and stats.nodes_expanded == 0
+    print("✓ Test passed: table hits counted")
+
+
+def test_timings_split_wall_time():
+    """Heuristic, goal test and expansion time fit inside the wall time"""
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    for search in (lambda stats: solver.astar_search(make_state(pieces, remaining), king_pos,
+                                                     candidates='all', stats=stats),
+                   lambda stats: solver.iddfs_search(make_state(pieces, remaining), king_pos,
+                                                     candidates='all', stats=stats),
+                   lambda stats: solver.dfs_search(make_state(pieces, remaining), king_pos,
+                                                   candidates='all', stats=stats)):
+        stats = SearchStats()
+        search(stats)
+        parts = stats.time_heuristic + stats.time_goal_test + stats.time_expansion
+        assert stats.wall_time > 0 and stats.time_goal_test > 0 and stats.time_expansion > 0
+        assert parts <= stats.wall_time
+    print("✓ Test passed: timings split wall time")
+
+
+def test_memory_tracing_is_opt_in():
+    """peak_memory is only measured with trace_memory"""
+    king_pos, pieces, remaining = UNSOLVABLE_CASE
+    plain, traced = SearchStats(), SearchStats(trace_memory=True)
+    solver.astar_search(make_state(pieces, remaining), king_pos, candidates='all', stats=plain)
+    solver.astar_search(make_state(pieces, remaining), king_pos, candidates='all', stats=traced)
+    assert plain.peak_memory == 0
+    assert traced.peak_memory > 100_000  # thousands of frontier entries
+    assert traced.nodes_expanded == plain.nodes_expanded
+    print("✓ Test passed: memory tracing is opt-in")
+
+
+def test_entry_points_fill_stats():
+    """Entry points pass stats through to their search, and stats accumulate"""
+    king_pos, pieces, remaining = SOLVABLE_CASE
+    board = make_state(pieces, remaining).board
+    stats = SearchStats()
+    solver.find_remaining_solution(board, remaining, king_pos, 'astar', stats=stats)
+    first = stats.goal_tests
+    assert first > 0 and stats.nodes_expanded > 0
+    solver.can_still_win(board, remaining, king_pos, 'none', max_nodes=100, stats=stats)
+    assert stats.goal_tests > first
+    assert set(stats.as_dict()) == set(SearchStats.COUNTERS + SearchStats.TIMERS)
+
+    # A tablebase hit runs no search
+    stats = SearchStats()
+    solver.find_complete_solution((3, 4), {'Q': 1, 'R': 0, 'B': 0, 'P': 0}, stats=stats)
+    assert stats.goal_tests == 0 and stats.wall_time == 0
+    print("✓ Test passed: entry points fill stats")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #21: Solver Instrumentation ===\n")
+    test_stats_do_not_change_results()
+    test_astar_counters_add_up()
+    test_dfs_counters_match_across_backends()
+    test_table_hits_counted()
+    test_timings_split_wall_time()
+    test_memory_tracing_is_opt_in()
+    test_entry_points_fill_stats()
+    print("\n=== All Issue #21 tests passed! ===\n")
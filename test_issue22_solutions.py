@@ -0,0 +1,117 @@
+"""
+Test suite for Issue #22: Solution enumeration
+Tests iter_solutions against a brute force over every placement order
+"""
+
+import itertools
+import sys
+import time
+sys.path.append('Back')
+from attack_state import AttackState
+from gamestate import GameState
+from solutions import iter_solutions
+from solver import astar_search, find_remaining_solution
+from test_helpers import make_board
+
+
+def playable(board, king_pos, placements):
+    """True if some order of placements gives check only with the last one."""
+    for order in itertools.permutations(placements):
+        attack = AttackState(king_pos, board)
+        for index, (piece, row, col) in enumerate(order):
+            if attack.in_check:
+                break
+            attack.add(piece, row, col)
+        else:
+            if attack.in_check:
+                return True
+    return False
+
+
+def brute_force(board, remaining, king_pos):
+    """Every playable placement set, as a set of frozensets."""
+    size = len(board)
+    empty = [(r, c) for r in range(size) for c in range(size)
+             if board[r][c] == '.' and (r, c) != king_pos]
+    pieces = [piece for piece, count in remaining.items() for _ in range(count)]
+    found = set()
+    for k in range(1, len(pieces) + 1):
+        for squares in itertools.combinations(empty, k):
+            for kinds in set(itertools.permutations(pieces, k)):
+                placements = [(piece, r, c) for piece, (r, c) in zip(kinds, squares)]
+                if playable(board, king_pos, placements):
+                    found.add(frozenset(placements))
+    return found
+
+
+def test_matches_brute_force():
+    """Every playable set is yielded exactly once, and nothing else"""
+    cases = [
+        (make_board([], 5), {'R': 1, 'B': 1, 'P': 1}, (2, 2)),
+        (make_board([('P', 2, 1), ('B', 0, 4)], 5), {'R': 1, 'P': 2}, (2, 3)),
+        (make_board([], 5), {'Q': 1, 'P': 2}, (4, 0)),
+    ]
+    for board, remaining, king_pos in cases:
+        solutions = list(iter_solutions(board, remaining, king_pos))
+        assert len(solutions) == len(set(solutions)), "duplicates"
+        assert {frozenset(solution) for solution in solutions} == brute_force(board, remaining, king_pos)
+    print("✓ Test passed: matches brute force")
+
+
+def test_ordered_and_canonical():
+    """Solutions come by placement count, each in row-major square order"""
+    board = make_board([('P', 2, 1)], 5)
+    solutions = list(iter_solutions(board, {'R': 1, 'B': 1, 'P': 1}, (2, 3)))
+    sizes = [len(solution) for solution in solutions]
+    assert sizes == sorted(sizes) and sizes[0] == 1 and sizes[-1] == 3
+    for solution in solutions:
+        squares = [row * 5 + col for _, row, col in solution]
+        assert squares == sorted(squares)
+    print("✓ Test passed: ordered and canonical")
+
+
+def test_minimal_and_limits():
+    """minimal stops after the fewest placements; limits cap the stream"""
+    state = GameState(8)
+    king_pos = (3, 4)
+    minimal = list(iter_solutions(state.board, state.remaining_pieces, king_pos, minimal=True))
+    assert minimal and all(len(solution) == 1 for solution in minimal)
+    # The solver's shortest solution is one of them
+    assert tuple(astar_search(state, king_pos)) in minimal
+    assert len(list(iter_solutions(state.board, state.remaining_pieces, king_pos, limit=10))) == 10
+    assert list(iter_solutions(state.board, state.remaining_pieces, king_pos, limit=0)) == []
+    two = list(iter_solutions(state.board, {'R': 1, 'P': 1}, king_pos, max_placements=1))
+    assert all(len(solution) == 1 for solution in two)
+    print("✓ Test passed: minimal and limits")
+
+
+def test_already_in_check_and_unsolvable():
+    """A board in check has only the empty solution; an unsolvable one has none"""
+    board = make_board([('R', 0, 2)], 5)
+    assert list(iter_solutions(board, {'P': 2}, (4, 2))) == [()]
+    assert list(iter_solutions(make_board([], 5), {'P': 3}, (4, 2))) == []
+    board = [['.'] * 8 for _ in range(8)]
+    assert list(iter_solutions(board, {'P': 2}, (7, 3))) == []
+    assert find_remaining_solution(board, {'P': 2}, (7, 3)) is None
+    print("✓ Test passed: already in check and unsolvable")
+
+
+def test_streams_lazily():
+    """The first solutions of a huge space arrive without enumerating it"""
+    state = GameState(8)
+    start = time.perf_counter()
+    stream = iter_solutions(state.board, state.remaining_pieces, (3, 4))
+    first = list(itertools.islice(stream, 5000))
+    assert time.perf_counter() - start < 5
+    assert len(first) == 5000 and len(first) == len(set(first))
+    print("✓ Test passed: streams lazily")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #22: Solution Enumeration ===\n")
+    test_matches_brute_force()
+    test_ordered_and_canonical()
+    test_minimal_and_limits()
+    test_already_in_check_and_unsolvable()
+    test_streams_lazily()
+    print("\n=== All Issue #22 tests passed! ===\n")
@@ -0,0 +1,90 @@
+"""
+Test suite for Issue #23: Solution counting
+Tests count_solutions against enumeration and brute force
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+sys.path.append('Back')
+from gamestate import GameState
+from solutions import count_solutions, iter_solutions, solution_counts
+from symmetry import mirror_board, mirror_square
+from test_helpers import random_board
+from test_issue22_solutions import brute_force
+
+
+def test_matches_brute_force():
+    """Counts equal the playable sets found by trying every placement order"""
+    rng = random.Random(20)
+    for _ in range(15):
+        board, king_pos = random_board(rng, rng.randint(0, 4), 4)
+        inventory = {piece: rng.randint(0, 2) for piece in 'QRBP'}
+        inventory = {piece: min(count, 1) for piece, count in inventory.items()}
+        expected = Counter(len(placements) for placements in brute_force(board, inventory, king_pos))
+        counts = solution_counts(board, inventory, king_pos)
+        if counts == {0: 1}:
+            continue  # already in check: brute force only tries non-empty sets
+        assert counts == dict(expected), (board, inventory, king_pos)
+    print("✓ Test passed: matches brute force")
+
+
+def test_matches_enumeration():
+    """Counts per placement count equal what iter_solutions yields"""
+    rng = random.Random(7)
+    for _ in range(40):
+        size = rng.choice((5, 6, 8))
+        board, king_pos = random_board(rng, rng.randint(0, size), size)
+        inventory = {piece: rng.randint(0, 2) for piece in 'QRBP'}
+        expected = Counter(len(solution) for solution in iter_solutions(board, inventory, king_pos,
+                                                                        max_placements=3))
+        counts = solution_counts(board, inventory, king_pos)
+        assert {k: v for k, v in counts.items() if k <= 3} == dict(expected), (board, inventory, king_pos)
+    print("✓ Test passed: matches enumeration")
+
+
+def test_limits():
+    """max_placements and minimal count the same solutions iter_solutions yields"""
+    state = GameState(8)
+    king_pos = (3, 4)
+    assert count_solutions(state.board, state.remaining_pieces, king_pos, minimal=True) == \
+        len(list(iter_solutions(state.board, state.remaining_pieces, king_pos, minimal=True)))
+    assert count_solutions(state.board, state.remaining_pieces, king_pos, max_placements=2) == \
+        len(list(iter_solutions(state.board, state.remaining_pieces, king_pos, max_placements=2)))
+    board = [['.'] * 8 for _ in range(8)]
+    board[0][4] = 'R'
+    assert count_solutions(board, {'P': 2}, king_pos) == 1  # already in check
+    assert count_solutions([['.'] * 8 for _ in range(8)], {'P': 3}, (7, 3)) == 0
+    print("✓ Test passed: limits")
+
+
+def test_mirror_invariant():
+    """A position and its mirror image have the same counts"""
+    rng = random.Random(3)
+    for _ in range(20):
+        board, king_pos = random_board(rng, rng.randint(0, 8), 8)
+        inventory = {piece: rng.randint(0, 2) for piece in 'QRBP'}
+        assert solution_counts(board, inventory, king_pos) == \
+            solution_counts(mirror_board(board), inventory, mirror_square(*king_pos))
+    print("✓ Test passed: mirror invariant")
+
+
+def test_full_inventory_is_fast():
+    """A full inventory (about 10**17 solutions) is counted in well under a second per position"""
+    state = GameState(8)
+    start = time.perf_counter()
+    total = count_solutions(state.board, state.remaining_pieces, (2, 6))
+    assert time.perf_counter() - start < 5
+    assert total > 10 ** 15
+    print("✓ Test passed: full inventory is fast")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #23: Solution Counting ===\n")
+    test_matches_brute_force()
+    test_matches_enumeration()
+    test_limits()
+    test_mirror_invariant()
+    test_full_inventory_is_fast()
+    print("\n=== All Issue #23 tests passed! ===\n")
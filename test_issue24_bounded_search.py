@@ -0,0 +1,143 @@
+"""
+Test suite for Issue #24: Beam search and weighted A*
+Tests the 'beam' and 'wastar' search types and their bounded frontiers
+"""
+
+import random
+import sys
+sys.path.append('Back')
+import solver
+from attack_state import AttackState
+from gamestate import GameState
+from search_budget import BUDGET_EXHAUSTED, SOLVED, UNSOLVABLE, BudgetExhausted, SearchBudget
+from search_stats import SearchStats
+from test_helpers import make_state, random_position
+
+
+def assert_plays_to_check(pieces, king_pos, path):
+    attack = AttackState(king_pos, make_state(pieces, {}).board)
+    for piece, row, col in path:
+        assert not attack.in_check
+        attack.add(piece, row, col)
+    assert attack.in_check
+
+
+def test_shortest_solutions():
+    """Both modes agree with IDDFS on solvability and solution length"""
+    rng = random.Random(21)
+    for _ in range(150):
+        king_pos, pieces = random_position(rng, rng.randint(0, 12))
+        remaining = {piece: rng.randint(0, 2) for piece in 'QRBP'}
+        for candidates in ('relevant', 'all'):
+            expected = solver.iddfs_search(make_state(pieces, remaining), king_pos, candidates=candidates)
+            for path in (solver.beam_search(make_state(pieces, remaining), king_pos, 2, candidates=candidates),
+                         solver.wastar_search(make_state(pieces, remaining), king_pos, 3,
+                                              candidates=candidates)):
+                assert (path is None) == (expected is None), (king_pos, pieces, remaining)
+                if path is not None:
+                    assert len(path) == len(expected)
+                    assert_plays_to_check(pieces, king_pos, path)
+    print("✓ Test passed: shortest solutions")
+
+
+def test_frontier_bounded():
+    """The beam never holds more than its width; A*'s frontier grows with the inventory"""
+    king_pos = (7, 3)  # Pawns can never check it
+    peaks = []
+    for pawns in (1, 2, 6):
+        stats = SearchStats()
+        assert solver.beam_search(make_state([], {'P': pawns}), king_pos, 8, candidates='all',
+                                  stats=stats) is None
+        assert stats.peak_frontier <= 8
+        assert stats.nodes_expanded <= 1 + 8 * pawns
+        peaks.append(stats.peak_frontier)
+
+        stats = SearchStats()
+        assert solver.wastar_search(make_state([], {'P': pawns}), king_pos, candidates='all',
+                                    stats=stats) is None
+        assert stats.peak_frontier == 0  # dropped at the root
+    astar = SearchStats()
+    solver.astar_search(make_state([], {'P': 2}), king_pos, candidates='all', stats=astar)
+    assert astar.peak_frontier > 8 * max(peaks)
+
+    # A solvable position with every piece: one expansion, then the solution
+    stats = SearchStats()
+    path = solver.wastar_search(GameState(8), (3, 4), candidates='all', stats=stats)
+    assert len(path) == 1 and stats.nodes_expanded == 1
+    assert stats.peak_frontier == 64 * 4  # solver boards leave the King's square empty
+    print("✓ Test passed: frontier bounded")
+
+
+def test_peak_memory_reported():
+    """trace_memory reports a peak that does not grow with the inventory"""
+    king_pos = (7, 3)
+    peaks = []
+    for pawns in (2, 6):
+        stats = SearchStats(trace_memory=True)
+        solver.beam_search(make_state([], {'P': pawns}), king_pos, 16, candidates='all', stats=stats)
+        peaks.append(stats.peak_memory)
+    assert 0 < peaks[1] < 2 * peaks[0]
+    print("✓ Test passed: peak memory reported")
+
+
+def test_entry_points():
+    """search_type 'beam' and 'wastar' reach the new searches from every entry point"""
+    king_pos = (1, 5)
+    pieces = [('P', 2, 3), ('P', 4, 1)]
+    remaining = {'Q': 0, 'R': 1, 'B': 1, 'P': 1}
+    board = make_state(pieces, remaining).board
+    for search_type in ('beam', 'wastar'):
+        solution = solver.find_remaining_solution(board, remaining, king_pos, search_type, beam_width=4,
+                                                  weight=1.5)
+        assert len(solution) == 1
+        assert solver.can_still_win(board, remaining, king_pos, search_type) is True
+        assert solver.can_still_win(board, {'P': 2}, (7, 3), search_type) is False
+        result = solver.find_remaining_solution(board, remaining, king_pos, search_type, max_nodes=100)
+        assert result.status == SOLVED and len(result.path) == 1
+        result = solver.can_still_win(board, {'P': 0}, (7, 3), search_type, max_nodes=100)
+        assert result.status == UNSOLVABLE and result.path is None
+        # Served from the tablebase like the other shortest-solution modes
+        stats = SearchStats()
+        assert len(solver.find_complete_solution((3, 4), {'Q': 1, 'R': 0, 'B': 0, 'P': 0},
+                                                 search_type=search_type, stats=stats)) == 1
+        assert stats.wall_time == 0
+    results = dict(solver.solve_many([((1, 5), board, remaining)], 'beam', max_workers=1, beam_width=2))
+    assert len(results[0]) == 1
+    print("✓ Test passed: entry points")
+
+
+def test_budget_and_arguments():
+    """Budgets stop both modes, and bad widths and weights are refused"""
+    king_pos = (7, 3)
+    budget = SearchBudget(max_nodes=10)
+    try:
+        solver.beam_search(make_state([], {'P': 6}), king_pos, 4, candidates='all', budget=budget)
+    except BudgetExhausted:
+        pass
+    else:
+        raise AssertionError("expected BudgetExhausted")
+    assert budget.nodes == 10 and len(budget.best_path) <= 3
+    # Stopped searches leave the transposition table alone
+    solver.TRANSPOSITION_TABLE.clear()
+    board = make_state([], {}).board
+    result = solver.can_still_win(board, {'Q': 1}, (3, 4), 'wastar', max_nodes=0)
+    assert result.status == BUDGET_EXHAUSTED and len(solver.TRANSPOSITION_TABLE) == 0
+    for call in (lambda: solver.beam_search(GameState(8), king_pos, 0),
+                 lambda: solver.wastar_search(GameState(8), king_pos, 0.5)):
+        try:
+            call()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError")
+    print("✓ Test passed: budget and arguments")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #24: Beam Search and Weighted A* ===\n")
+    test_shortest_solutions()
+    test_frontier_bounded()
+    test_peak_memory_reported()
+    test_entry_points()
+    test_budget_and_arguments()
+    print("\n=== All Issue #24 tests passed! ===\n")
@@ -0,0 +1,78 @@
+"""
+Test suite for Issue #25: Parent-pointer search nodes
+Tests PathNode and the A* searches that keep their paths in it
+"""
+
+import sys
+sys.path.append('Back')
+import solver
+from search_budget import BudgetExhausted, SearchBudget
+from solver import PathNode
+from test_helpers import make_state
+
+
+def test_path_rebuilt_from_parents():
+    """path() walks the parents back to the root"""
+    root = PathNode()
+    assert root.path() == [] and root.depth == 0
+    node = root
+    placements = [('P', 1, 2), ('R', 3, 4), ('B', 5, 6)]
+    for placement in placements:
+        node = PathNode(node, placement)
+    assert node.path() == placements and node.depth == 3
+    # Siblings share their parent's nodes
+    sibling = PathNode(node.parent, ('Q', 0, 0))
+    assert sibling.path() == placements[:2] + [('Q', 0, 0)]
+    assert node.path() == placements
+    print("✓ Test passed: path rebuilt from parents")
+
+
+def test_node_size_constant():
+    """A node costs the same at any depth, unlike a copied path"""
+    node = PathNode()
+    sizes = set()
+    for depth in range(64):
+        node = PathNode(node, ('P', depth // 8, depth % 8))
+        sizes.add(sys.getsizeof(node))
+    assert len(sizes) == 1
+    assert not hasattr(node, '__dict__')
+    print("✓ Test passed: node size constant")
+
+
+def test_searches_return_lists():
+    """A*, both backends, and weighted A* still return plain placement lists"""
+    king_pos = (1, 5)
+    pieces = [('P', 2, 3), ('P', 4, 1)]
+    remaining = {'Q': 0, 'R': 1, 'B': 1, 'P': 1}
+    for backend in ('list', 'bitboard'):
+        path = solver.astar_search(make_state(pieces, remaining), king_pos, backend)
+        assert isinstance(path, list) and len(path) == 1
+        assert solver.astar_search(make_state([('R', 1, 0)], remaining), king_pos, backend) == []
+    assert isinstance(solver.wastar_search(make_state(pieces, remaining), king_pos), list)
+    print("✓ Test passed: searches return lists")
+
+
+def test_budget_best_path_rebuilt():
+    """A stopped A* leaves a real path of placements in budget.best_path"""
+    for backend in ('list', 'bitboard'):
+        budget = SearchBudget(max_nodes=200)
+        try:
+            solver.astar_search(make_state([], {'P': 4}), (7, 3), backend, candidates='all', budget=budget)
+        except BudgetExhausted:
+            pass
+        else:
+            raise AssertionError("expected BudgetExhausted")
+        assert isinstance(budget.best_path, list)
+        assert all(piece == 'P' for piece, _, _ in budget.best_path)
+        squares = [(row, col) for _, row, col in budget.best_path]
+        assert len(squares) == len(set(squares))
+    print("✓ Test passed: budget best path rebuilt")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #25: Parent-Pointer Search Nodes ===\n")
+    test_path_rebuilt_from_parents()
+    test_node_size_constant()
+    test_searches_return_lists()
+    test_budget_best_path_rebuilt()
+    print("\n=== All Issue #25 tests passed! ===\n")
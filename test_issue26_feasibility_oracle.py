@@ -0,0 +1,78 @@
+"""
+Test suite for Issue #26: Feasibility oracle
+Tests win_feasible against the searches it replaces
+"""
+
+import random
+import sys
+sys.path.append('Back')
+import solver
+from solver import win_feasible
+from test_helpers import make_board
+
+
+def test_matches_search():
+    """The oracle answers exactly what a full search answers"""
+    rng = random.Random(23)
+    for _ in range(500):
+        size = rng.choice((5, 8))
+        king_pos = (rng.randrange(size), rng.randrange(size))
+        board = make_board([], size)
+        for _ in range(rng.randint(0, size * 3)):
+            row, col = rng.randrange(size), rng.randrange(size)
+            if (row, col) != king_pos:
+                board[row][col] = rng.choice('QRBP')
+        remaining = {piece: rng.randint(0, 1) for piece in 'QRBP'}
+        state = solver._create_game_state_from_board(board, remaining, king_pos)
+        expected = solver.iddfs_search(state, king_pos) is not None
+        assert win_feasible(board, remaining, king_pos) == expected, (board, remaining, king_pos)
+    print("✓ Test passed: matches search")
+
+
+def test_blockers():
+    """Only the nearest blocker of each ray matters"""
+    king_pos = (4, 4)
+    board = make_board([])
+    assert win_feasible(board, {'R': 1}, king_pos) is True
+    assert win_feasible(board, {'P': 1}, king_pos) is True  # (5, 3) is empty
+    assert win_feasible(board, {'P': 1}, (7, 3)) is False   # no square below the King
+    assert win_feasible(board, {'P': 0}, king_pos) is False
+
+    # Block every square next to the King: nothing can attack any more
+    for row in range(3, 6):
+        for col in range(3, 6):
+            if (row, col) != king_pos:
+                board[row][col] = 'B' if row == 4 or col == 4 else 'R'
+    assert win_feasible(board, {'Q': 1, 'R': 2, 'B': 2, 'P': 8}, king_pos) is False
+    # A Rook next to the King on a rank is already a check
+    board[4][3] = 'R'
+    assert win_feasible(board, {}, king_pos) is True
+    # A Pawn on a Pawn square checks; a Pawn elsewhere only blocks
+    board[4][3] = 'B'
+    board[5][3] = 'P'
+    assert win_feasible(board, {}, king_pos) is True
+    board[5][3] = 'R'
+    board[3][3] = 'P'
+    assert win_feasible(board, {'P': 8}, king_pos) is False
+    print("✓ Test passed: blockers")
+
+
+def test_agrees_with_can_still_win():
+    """Same answer as the searching entry point, for every search type"""
+    king_pos = (1, 5)
+    board = make_board([])
+    board[2][3] = 'P'
+    board[4][1] = 'P'
+    for remaining in ({'Q': 0, 'R': 1, 'B': 1, 'P': 1}, {'Q': 0, 'R': 0, 'B': 0, 'P': 0}):
+        for search_type in ('astar', 'iddfs', 'beam', 'none'):
+            assert win_feasible(board, remaining, king_pos) == \
+                bool(solver.can_still_win(board, remaining, king_pos, search_type))
+    print("✓ Test passed: agrees with can_still_win")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #26: Feasibility Oracle ===\n")
+    test_matches_search()
+    test_blockers()
+    test_agrees_with_can_still_win()
+    print("\n=== All Issue #26 tests passed! ===\n")
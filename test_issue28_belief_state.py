@@ -0,0 +1,165 @@
+"""
+Test suite for Issue #28: Belief state for the hidden King
+Tests attacks_from and KingBelief against brute-force check detection
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from belief import KingBelief
+from bitboard import (Bitboard, FULL_BOARD, attacks_from, board_to_bitboard, checking_masks,
+                      is_king_attacked, iter_squares, square_bit)
+from test_helpers import make_board
+
+
+def checked_kings(board):
+    bitboard = board_to_bitboard(board)
+    return {(y, x) for y in range(8) for x in range(8) if is_king_attacked(bitboard, (y, x))}
+
+
+def test_attacks_from_matches_checking_masks():
+    """A piece on s attacks k exactly when s is a checking square of k"""
+    rng = random.Random(28)
+    for _ in range(60):
+        board = make_board([])
+        for _ in range(rng.randint(0, 20)):
+            board[rng.randrange(8)][rng.randrange(8)] = rng.choice('QRBP')
+        bitboard = board_to_bitboard(board)
+        occupied = bitboard.occupied
+        for ky, kx in iter_squares(FULL_BOARD & ~occupied):
+            orthogonal, diagonal, pawn = checking_masks(bitboard, (ky, kx))
+            checkers = {'R': orthogonal, 'B': diagonal, 'Q': orthogonal | diagonal, 'P': pawn}
+            for piece, mask in checkers.items():
+                for y, x in iter_squares(FULL_BOARD & ~occupied):
+                    attacked = attacks_from(piece, y, x, occupied) & square_bit(ky, kx)
+                    assert bool(attacked) == bool(mask & square_bit(y, x)), (piece, y, x, ky, kx)
+    try:
+        attacks_from('N', 0, 0, 0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+    print("✓ Test passed: attacks_from matches checking_masks")
+
+
+def test_observe_matches_brute_force():
+    """After each placement that does not win, the candidates are exactly the possible Kings"""
+    rng = random.Random(5)
+    for _ in range(100):
+        king_pos = (rng.randrange(8), rng.randrange(8))
+        board = make_board([])
+        placed = set()
+        # Brute force: squares never placed on and never checked by any board so far
+        ruled_out = set()
+        belief = KingBelief()
+        for _ in range(12):
+            piece = rng.choice('QRBP')
+            row, col = rng.randrange(8), rng.randrange(8)
+            if (row, col) in placed:
+                continue
+            board[row][col] = piece
+            placed.add((row, col))
+            if (row, col) == king_pos or is_king_attacked(board_to_bitboard(board), king_pos):
+                break  # won: the game is over
+            belief.observe(piece, row, col)
+            # A later piece may block a line, but what an earlier board ruled out stays out
+            ruled_out |= placed | checked_kings(board)
+            assert set(belief.squares()) == {(y, x) for y in range(8) for x in range(8)} - ruled_out
+            assert king_pos in belief.squares()
+            assert len(belief) == len(belief.squares())
+    print("✓ Test passed: observe matches brute force")
+
+
+def test_from_board():
+    """Starting from a board gives the same belief as observing its pieces"""
+    board = make_board([])
+    belief = KingBelief()
+    for piece, row, col in [('R', 0, 0), ('B', 5, 2), ('P', 6, 6), ('Q', 2, 7)]:
+        board[row][col] = piece
+        belief.observe(piece, row, col)
+    started = KingBelief(board)
+    assert (started.candidates, started.occupied) == (belief.candidates, belief.occupied)
+    assert len(KingBelief()) == 64 and len(KingBelief(make_board([]))) == 64
+    try:
+        belief.catch_mask('P', 0, 0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+    print("✓ Test passed: from board")
+
+
+def test_recommend_is_best():
+    """The recommended placement catches the most candidates"""
+    rng = random.Random(11)
+    for _ in range(30):
+        board = make_board([])
+        belief = KingBelief()
+        for _ in range(rng.randint(0, 6)):
+            row, col = rng.randrange(8), rng.randrange(8)
+            if board[row][col] == '.':
+                board[row][col] = rng.choice('RBP')
+                belief.observe(board[row][col], row, col)
+        remaining = {piece: rng.randint(0, 1) for piece in 'QRBP'}
+        best = belief.recommend(remaining)
+        if not any(remaining.values()):
+            assert best is None
+            continue
+        (piece, row, col), caught = best
+        assert remaining[piece] > 0 and board[row][col] == '.'
+        candidates = set(belief.squares())
+        # Brute force: the candidates the new board checks, plus its own square
+        most = 0
+        for other in (p for p in remaining if remaining[p] > 0):
+            for y, x in iter_squares(FULL_BOARD & ~belief.occupied):
+                trial = [line[:] for line in board]
+                trial[y][x] = other
+                bitboard = board_to_bitboard(trial)
+                won = {k for k in candidates if k == (y, x) or is_king_attacked(bitboard, k)}
+                most = max(most, len(won))
+                if (other, y, x) == (piece, row, col):
+                    assert len(won) == caught
+        assert caught == most
+    print("✓ Test passed: recommend is best")
+
+
+def test_recommend_prefers_weaker_piece():
+    """On a tie the weaker piece is placed and the stronger one kept"""
+    belief = KingBelief()
+    # Only the corner is left: every piece placed on it catches it
+    belief.candidates = square_bit(0, 0)
+    (piece, row, col), caught = belief.recommend({'Q': 1, 'R': 1, 'P': 1})
+    assert piece == 'P' and caught == 1
+    assert belief.recommend({'Q': 0, 'P': 0}) is None
+    print("✓ Test passed: recommend prefers weaker piece")
+
+
+def test_recommended_play_catches_king():
+    """Following the recommendations with a full set finds every King"""
+    for ky in range(8):
+        for kx in range(8):
+            king_bit = square_bit(ky, kx)
+            remaining = {'Q': 1, 'R': 2, 'B': 2, 'P': 8}
+            belief = KingBelief()
+            bitboard = Bitboard()
+            while True:
+                best = belief.recommend(remaining)
+                assert best is not None, (ky, kx)
+                (piece, row, col), _ = best
+                bitboard = bitboard.place(piece, row, col)
+                remaining[piece] -= 1
+                if square_bit(row, col) == king_bit or is_king_attacked(bitboard, (ky, kx)):
+                    break
+                belief.observe(piece, row, col)
+    print("✓ Test passed: recommended play catches king")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #28: Belief State for the Hidden King ===\n")
+    test_attacks_from_matches_checking_masks()
+    test_observe_matches_brute_force()
+    test_from_board()
+    test_recommend_is_best()
+    test_recommend_prefers_weaker_piece()
+    test_recommended_play_catches_king()
+    print("\n=== All Issue #28 tests passed! ===\n")
@@ -0,0 +1,59 @@
+"""
+Test suite for Issue #4: Precomputed attack tables
+Verifies the table lookups against a direct geometric computation
+"""
+
+import sys
+sys.path.append('Back')
+from attack_tables import BETWEEN, squares_between, compute_between
+from checkmate import is_piece_attacking_king
+
+
+def test_table_matches_direct_computation():
+    """Every on-board triple in the table agrees with compute_between()"""
+    for piece in ('Q', 'R', 'B', 'P'):
+        for py in range(8):
+            for px in range(8):
+                for ky in range(8):
+                    for kx in range(8):
+                        expected = compute_between(piece, py, px, ky, kx)
+                        assert BETWEEN[piece][py][px][ky][kx] == expected
+    print("✓ Test passed: table matches direct computation")
+
+
+def test_between_squares_for_sliders():
+    """In-between squares are listed from the piece toward the King"""
+    assert squares_between('R', (2, 0), (7, 0)) == ((3, 0), (4, 0), (5, 0), (6, 0))
+    assert squares_between('B', (2, 2), (6, 6)) == ((3, 3), (4, 4), (5, 5))
+    assert squares_between('Q', (4, 0), (4, 2)) == ((4, 1),)
+    assert squares_between('R', (0, 1), (0, 0)) == ()
+    print("✓ Test passed: between squares for sliders")
+
+
+def test_unaligned_pieces_have_no_entry():
+    """Pieces that can never attack from a square map to None"""
+    assert squares_between('R', (2, 3), (5, 6)) is None
+    assert squares_between('B', (2, 3), (2, 6)) is None
+    assert squares_between('Q', (0, 0), (2, 1)) is None
+    assert squares_between('P', (5, 4), (5, 5)) is None
+    assert squares_between('P', (6, 3), (5, 4)) == ()
+    print("✓ Test passed: unaligned pieces have no entry")
+
+
+def test_off_table_positions_fall_back():
+    """Positions beyond the 8x8 table are computed on the fly"""
+    assert squares_between('R', (9, 0), (9, 3)) == ((9, 1), (9, 2))
+    board = [['.'] * 10 for _ in range(10)]
+    assert is_piece_attacking_king('B', (9, 9), (6, 6), board) == True
+    board[7][7] = 'P'
+    assert is_piece_attacking_king('B', (9, 9), (6, 6), board) == False
+    print("✓ Test passed: off-table positions fall back")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #4: Precomputed Attack Tables ===\n")
+    test_table_matches_direct_computation()
+    test_between_squares_for_sliders()
+    test_unaligned_pieces_have_no_entry()
+    test_off_table_positions_fall_back()
+    print("\n=== All Issue #4 tests passed! ===\n")
@@ -0,0 +1,100 @@
+"""
+Test suite for Issue #5: Bitboard backend
+Tests the list <-> bitboard converters, bitwise check detection and
+the bitboard variants of the solvers
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from bitboard import board_to_bitboard, bitboard_to_board, is_king_attacked, square_bit
+from checkmate import checkmate
+import solver
+from search_stats import SearchStats
+from test_helpers import make_state, random_board, random_position
+
+
+def test_round_trip():
+    """board -> bitboard -> board gives back the same board"""
+    rng = random.Random(1)
+    for _ in range(200):
+        board, _ = random_board(rng, rng.randint(0, 20), piece_types='QRBPPP')
+        assert bitboard_to_board(board_to_bitboard(board)) == board
+    print("✓ Test passed: round trip")
+
+
+def test_masks_per_piece():
+    """Each piece type lands in its own mask"""
+    board = [['.'] * 8 for _ in range(8)]
+    board[0][0] = 'Q'
+    board[2][5] = 'P'
+    board[7][7] = 'P'
+    bb = board_to_bitboard(board)
+    assert bb.masks['Q'] == square_bit(0, 0)
+    assert bb.masks['P'] == square_bit(2, 5) | square_bit(7, 7)
+    assert bb.masks['R'] == 0 and bb.masks['B'] == 0
+    assert bb.piece_at(2, 5) == 'P' and bb.piece_at(3, 3) == '.'
+    print("✓ Test passed: masks per piece")
+
+
+def test_blocked_and_unblocked_lines():
+    """Bitwise detection respects line-of-sight blocking"""
+    board = [['.'] * 8 for _ in range(8)]
+    board[2][0] = 'R'
+    assert is_king_attacked(board_to_bitboard(board), (7, 0)) == True
+    board[4][0] = 'P'
+    assert is_king_attacked(board_to_bitboard(board), (7, 0)) == False
+    board = [['.'] * 8 for _ in range(8)]
+    board[6][3] = 'P'
+    assert is_king_attacked(board_to_bitboard(board), (5, 4)) == True
+    assert is_king_attacked(board_to_bitboard(board), (7, 4)) == False
+    print("✓ Test passed: blocked and unblocked lines")
+
+
+def test_matches_bfs_checkmate():
+    """Bitwise detection agrees with checkmate() on random positions"""
+    rng = random.Random(2)
+    for _ in range(2000):
+        board, king_pos = random_board(rng, rng.randint(1, 14), piece_types='QRBPPP')
+        expected = checkmate(solver.board_to_string(board, king_pos))
+        assert is_king_attacked(board_to_bitboard(board), king_pos) == expected
+    print("✓ Test passed: matches BFS checkmate")
+
+
+def test_solvers_match_list_backend():
+    """astar_search and dfs_search return the same paths on both backends"""
+    rng = random.Random(3)
+    for _ in range(30):
+        king_pos, pieces = random_position(rng, rng.randint(0, 5), piece_types='QRBPPP')
+        state = make_state(pieces, {'Q': 0, 'R': 1, 'B': 1, 'P': 1})
+        assert solver.astar_search(state, king_pos) == solver.astar_search(state, king_pos, backend='bitboard')
+        assert (solver.dfs_search(state, king_pos, find_solution=True)
+                == solver.dfs_search(state, king_pos, find_solution=True, backend='bitboard'))
+    print("✓ Test passed: solvers match list backend")
+
+
+def test_bitboard_backend_uses_table():
+    """The bitboard backend records an unsolvable root in the table and skips it next time"""
+    # King on (7, 3): Pawns can never check it
+    unsolvable = make_state([], {'P': 2})
+    for search in (solver.astar_search, solver.dfs_search):
+        table = solver.TranspositionTable()
+        assert not search(unsolvable, (7, 3), backend='bitboard', table=table)
+        assert len(table) == 1 and solver.state_key(unsolvable, (7, 3)) in table
+        stats = SearchStats()
+        assert not search(unsolvable, (7, 3), backend='bitboard', table=table, stats=stats)
+        assert stats.table_hits == 1 and stats.nodes_expanded == 0
+        assert search(make_state([], {'R': 1}), (7, 3), backend='bitboard', table=table)
+        assert len(table) == 1
+    print("✓ Test passed: bitboard backend uses table")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #5: Bitboard Backend ===\n")
+    test_round_trip()
+    test_masks_per_piece()
+    test_blocked_and_unblocked_lines()
+    test_matches_bfs_checkmate()
+    test_solvers_match_list_backend()
+    test_bitboard_backend_uses_table()
+    print("\n=== All Issue #5 tests passed! ===\n")
@@ -0,0 +1,58 @@
+"""
+Test suite for Issue #6: Parse-free check API
+Tests checkmate_board() and checkmate_astar_board() against the string API
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from bitboard import board_to_bitboard
+from checkmate import checkmate, checkmate_astar, checkmate_board, checkmate_astar_board
+from solver import board_to_string
+from test_helpers import random_board
+
+
+def test_board_api_matches_string_api():
+    """List, tuple and bitboard inputs agree with the string wrappers"""
+    rng = random.Random(7)
+    for _ in range(1000):
+        board, king_pos = random_board(rng, rng.randint(1, 14), piece_types='QRBPPP')
+        board_str = board_to_string(board, king_pos)
+        expected_bfs = checkmate(board_str)
+        expected_astar = checkmate_astar(board_str)
+        as_tuple = tuple(''.join(row) for row in board)
+        for variant in (board, as_tuple, board_to_bitboard(board)):
+            assert checkmate_board(variant, king_pos) == expected_bfs
+            assert checkmate_astar_board(variant, king_pos) == expected_astar
+    print("✓ Test passed: board API matches string API")
+
+
+def test_king_square_is_ignored():
+    """Whatever sits on the King's square does not count as an attacker"""
+    board = [['.'] * 8 for _ in range(8)]
+    board[3][3] = 'Q'
+    assert checkmate_board(board, (3, 3)) == False
+    assert checkmate_astar_board(board, (3, 3)) == (False, 0)
+    board[3][6] = 'R'
+    assert checkmate_board(board, (3, 3)) == True
+    assert checkmate_astar_board(board, (3, 3))[0] == True
+    print("✓ Test passed: King square is ignored")
+
+
+def test_input_board_is_not_modified():
+    """The board passed in is read only"""
+    board = [['.'] * 8 for _ in range(8)]
+    board[0][4] = 'R'
+    snapshot = [row[:] for row in board]
+    checkmate_board(board, (0, 0))
+    checkmate_astar_board(board, (0, 0))
+    assert board == snapshot
+    print("✓ Test passed: input board is not modified")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #6: Parse-free Check API ===\n")
+    test_board_api_matches_string_api()
+    test_king_square_is_ignored()
+    test_input_board_is_not_modified()
+    print("\n=== All Issue #6 tests passed! ===\n")
@@ -0,0 +1,85 @@
+"""
+Test suite for Issue #7: Ray-cast check detection
+Tests checkmate_raycast() and the 'raycast' strategy of check_king_threat()
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from checkmate import checkmate, checkmate_raycast, checkmate_raycast_board, check_king_threat
+from solver import board_to_string
+from test_helpers import random_board
+
+
+def test_nearest_piece_blocks_ray():
+    """Only the first piece on a ray can attack"""
+    board = """
+K . . . . . . .
+P . . . . . . .
+R . . . . . . .
+. . . . . . . .
+. . . . . . . .
+. . . . . . . .
+. . . . . . . .
+. . . . . . . .
+"""
+    assert checkmate_raycast(board) == False
+    assert checkmate_raycast(board.replace("P . .", ". . .", 1)) == True
+    print("✓ Test passed: nearest piece blocks ray")
+
+
+def test_wrong_piece_type_on_ray():
+    """A Bishop on a file or a Rook on a diagonal does not give check"""
+    board = [['.'] * 8 for _ in range(8)]
+    board[0][4] = 'B'
+    board[7][7] = 'R'
+    assert checkmate_raycast_board(board, (4, 4)) == False
+    board[0][0] = 'Q'
+    assert checkmate_raycast_board(board, (4, 4)) == True
+    print("✓ Test passed: wrong piece type on ray")
+
+
+def test_pawn_squares():
+    """Pawns attack only from the two squares diagonally below the King"""
+    board = [['.'] * 8 for _ in range(8)]
+    board[6][3] = 'P'
+    assert checkmate_raycast_board(board, (5, 4)) == True
+    assert checkmate_raycast_board(board, (7, 4)) == False
+    assert checkmate_raycast_board(board, (6, 4)) == False
+    print("✓ Test passed: pawn squares")
+
+
+def test_matches_bfs_on_random_positions():
+    """Ray-cast agrees with the BFS detector"""
+    rng = random.Random(11)
+    for _ in range(2000):
+        board, king_pos = random_board(rng, rng.randint(0, 16), piece_types='QRBPPP')
+        board_str = board_to_string(board, king_pos)
+        assert checkmate_raycast(board_str) == checkmate(board_str)
+        assert checkmate_raycast_board(board, king_pos) == checkmate(board_str)
+    print("✓ Test passed: matches BFS on random positions")
+
+
+def test_check_king_threat_strategies():
+    """check_king_threat() exposes ray-cast as a third strategy"""
+    board_str = "K..R....\n........\n........\n........\n........\n........\n........\n........"
+    assert check_king_threat(board_str, strategy='raycast') == (True, 0)
+    assert check_king_threat(board_str, strategy='bfs') == (True, 0)
+    assert check_king_threat(board_str, strategy='astar')[0] == True
+    assert check_king_threat(board_str, use_astar=True) == check_king_threat(board_str, strategy='astar')
+    try:
+        check_king_threat(board_str, strategy='knight')
+        assert False, "Unknown strategy should raise"
+    except ValueError:
+        pass
+    print("✓ Test passed: check_king_threat strategies")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #7: Ray-cast Check Detection ===\n")
+    test_nearest_piece_blocks_ray()
+    test_wrong_piece_type_on_ray()
+    test_pawn_squares()
+    test_matches_bfs_on_random_positions()
+    test_check_king_threat_strategies()
+    print("\n=== All Issue #7 tests passed! ===\n")
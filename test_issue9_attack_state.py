@@ -0,0 +1,82 @@
+"""
+Test suite for Issue #9: Incremental attack map
+Tests AttackState add/remove updates against full check detection
+"""
+
+import random
+import sys
+sys.path.append('Back')
+from attack_state import AttackState
+from checkmate import checkmate_raycast_board
+
+
+def test_add_and_remove_track_check():
+    """Adding an attacker gives check, a blocker removes it, removal restores it"""
+    attack = AttackState((7, 0))
+    assert attack.in_check == False
+    attack.add('R', 2, 0)
+    assert attack.in_check == True
+    attack.add('P', 4, 0)
+    assert attack.in_check == False
+    attack.remove(4, 0)
+    assert attack.in_check == True
+    attack.remove(2, 0)
+    assert attack.in_check == False
+    print("✓ Test passed: add and remove track check")
+
+
+def test_pawn_squares_and_king_square():
+    """Pawns count only on their attack squares; the King's square is ignored"""
+    attack = AttackState((5, 4))
+    attack.add('P', 4, 3)
+    assert attack.in_check == False
+    attack.add('P', 6, 3)
+    assert attack.in_check == True
+    attack.remove(6, 3)
+    attack.add('Q', 5, 4)
+    assert attack.in_check == False
+    print("✓ Test passed: pawn squares and King square")
+
+
+def test_random_sequences_match_full_detection():
+    """Random add/remove sequences agree with checkmate_raycast_board()"""
+    rng = random.Random(5)
+    for _ in range(300):
+        king_pos = (rng.randrange(8), rng.randrange(8))
+        board = [['.'] * 8 for _ in range(8)]
+        attack = AttackState(king_pos)
+        occupied = []
+        for _ in range(40):
+            if occupied and rng.random() < 0.4:
+                y, x = occupied.pop(rng.randrange(len(occupied)))
+                board[y][x] = '.'
+                attack.remove(y, x)
+            else:
+                y, x = rng.randrange(8), rng.randrange(8)
+                if board[y][x] != '.' or (y, x) == king_pos:
+                    continue
+                board[y][x] = rng.choice('QRBP')
+                occupied.append((y, x))
+                attack.add(board[y][x], y, x)
+            assert attack.in_check == checkmate_raycast_board(board, king_pos)
+            assert AttackState(king_pos, board).in_check == attack.in_check
+    print("✓ Test passed: random sequences match full detection")
+
+
+def test_copy_is_independent():
+    """Changes to a copy do not leak into the original"""
+    attack = AttackState((0, 0))
+    clone = attack.copy()
+    clone.add('R', 0, 5)
+    assert clone.in_check == True
+    assert attack.in_check == False
+    print("✓ Test passed: copy is independent")
+
+
+if __name__ == "__main__":
+    print("\n=== Testing Issue #9: Incremental Attack Map ===\n")
+    test_add_and_remove_track_check()
+    test_pawn_squares_and_king_square()
+    test_random_sequences_match_full_detection()
+    test_copy_is_independent()
+    print("\n=== All Issue #9 tests passed! ===\n")